@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import tasks, epics, labels, templates, links
+from app.api.v1 import tasks, epics, labels, templates, links, metadata
 
 api_router = APIRouter()
 
@@ -7,4 +7,6 @@ api_router.include_router(tasks.router)
 api_router.include_router(epics.router)
 api_router.include_router(labels.router)
 api_router.include_router(templates.router)
-api_router.include_router(links.router)
\ No newline at end of file
+api_router.include_router(links.router)
+api_router.include_router(links.bulk_router)
+api_router.include_router(metadata.router)
\ No newline at end of file
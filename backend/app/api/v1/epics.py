@@ -1,9 +1,16 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import AsyncIterator, List, Optional
+from app.schemas.base import parse_sparse_fields
 from app.schemas.task import TaskSchema
-from app.schemas.epic import EpicSchema
-from app.services.jira import get_epic, get_epic_tasks
+from app.schemas.epic import EpicAnalysis, EpicSchema
+from app.schemas.link import ExternalLink
+from app.services.epic_analysis import analyze_epic
+from app.services.external_links import get_external_links_for
+from app.services.jira import get_epic, get_epic_tasks, get_epic_tasks_page, open_epic_task_stream
 from app.core.logging import get_logger
+from app.core.errors import UpstreamError
+from app.core.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/api/v1/epics", tags=["epics"])
 logger = get_logger()
@@ -12,12 +19,21 @@ logger = get_logger()
     "/{key}",
     response_model=EpicSchema,
     responses={
+        400: {"description": "Unknown field requested"},
         404: {"description": "Epic not found"},
         401: {"description": "JIRA authentication failed"},
         500: {"description": "JIRA API error"}
     }
 )
-async def read_epic(key: str) -> EpicSchema:
+async def read_epic(
+    key: str,
+    fields: Optional[str] = Query(None, description="Comma-separated attributes to return, e.g. name,tasks")
+) -> EpicSchema:
+    try:
+        sparse = parse_sparse_fields(fields, EpicSchema)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     try:
         logger.info(f"Fetching epic with key {key}")
         epic = await get_epic(key)
@@ -29,9 +45,13 @@ async def read_epic(key: str) -> EpicSchema:
                 detail=f"Epic {key} not found"
             )
         logger.info(f"Successfully retrieved epic {key}")
+        if sparse:
+            return JSONResponse(epic.model_dump(mode="json", include=sparse))
         return epic
     except HTTPException:
         raise
+    except UpstreamError:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch epic {key}: {str(e)}")
         raise HTTPException(
@@ -43,29 +63,146 @@ async def read_epic(key: str) -> EpicSchema:
     "/{key}/tasks",
     response_model=List[TaskSchema],
     responses={
+        400: {"description": "Invalid cursor or unknown field"},
         404: {"description": "Epic not found"},
         401: {"description": "JIRA authentication failed"},
         500: {"description": "JIRA API error"}
     }
 )
-async def read_epic_tasks(key: str) -> List[TaskSchema]:
+async def read_epic_tasks(
+    key: str,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor header"),
+    limit: int = Query(50, ge=1, le=1000, description="Page size"),
+    fields: Optional[str] = Query(None, description="Comma-separated task attributes to return")
+) -> List[TaskSchema]:
+    """Get one page of epic tasks; next page cursor is sent in X-Next-Cursor"""
     try:
-        logger.info(f"Fetching tasks for epic {key}")
-        tasks = await get_epic_tasks(key)
+        start_at = decode_cursor(cursor) if cursor else 0
+        sparse = parse_sparse_fields(fields, TaskSchema)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        logger.info(f"Fetching tasks for epic {key} from {start_at}")
+        page = await get_epic_tasks_page(key, start_at, limit)
         
-        if tasks is None:
+        if page is None:
             logger.warning(f"Epic {key} not found")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Epic {key} not found"
             )
+        tasks, next_start = page
+        if next_start is not None:
+            response.headers["X-Next-Cursor"] = encode_cursor(next_start)
         logger.info(f"Successfully retrieved tasks for epic {key}")
+        if sparse:
+            return JSONResponse(
+                [task.model_dump(mode="json", include=sparse) for task in tasks],
+                headers=dict(response.headers)
+            )
         return tasks
     except HTTPException:
         raise
+    except UpstreamError:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch tasks for epic {key}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch epic tasks from JIRA"
-        )
\ No newline at end of file
+        )
+
+@router.get(
+    "/{key}/analysis",
+    response_model=EpicAnalysis,
+    responses={
+        404: {"description": "Epic not found"},
+        500: {"description": "JIRA API error"}
+    }
+)
+async def read_epic_analysis(key: str) -> EpicAnalysis:
+    """Get blocking order, critical path and unresolved blockers of epic tasks"""
+    try:
+        logger.info(f"Analyzing epic {key}")
+        analysis = await analyze_epic(key)
+        if analysis is None:
+            logger.warning(f"Epic {key} not found")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Epic {key} not found"
+            )
+        return analysis
+    except HTTPException:
+        raise
+    except UpstreamError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to analyze epic {key}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to analyze epic"
+        )
+
+@router.get(
+    "/{key}/external-links",
+    response_model=List[ExternalLink],
+    responses={
+        404: {"description": "Epic not found"},
+        500: {"description": "JIRA API error"}
+    }
+)
+async def read_epic_external_links(key: str) -> List[ExternalLink]:
+    """Get external links of all epic tasks, in task order; `source` names the task"""
+    try:
+        logger.info(f"Fetching external links of epic {key} tasks")
+        tasks = await get_epic_tasks(key)
+        if tasks is None:
+            logger.warning(f"Epic {key} not found")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Epic {key} not found"
+            )
+        links = await get_external_links_for([task.key for task in tasks])
+        return [link for task_links in links.values() for link in task_links]
+    except HTTPException:
+        raise
+    except UpstreamError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to fetch external links of epic {key}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch external links from JIRA"
+        )
+
+@router.get(
+    "/{key}/tasks/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "One task per line"},
+        404: {"description": "Epic not found"}
+    }
+)
+async def stream_epic_tasks(key: str) -> StreamingResponse:
+    """Stream all epic tasks as NDJSON while pages are fetched"""
+    logger.info(f"Streaming tasks for epic {key}")
+    pages = await open_epic_task_stream(key)
+    if pages is None:
+        logger.warning(f"Epic {key} not found")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Epic {key} not found"
+        )
+
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for tasks in pages:
+                for task in tasks:
+                    yield task.model_dump_json() + "\n"
+        except Exception as e:
+            # Headers are already sent, the client sees a truncated stream
+            logger.error(f"Stream of epic {key} tasks aborted: {str(e)}")
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
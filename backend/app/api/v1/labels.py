@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, status, Request
 from typing import List
 from app.schemas.label import LabelSchema
 from app.services.labels import get_label, get_project_labels
+from app.core.errors import UpstreamError
 from app.core.logging import get_logger, log_request_response
 
 router = APIRouter(prefix="/api/v1/labels", tags=["labels"])
@@ -40,6 +41,8 @@ async def read_label(request: Request, key: str) -> LabelSchema:
         return label
     except HTTPException:
         raise
+    except UpstreamError:
+        raise
     except Exception as e:
         log_request_response(
             logger=logger,
@@ -67,6 +70,8 @@ async def list_labels(request: Request) -> List[LabelSchema]:
             response_data=[l.model_dump() for l in labels]
         )
         return labels
+    except UpstreamError:
+        raise
     except Exception as e:
         log_request_response(
             logger=logger,
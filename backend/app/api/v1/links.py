@@ -1,13 +1,22 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from app.core.config import get_settings
+from app.core.executor import run_blocking
+from app.schemas.base import ISSUE_KEY
+from app.services.bulk_links import create_links_bulk
 from app.services.links import LinksService
 from app.services.external_links import ExternalLinksService
+from app.services.link_graph import get_link_graph
 from app.schemas.link import (
     TaskLink,
     ExternalLink,
     CreateTaskLinkRequest,
-    CreateExternalLinkRequest
+    CreateExternalLinkRequest,
+    LinkGraph,
+    BulkTaskLinkRequest,
+    BulkCreateLinksResponse,
+    parse_link_types
 )
-from typing import List
+from typing import List, Optional
 
 # Create router with prefix and tags
 router = APIRouter(
@@ -15,6 +24,12 @@ router = APIRouter(
     tags=["links"]
 )
 
+# Links between arbitrary tasks, not under one task's path
+bulk_router = APIRouter(
+    prefix="/api/v1/links",
+    tags=["links"]
+)
+
 def get_links_service():
     return LinksService()
 
@@ -27,7 +42,36 @@ async def get_task_links(
     links_service: LinksService = Depends(get_links_service)
 ):
     """Get all links for a task"""
-    return links_service.get_task_links(task_key)
+    return await run_blocking(links_service.get_task_links, task_key)
+
+@router.get(
+    "/{task_key}/links/graph",
+    response_model=LinkGraph,
+    responses={
+        400: {"description": "Invalid task key, unknown link type or depth too large"},
+        404: {"description": "Task not found"}
+    }
+)
+async def get_task_link_graph(
+    task_key: str,
+    depth: int = Query(2, ge=1, description="Hops to follow from the task"),
+    types: Optional[str] = Query(None, description="Comma-separated link types to follow, e.g. is blocked by")
+):
+    """Get tasks linked to a task transitively, as nodes and edges"""
+    if not ISSUE_KEY.match(task_key):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid task key: {task_key}")
+    max_depth = get_settings()['link_graph_max_depth']
+    if depth > max_depth:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Depth must not exceed {max_depth}")
+    try:
+        link_types = parse_link_types(types)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    graph = await get_link_graph(task_key, depth, link_types)
+    if graph is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Task {task_key} not found")
+    return graph
 
 @router.post("/{task_key}/links", response_model=TaskLink)
 async def create_task_link(
@@ -36,7 +80,9 @@ async def create_task_link(
     links_service: LinksService = Depends(get_links_service)
 ):
     """Create new task link"""
-    created_link = links_service.create_task_link(
+    created_link = await run_blocking(
+        links_service.create_task_link,
+        upstream="jira-write",
         source=task_key,
         link_type=link.type,
         target=link.target
@@ -51,7 +97,7 @@ async def get_external_links(
     external_links_service: ExternalLinksService = Depends(get_external_links_service)
 ):
     """Get all external links for a task"""
-    return external_links_service.get_external_links(task_key)
+    return await run_blocking(external_links_service.get_external_links, task_key)
 
 @router.post("/{task_key}/external-links", response_model=ExternalLink)
 async def create_external_link(
@@ -60,7 +106,9 @@ async def create_external_link(
     external_links_service: ExternalLinksService = Depends(get_external_links_service)
 ):
     """Create new external link"""
-    created_link = external_links_service.create_external_link(
+    created_link = await run_blocking(
+        external_links_service.create_external_link,
+        upstream="jira-write",
         task_key=task_key,
         title=link.title,
         url=link.url,
@@ -68,4 +116,30 @@ async def create_external_link(
     )
     if not created_link:
         raise HTTPException(status_code=400, detail="Failed to create external link")
-    return created_link
\ No newline at end of file
+    return created_link
+
+@bulk_router.post("/bulk", response_model=BulkCreateLinksResponse)
+async def create_task_links(
+    requests: List[BulkTaskLinkRequest],
+    links_service: LinksService = Depends(get_links_service)
+) -> BulkCreateLinksResponse:
+    """
+    Create many task links, skipping existing ones
+
+    Returns:
+        BulkCreateLinksResponse: Per-item results in request order
+    """
+    limit = get_settings()['bulk_link_max_items']
+    if not requests or len(requests) > limit:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Expected 1 to {limit} links, got {len(requests)}"
+        )
+    results = await create_links_bulk(links_service, requests)
+    counts = {state: sum(result.status == state for result in results) for state in ("created", "exists", "failed")}
+    return BulkCreateLinksResponse(
+        created=counts["created"],
+        existing=counts["exists"],
+        failed=counts["failed"],
+        results=results
+    )
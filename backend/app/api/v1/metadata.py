@@ -0,0 +1,39 @@
+from typing import Any, Dict
+from fastapi import APIRouter, HTTPException, status
+from app.core.executor import run_blocking
+from app.services.metadata import get_metadata_registry
+from app.core.logging import get_logger
+
+router = APIRouter(prefix="/api/v1/metadata", tags=["metadata"])
+logger = get_logger()
+
+@router.get("/", response_model=Dict[str, Any])
+async def read_metadata() -> Dict[str, Any]:
+    """Get cached JIRA fields, priorities and link types"""
+    try:
+        metadata = await run_blocking(get_metadata_registry().get)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="JIRA metadata is not available"
+        )
+    return {
+        "fields": metadata.fields,
+        "priorities": metadata.priorities,
+        "link_types": metadata.link_types,
+        "issue_types": metadata.issue_types,
+        "loaded_at": metadata.loaded_at
+    }
+
+@router.post("/refresh", response_model=Dict[str, Any])
+async def refresh_metadata() -> Dict[str, Any]:
+    """Reload JIRA metadata now instead of waiting for the scheduled refresh"""
+    try:
+        await run_blocking(get_metadata_registry().refresh)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to refresh JIRA metadata"
+        )
+    logger.info("JIRA metadata refreshed on request")
+    return get_metadata_registry().stats()
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import Dict, Optional, List
-from app.schemas.task import TaskSchema
-from app.schemas.create_task import CreateTaskRequest
-from app.services.jira import get_task
-from app.services.tasks import TasksService
+import json
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Response, status, Depends
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import AsyncIterator, Optional, List
+from app.core.config import get_settings
+from app.schemas.base import parse_issue_keys, parse_sparse_fields
+from app.schemas.task import TaskBatchItem, TaskBatchRequest, TaskSchema
+from app.schemas.create_task import BulkCreateTasksResponse, BulkTaskResult, CreateTaskRequest, TaskReturn
+from app.core.executor import run_blocking
+from app.core.errors import UpstreamError
+from app.services.jira import get_task, get_tasks
+from app.services.tasks import TasksService, create_tasks_bulk
 from app.core.logging import get_logger
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
@@ -12,19 +18,67 @@ logger = get_logger()
 def get_tasks_service():
     return TasksService()
 
+async def _read_tasks(keys: List[str], fields: Optional[str]) -> JSONResponse:
+    """Resolve keys in one batch, answering in request order"""
+    try:
+        keys = parse_issue_keys(keys, get_settings()['batch_max_keys'])
+        sparse = parse_sparse_fields(fields, TaskSchema)
+    except ValueError as e:
+        logger.error(f"Invalid batch request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(f"Fetching {len(keys)} tasks in batch")
+    found = await get_tasks(keys, fields=sparse)
+    items = []
+    for key in keys:
+        task = found.get(key)
+        if isinstance(task, Exception):
+            items.append({"key": key, "status": "error", "task": None})
+        elif task is None:
+            items.append({"key": key, "status": "not_found", "task": None})
+        else:
+            items.append({"key": key, "status": "ok", "task": task.model_dump(mode="json", include=sparse)})
+    return JSONResponse(items)
+
+@router.get(
+    "/",
+    response_model=List[TaskBatchItem],
+    responses={400: {"description": "Invalid keys or unknown field requested"}}
+)
+async def read_tasks(
+    keys: str = Query(..., description="Comma-separated issue keys"),
+    fields: Optional[str] = Query(None, description="Comma-separated attributes to return, e.g. summary,updated")
+):
+    """Get many tasks at once; items follow the order of `keys`"""
+    return await _read_tasks([keys], fields)
+
+@router.post(
+    "/batch",
+    response_model=List[TaskBatchItem],
+    responses={400: {"description": "Invalid keys or unknown field requested"}}
+)
+async def read_tasks_batch(request: TaskBatchRequest):
+    """Get many tasks at once; items follow the order of `keys`"""
+    return await _read_tasks(request.keys, request.fields)
+
 @router.get(
     "/{key}",
     response_model=TaskSchema,
     responses={
+        400: {"description": "Unknown field requested"},
         404: {"description": "Task not found"},
         401: {"description": "JIRA authentication failed"},
         500: {"description": "JIRA API error"}
     }
 )
-async def read_task(key: str) -> TaskSchema:
+async def read_task(
+    key: str,
+    fields: Optional[str] = Query(None, description="Comma-separated attributes to return, e.g. summary,updated")
+) -> TaskSchema:
     try:
         logger.info(f"Fetching task with key {key}")
-        task = await get_task(key)
+        sparse = parse_sparse_fields(fields, TaskSchema)
+        task = await get_task(key, fields=sparse)
         
         if task is None:
             logger.warning(f"Task {key} not found")
@@ -33,6 +87,8 @@ async def read_task(key: str) -> TaskSchema:
                 detail=f"Task {key} not found"
             )
         logger.info(f"Successfully retrieved task {key}")
+        if sparse:
+            return JSONResponse(task.model_dump(mode="json", include=sparse))
         return task
     except HTTPException:
         raise
@@ -42,6 +98,8 @@ async def read_task(key: str) -> TaskSchema:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except UpstreamError:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch task {key}: {str(e)}")
         raise HTTPException(
@@ -52,22 +110,86 @@ async def read_task(key: str) -> TaskSchema:
 @router.post("/", response_model=dict)
 async def create_task(
     request: CreateTaskRequest,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    return_mode: TaskReturn = Query(TaskReturn.FULL, alias="return", description="minimal | full | async"),
     tasks_service: TasksService = Depends(get_tasks_service)
 ):
     """
     Create new JIRA task
     
     Returns:
-        dict: Created task data including key and id
+        dict: Created task data including key and id; the full issue only
+        with return=full. With return=async the response is 202 and the
+        task is read into the cache after the response is sent.
     """
-    result = tasks_service.create_task(request)
+    try:
+        result = await run_blocking(tasks_service.create_task, request, return_mode, upstream="jira-write")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     if not result:
         raise HTTPException(
             status_code=400,
             detail="Failed to create task"
         )
+    if return_mode == TaskReturn.ASYNC:
+        response.status_code = status.HTTP_202_ACCEPTED
+        background_tasks.add_task(run_blocking, tasks_service.hydrate_task, result["key"])
     return result
 
+def _check_bulk_size(requests: List[CreateTaskRequest]) -> None:
+    limit = get_settings()['bulk_create_max_items']
+    if not requests or len(requests) > limit:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Expected 1 to {limit} tasks, got {len(requests)}"
+        )
+
+@router.post("/bulk", response_model=BulkCreateTasksResponse)
+async def create_tasks(
+    requests: List[CreateTaskRequest],
+    tasks_service: TasksService = Depends(get_tasks_service)
+) -> BulkCreateTasksResponse:
+    """
+    Create many JIRA tasks with batched bulk requests
+    
+    Returns:
+        BulkCreateTasksResponse: Per-item results in request order
+    """
+    _check_bulk_size(requests)
+    logger.info(f"Bulk creating {len(requests)} tasks")
+    results: List[BulkTaskResult] = []
+    async for chunk in create_tasks_bulk(tasks_service, requests):
+        results.extend(chunk)
+    results.sort(key=lambda result: result.index)
+    created = sum(result.status == "created" for result in results)
+    return BulkCreateTasksResponse(created=created, failed=len(results) - created, results=results)
+
+@router.post(
+    "/bulk/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}, "description": "One progress line per chunk"}}
+)
+async def create_tasks_stream(
+    requests: List[CreateTaskRequest],
+    tasks_service: TasksService = Depends(get_tasks_service)
+) -> StreamingResponse:
+    """Create many JIRA tasks, streaming per-chunk results as NDJSON progress"""
+    _check_bulk_size(requests)
+    logger.info(f"Bulk creating {len(requests)} tasks (streamed)")
+
+    async def body() -> AsyncIterator[str]:
+        done = 0
+        async for chunk in create_tasks_bulk(tasks_service, requests):
+            done += len(chunk)
+            yield json.dumps({
+                "done": done,
+                "total": len(requests),
+                "results": [result.model_dump(mode="json") for result in chunk]
+            }) + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
 @router.get("/types/{project_key}", response_model=List[dict])
 async def get_task_types(
     project_key: str,
@@ -82,7 +204,7 @@ async def get_task_types(
     Returns:
         List[dict]: List of available issue types with id and name
     """
-    types = tasks_service.get_task_types(project_key)
+    types = await run_blocking(tasks_service.get_task_types, project_key)
     if not types:
         raise HTTPException(
             status_code=404,
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse
+from typing import List, Optional
 from pydantic import BaseModel, Field
-from app.schemas.checklist import ChecklistTemplate, ChecklistType
+from app.core.executor import run_blocking
+from app.core.pagination import decode_cursor, encode_cursor
+from app.schemas.checklist import ChecklistTemplate, ChecklistType, TemplateRevision, TemplateSummary, TemplateView
 from app.services.templates import get_template_service
 from app.core.logging import get_logger, log_request_response
 
@@ -14,6 +17,7 @@ class UpdateTemplateRequest(BaseModel):
     description: str = Field(..., description="Template description")
     content: str = Field(..., description="Template markdown content")
     version: str = Field(default="1.0", description="Template version")
+    tags: List[str] = Field(default_factory=list, description="Template tags")
 
 class CreateTemplateRequest(BaseModel):
     """Request body for template creation"""
@@ -22,18 +26,49 @@ class CreateTemplateRequest(BaseModel):
     description: str = Field(..., description="Template description")
     content: str = Field(..., description="Template markdown content")
     version: str = Field(default="1.0", description="Template version")
+    tags: List[str] = Field(default_factory=list, description="Template tags")
+
+@router.get(
+    "/{type}",
+    responses={
+        200: {"description": "Templates, or TemplateSummary items with view=summary"},
+        400: {"description": "Invalid cursor"},
+        404: {"description": "No templates of this type"},
+        500: {"description": "Internal server error"}
+    }
+)
+async def list_templates(
+    type: ChecklistType,
+    response: Response,
+    q: Optional[str] = Query(None, description="Words to search for; prefixes match, all words must match"),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor header"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size, all templates if omitted"),
+    view: TemplateView = Query(TemplateView.FULL, description="summary omits template content")
+) -> List[ChecklistTemplate]:
+    """Get templates of specified type by key; next page cursor is sent in X-Next-Cursor"""
+    try:
+        start = decode_cursor(cursor) if cursor else 0
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/{type}")
-async def list_templates(type: ChecklistType) -> List[ChecklistTemplate]:
-    """Get all templates of specified type"""
     try:
         service = get_template_service()
-        templates = service.get_templates(type)
-        if not templates:
+        # One extra template tells whether there is a next page
+        templates = service.get_templates(type, q, start, limit + 1 if limit else None)
+        if not templates and not q and not start:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No {type.value} templates found"  # Use type.value instead of type
             )
+        if limit and len(templates) > limit:
+            templates = templates[:limit]
+            response.headers["X-Next-Cursor"] = encode_cursor(start + limit)
+        if view == TemplateView.SUMMARY:
+            summaries = [TemplateSummary(**template.model_dump(exclude={"content"})) for template in templates]
+            return JSONResponse(
+                [summary.model_dump(mode="json") for summary in summaries],
+                headers=dict(response.headers)
+            )
         return templates
     except HTTPException:
         raise
@@ -72,6 +107,34 @@ async def get_template(type: ChecklistType, key: str) -> ChecklistTemplate:
             detail="Failed to get template"
         )
 
+@router.get(
+    "/{type}/{key}/history",
+    response_model=List[TemplateRevision],
+    responses={
+        404: {"description": "Template has no history"},
+        500: {"description": "Internal server error"}
+    }
+)
+async def get_template_history(type: ChecklistType, key: str) -> List[TemplateRevision]:
+    """Get revisions of a template written through the API, oldest first"""
+    try:
+        service = get_template_service()
+        revisions = service.get_history(type, key)
+        if not revisions:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No history for template {key}"
+            )
+        return revisions
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting template history: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get template history"
+        )
+
 @router.put(
     "/{type}/{key}",
     response_model=ChecklistTemplate,
@@ -88,13 +151,17 @@ async def update_template(
     """Update existing template"""
     try:
         service = get_template_service()
-        updated = service.update_template(
+        # Writes wait for the template's file lock, off the event loop
+        updated = await run_blocking(
+            service.update_template,
+            upstream="templates",
             type=type,
             key=key,
             name=template.name,
             description=template.description,
             content=template.content,
-            version=template.version
+            version=template.version,
+            tags=template.tags
         )
         if not updated:
             raise HTTPException(
@@ -123,7 +190,7 @@ async def delete_template(type: ChecklistType, key: str) -> bool:
     """Delete template"""
     try:
         service = get_template_service()
-        if not service.delete_template(type, key):
+        if not await run_blocking(service.delete_template, type, key, upstream="templates"):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Template {key} not found"
@@ -154,13 +221,16 @@ async def create_template(
     """Create new template"""
     try:
         service = get_template_service()
-        created = service.create_template(
+        created = await run_blocking(
+            service.create_template,
+            upstream="templates",
             type=type,
             key=template.key,
             name=template.name,
             description=template.description,
             content=template.content,
-            version=template.version
+            version=template.version,
+            tags=template.tags
         )
         if not created:
             raise HTTPException(
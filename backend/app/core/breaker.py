@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+from app.core.config import get_settings
+from app.core.errors import CircuitOpenError, UpstreamError, UpstreamThrottledError
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Default classifier: upstream errors except throttling, which the rate limiter handles"""
+    return isinstance(error, UpstreamError) and not isinstance(error, UpstreamThrottledError)
+
+class CallRecord:
+    """Outcome of a guarded call that returned: failed, or None to not count it"""
+
+    def __init__(self):
+        self.failed: Optional[bool] = False
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream that keeps failing or answering slowly
+
+    Outcomes of the last ``window`` calls are kept; once at least
+    ``min_calls`` of them are known and ``failure_rate`` of those failed or
+    took longer than ``slow_call`` seconds, the circuit opens and calls are
+    rejected at once with CircuitOpenError. After ``reset_timeout`` seconds a
+    single probe call is let through: success closes the circuit, failure
+    opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        slow_call: float = 5.0,
+        reset_timeout: float = 30.0,
+        is_failure: Callable[[BaseException], bool] = is_upstream_failure
+    ):
+        self.name = name
+        self.min_calls = min(min_calls, window)
+        self.failure_rate = failure_rate
+        self.slow_call = slow_call
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self.state = self.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {"calls": 0, "failures": 0, "slow": 0, "rejected": 0, "opened": 0}
+
+    def _open(self, now: float) -> None:
+        self.state = self.OPEN
+        self._opened_at = now
+        self._probing = False
+        self._stats["opened"] += 1
+        logger.warning(f"Circuit {self.name} opened, retrying in {self.reset_timeout:.0f}s")
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError if the call must not reach the upstream; True for a probe call"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - now
+                if remaining > 0:
+                    self._stats["rejected"] += 1
+                    raise CircuitOpenError(f"{self.name} is unavailable", upstream=self.name, retry_after=remaining)
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    self._stats["rejected"] += 1
+                    raise CircuitOpenError(f"{self.name} is being probed", upstream=self.name, retry_after=1.0)
+                self._probing = True
+            self._stats["calls"] += 1
+            return self.state == self.HALF_OPEN
+
+    def record(self, failed: Optional[bool], duration: float = 0.0, probe: bool = False) -> None:
+        """Record a call outcome; None releases the call without counting it"""
+        with self._lock:
+            if probe:
+                self._probing = False
+            # Calls started before the circuit opened do not count
+            if failed is None or self.state == self.OPEN or probe != (self.state == self.HALF_OPEN):
+                return
+            slow = not failed and duration >= self.slow_call
+            bad = failed or slow
+            self._stats["failures"] += failed
+            self._stats["slow"] += slow
+            now = time.monotonic()
+            if probe:
+                if bad:
+                    self._open(now)
+                else:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                    logger.info(f"Circuit {self.name} closed")
+                return
+            self._outcomes.append(bad)
+            if (
+                len(self._outcomes) >= self.min_calls
+                and sum(self._outcomes) >= self.failure_rate * len(self._outcomes)
+            ):
+                self._outcomes.clear()
+                self._open(now)
+
+    @contextmanager
+    def call(self) -> Iterator[CallRecord]:
+        """Guard one upstream call; exceptions raised inside are classified by ``is_failure``"""
+        probe = self.before_call()
+        record = CallRecord()
+        started = time.monotonic()
+        try:
+            yield record
+        except BaseException as e:
+            self.record(True if self.is_failure(e) else None, probe=probe)
+            raise
+        self.record(record.failed, time.monotonic() - started, probe=probe)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "state": self.state, "window": len(self._outcomes)}
+
+@lru_cache()
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get breaker shared by the async and sync JIRA clients"""
+    settings = get_settings()
+    return CircuitBreaker(
+        "jira",
+        window=settings['breaker_window'],
+        min_calls=settings['breaker_min_calls'],
+        failure_rate=settings['breaker_failure_rate'],
+        slow_call=settings['breaker_slow_call'],
+        reset_timeout=settings['breaker_reset_timeout']
+    )
@@ -0,0 +1,443 @@
+import json
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from pydantic import TypeAdapter
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+KEY_PREFIX = "jira-sonnet:"
+
+class CacheBackend(ABC):
+    """Byte store with hard expiry shared by all cache namespaces"""
+
+    name: str = "abstract"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get value or None if absent/expired"""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store value for ttl seconds"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove value"""
+
+    @abstractmethod
+    def clear(self, prefix: str = "") -> None:
+        """Remove all values whose key starts with prefix"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+    def close(self) -> None:
+        """Release connections"""
+
+class MemoryBackend(CacheBackend):
+    """Bounded LRU dict local to this process"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self, prefix: str = "") -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.name,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions
+            }
+
+class SQLiteBackend(CacheBackend):
+    """
+    On-disk store shared by all workers on the host (WAL mode)
+
+    Reads never wait in WAL mode; a write contended for longer than
+    ``timeout`` seconds fails (and counts as a cache error) rather than
+    holding up the caller.
+    """
+
+    name = "sqlite"
+    PRUNE_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int = 100_000, timeout: float = 0.25):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache(expires_at)")
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl)
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._prune()
+
+    def _prune(self) -> None:
+        """Drop expired rows, then the soonest-expiring ones over max_entries"""
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY expires_at LIMIT ?)",
+                (excess,)
+            )
+            self._evictions += excess
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self, prefix: str = "") -> None:
+        with self._lock:
+            if prefix:
+                # Range scan instead of LIKE to avoid escaping key characters
+                self._conn.execute(
+                    "DELETE FROM cache WHERE key >= ? AND key < ?",
+                    (prefix, prefix + "\uffff")
+                )
+            else:
+                self._conn.execute("DELETE FROM cache")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        return {
+            "backend": self.name,
+            "size": count,
+            "max_entries": self.max_entries,
+            "evictions": self._evictions
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class RedisError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+class RedisBackend(CacheBackend):
+    """
+    Store on any server speaking the Redis protocol (RESP2)
+
+    Cache calls run on the event loop, so once the server cannot be
+    reached commands fail at once for ``retry_interval`` seconds instead
+    of each waiting for a connect timeout.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, timeout: float = 0.25, retry_interval: float = 5.0):
+        parsed = urlparse(url)
+        self._address = (parsed.hostname or "localhost", parsed.port or 6379)
+        self._password = parsed.password
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._timeout = timeout
+        self._retry_interval = retry_interval
+        self._down_until = 0.0
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection(self._address, timeout=self._timeout)
+        self._reader = self._sock.makefile("rb")
+        if self._password:
+            self._send("AUTH", self._password)
+        if self._db:
+            self._send("SELECT", self._db)
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    def _send(self, *args: Any) -> Any:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            return None if length == -1 else self._reader.read(length + 2)[:-2]
+        if kind == b"*":
+            length = int(payload)
+            return None if length == -1 else [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unknown reply type {kind!r}")
+
+    def execute(self, *args: Any) -> Any:
+        """Send command, reconnecting once on a dropped connection"""
+        with self._lock:
+            if time.monotonic() < self._down_until:
+                raise ConnectionError(f"Cache server {self._address[0]}:{self._address[1]} is unavailable")
+            for attempt in range(2):
+                reused = self._sock is not None
+                try:
+                    if not reused:
+                        self._connect()
+                    return self._send(*args)
+                except (OSError, ConnectionError):
+                    self._disconnect()
+                    # Only a connection that was already open is worth one more try
+                    if attempt or not reused:
+                        self._down_until = time.monotonic() + self._retry_interval
+                        raise
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.execute("GET", key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.execute("SET", key, value, "PX", max(1, int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        self.execute("DEL", key)
+
+    def clear(self, prefix: str = "") -> None:
+        cursor = b"0"
+        while True:
+            cursor, keys = self.execute("SCAN", cursor, "MATCH", f"{prefix}*", "COUNT", 500)
+            if keys:
+                self.execute("DEL", *keys)
+            if cursor in (b"0", "0"):
+                break
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+@dataclass
+class CacheEntry:
+    """Cached value with the upstream version it was built from"""
+    value: Any
+    version: Optional[str] = None
+    expires_at: float = 0.0
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    revalidated: int = 0
+    errors: int = 0
+
+class Cache:
+    """
+    Typed, namespaced view over the shared backend
+
+    Values are stored as JSON envelopes and kept for ``stale_ttl`` seconds
+    past freshness, so expired entries can be revalidated against the
+    upstream version instead of refetched. Backend failures count as misses.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, schema: Any, ttl: float, stale_ttl: float):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._adapter = TypeAdapter(schema)
+        self._prefix = f"{KEY_PREFIX}{namespace}:"
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get entry, fresh or stale; None if absent"""
+        try:
+            raw = self.backend.get(self._prefix + key)
+            if raw is None:
+                self._count("misses")
+                return None
+            envelope = json.loads(raw)
+            entry = CacheEntry(
+                value=self._adapter.validate_python(envelope["d"]),
+                version=envelope["v"],
+                expires_at=envelope["e"]
+            )
+        except Exception as e:
+            logger.warning(f"Cache read failed for {self._prefix}{key}: {str(e)}")
+            self._count("errors")
+            return None
+        self._count("hits" if entry.is_fresh() else "stale")
+        return entry
+
+    def set(self, key: str, value: Any, version: Optional[str] = None) -> None:
+        envelope = {
+            "v": version,
+            "e": time.time() + self.ttl,
+            "d": self._adapter.dump_python(value, mode="json")
+        }
+        try:
+            self.backend.set(self._prefix + key, json.dumps(envelope).encode(), self.ttl + self.stale_ttl)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {self._prefix}{key}: {str(e)}")
+            self._count("errors")
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """Extend freshness of an entry confirmed unchanged upstream"""
+        self.set(key, entry.value, version=entry.version)
+        self._count("revalidated")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.backend.delete(self._prefix + key)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {self._prefix}{key}: {str(e)}")
+            self._count("errors")
+
+    def clear(self) -> None:
+        self.backend.clear(self._prefix)
+        with self._lock:
+            self._stats = CacheStats()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(vars(self._stats))
+
+@lru_cache()
+def get_cache_backend() -> CacheBackend:
+    """Create backend selected by CACHE_BACKEND"""
+    settings = get_settings()
+    backend = settings['cache_backend']
+    if backend == "sqlite":
+        return SQLiteBackend(settings['cache_path'], settings['cache_max_entries'])
+    if backend == "redis":
+        return RedisBackend(settings['cache_url'], retry_interval=settings['cache_retry_interval'])
+    if backend != "memory":
+        logger.warning(f"Unknown cache backend {backend}, using memory")
+    return MemoryBackend(settings['cache_max_entries'])
+
+_caches: Dict[str, Cache] = {}
+_caches_lock = threading.Lock()
+
+def get_cache(namespace: str, schema: Any, ttl: Optional[float] = None) -> Cache:
+    """Get typed cache for namespace, created on first use"""
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            settings = get_settings()
+            cache = _caches[namespace] = Cache(
+                backend=get_cache_backend(),
+                namespace=namespace,
+                schema=schema,
+                ttl=settings['cache_ttl'] if ttl is None else ttl,
+                stale_ttl=settings['cache_stale_ttl']
+            )
+        return cache
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get backend stats and per-namespace counters"""
+    with _caches_lock:
+        caches: List[Cache] = list(_caches.values())
+    try:
+        backend = get_cache_backend().stats()
+    except Exception as e:
+        backend = {"error": str(e)}
+    return {
+        "backend": backend,
+        "namespaces": {cache.namespace: cache.stats() for cache in caches}
+    }
+
+def clear_caches() -> None:
+    """Drop cached values of every namespace created by this process"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.clear()
+
+def close_cache_backend() -> None:
+    if get_cache_backend.cache_info().currsize:
+        get_cache_backend().close()
+        get_cache_backend.cache_clear()
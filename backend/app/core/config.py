@@ -1,14 +1,142 @@
-from typing import TypedDict
+from pathlib import Path
+from typing import Dict, TypedDict
 import os
 
+BASE_DIR = Path(__file__).parent.parent.parent
+
 class Settings(TypedDict):
     jira_url: str
     jira_user: str
     jira_token: str
+    jira_project: str
+    jira_fields: Dict[str, str]
+    field_cache_path: str
+    jira_async_transport: bool
+    jira_http2: bool
+    jira_max_connections: int
+    jira_max_keepalive: int
+    jira_timeout: float
+    jira_rate_limit: float
+    jira_rate_burst: int
+    jira_max_retries: int
+    jira_retry_backoff: float
+    jira_retry_max_delay: float
+    breaker_window: int
+    breaker_min_calls: int
+    breaker_failure_rate: float
+    breaker_slow_call: float
+    breaker_reset_timeout: float
+    last_known_good_max_entries: int
+    last_known_good_max_age: float
+    executor_pool_size: int
+    executor_upstream_limits: Dict[str, int]
+    cache_backend: str
+    cache_path: str
+    cache_url: str
+    cache_retry_interval: float
+    cache_max_entries: int
+    cache_ttl: float
+    cache_stale_ttl: float
+    task_cache_ttl: float
+    search_page_size: int
+    search_concurrency: int
+    batch_chunk_size: int
+    batch_max_keys: int
+    link_graph_max_depth: int
+    link_graph_max_nodes: int
+    remote_links_concurrency: int
+    label_index_path: str
+    label_index_refresh: float
+    label_index_full_rebuild: float
+    read_mode: str
+    mirror_path: str
+    mirror_sync_interval: float
+    mirror_max_staleness: float
+    mirror_full_sync: float
+    bulk_create_chunk_size: int
+    bulk_create_concurrency: int
+    bulk_create_max_items: int
+    bulk_link_concurrency: int
+    bulk_link_max_items: int
+    template_watch: str
+    template_poll_interval: float
+    template_history_path: str
+    metadata_refresh_interval: float
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ('1', 'true', 'yes', 'on')
+
+def _env_pairs(name: str, default: str) -> Dict[str, str]:
+    """Parse "key=value,..." pairs"""
+    pairs = {}
+    for pair in os.getenv(name, default).split(','):
+        if '=' not in pair:
+            continue
+        key, value = pair.split('=', 1)
+        pairs[key.strip()] = value.strip()
+    return pairs
+
+def _env_limits(name: str, default: str) -> Dict[str, int]:
+    """Parse "upstream=limit,..." pairs"""
+    return {upstream: int(limit) for upstream, limit in _env_pairs(name, default).items()}
 
 def get_settings() -> Settings:
     return {
         'jira_url': os.getenv('JIRA_URL', ''),
         'jira_user': os.getenv('JIRA_USER', ''),
-        'jira_token': os.getenv('JIRA_TOKEN', '')
-    }
\ No newline at end of file
+        'jira_token': os.getenv('JIRA_TOKEN', ''),
+        'jira_project': os.getenv('JIRA_PROJECT', 'LOGIQPROD'),
+        'jira_fields': _env_pairs('JIRA_FIELDS', ''),
+        'field_cache_path': os.getenv('FIELD_CACHE_PATH', str(BASE_DIR / 'data' / 'fields.json')),
+        'jira_async_transport': _env_flag('JIRA_ASYNC_TRANSPORT', 'true'),
+        'jira_http2': _env_flag('JIRA_HTTP2', 'true'),
+        'jira_max_connections': int(os.getenv('JIRA_MAX_CONNECTIONS', '100')),
+        'jira_max_keepalive': int(os.getenv('JIRA_MAX_KEEPALIVE', '20')),
+        'jira_timeout': float(os.getenv('JIRA_TIMEOUT', '30')),
+        'jira_rate_limit': float(os.getenv('JIRA_RATE_LIMIT', '20')),
+        'jira_rate_burst': int(os.getenv('JIRA_RATE_BURST', '40')),
+        'jira_max_retries': int(os.getenv('JIRA_MAX_RETRIES', '3')),
+        'jira_retry_backoff': float(os.getenv('JIRA_RETRY_BACKOFF', '0.5')),
+        'jira_retry_max_delay': float(os.getenv('JIRA_RETRY_MAX_DELAY', '30')),
+        'breaker_window': int(os.getenv('BREAKER_WINDOW', '20')),
+        'breaker_min_calls': int(os.getenv('BREAKER_MIN_CALLS', '10')),
+        'breaker_failure_rate': float(os.getenv('BREAKER_FAILURE_RATE', '0.5')),
+        'breaker_slow_call': float(os.getenv('BREAKER_SLOW_CALL', '5')),
+        'breaker_reset_timeout': float(os.getenv('BREAKER_RESET_TIMEOUT', '30')),
+        'last_known_good_max_entries': int(os.getenv('LAST_KNOWN_GOOD_MAX_ENTRIES', '1000')),
+        'last_known_good_max_age': float(os.getenv('LAST_KNOWN_GOOD_MAX_AGE', '86400')),
+        'executor_pool_size': int(os.getenv('EXECUTOR_POOL_SIZE', '16')),
+        'executor_upstream_limits': _env_limits('EXECUTOR_UPSTREAM_LIMITS', 'jira=16,jira-write=4'),
+        'cache_backend': os.getenv('CACHE_BACKEND', 'memory'),
+        'cache_path': os.getenv('CACHE_PATH', str(BASE_DIR / 'data' / 'cache.sqlite3')),
+        'cache_url': os.getenv('CACHE_URL', 'redis://localhost:6379/0'),
+        'cache_retry_interval': float(os.getenv('CACHE_RETRY_INTERVAL', '5')),
+        'cache_max_entries': int(os.getenv('CACHE_MAX_ENTRIES', '4096')),
+        'cache_ttl': float(os.getenv('CACHE_TTL', '30')),
+        'cache_stale_ttl': float(os.getenv('CACHE_STALE_TTL', '3600')),
+        'task_cache_ttl': float(os.getenv('TASK_CACHE_TTL', '30')),
+        'search_page_size': int(os.getenv('SEARCH_PAGE_SIZE', '100')),
+        'search_concurrency': int(os.getenv('SEARCH_CONCURRENCY', '4')),
+        'batch_chunk_size': int(os.getenv('BATCH_CHUNK_SIZE', '100')),
+        'batch_max_keys': int(os.getenv('BATCH_MAX_KEYS', '500')),
+        'link_graph_max_depth': int(os.getenv('LINK_GRAPH_MAX_DEPTH', '5')),
+        'link_graph_max_nodes': int(os.getenv('LINK_GRAPH_MAX_NODES', '500')),
+        'remote_links_concurrency': int(os.getenv('REMOTE_LINKS_CONCURRENCY', '8')),
+        'label_index_path': os.getenv('LABEL_INDEX_PATH', str(BASE_DIR / 'data' / 'label_index.json')),
+        'label_index_refresh': float(os.getenv('LABEL_INDEX_REFRESH', '60')),
+        'label_index_full_rebuild': float(os.getenv('LABEL_INDEX_FULL_REBUILD', '86400')),
+        'read_mode': os.getenv('READ_MODE', 'live').strip().lower(),
+        'mirror_path': os.getenv('MIRROR_PATH', str(BASE_DIR / 'data' / 'mirror.sqlite3')),
+        'mirror_sync_interval': float(os.getenv('MIRROR_SYNC_INTERVAL', '30')),
+        'mirror_max_staleness': float(os.getenv('MIRROR_MAX_STALENESS', '300')),
+        'mirror_full_sync': float(os.getenv('MIRROR_FULL_SYNC', '86400')),
+        'bulk_create_chunk_size': int(os.getenv('BULK_CREATE_CHUNK_SIZE', '50')),
+        'bulk_create_concurrency': int(os.getenv('BULK_CREATE_CONCURRENCY', '4')),
+        'bulk_create_max_items': int(os.getenv('BULK_CREATE_MAX_ITEMS', '1000')),
+        'bulk_link_concurrency': int(os.getenv('BULK_LINK_CONCURRENCY', '8')),
+        'bulk_link_max_items': int(os.getenv('BULK_LINK_MAX_ITEMS', '1000')),
+        'template_watch': os.getenv('TEMPLATE_WATCH', 'auto').strip().lower(),
+        'template_poll_interval': float(os.getenv('TEMPLATE_POLL_INTERVAL', '2')),
+        'template_history_path': os.getenv('TEMPLATE_HISTORY_PATH', str(BASE_DIR / 'data' / 'templates')),
+        'metadata_refresh_interval': float(os.getenv('METADATA_REFRESH_INTERVAL', '3600'))
+    }
@@ -0,0 +1,24 @@
+from typing import Optional
+
+class UpstreamError(Exception):
+    """
+    Upstream (JIRA) could not answer, as opposed to answering "not found"
+
+    Services let it propagate instead of returning None, the app turns it
+    into a 503 response with ``Retry-After`` when known.
+    """
+
+    status_code = 503
+
+    def __init__(self, message: str, upstream: str = "jira", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+class UpstreamThrottledError(UpstreamError):
+    """Upstream kept rejecting calls with 429 after all retries"""
+
+    status_code = 429
+
+class CircuitOpenError(UpstreamError):
+    """Upstream is failing, the call was not attempted"""
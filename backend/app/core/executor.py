@@ -0,0 +1,106 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+class UpstreamPool:
+    """Bounded thread pool dedicated to a single upstream"""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{name}-io"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._max_queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+
+    def _call(self, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run blocking callable in the pool without blocking the event loop"""
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+        # Context vars (request priority etc.) must follow the call into the thread
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, self._call, fn, args, kwargs)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Call never started, so it will never leave the queue by itself
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool counters"""
+        with self._lock:
+            return {
+                "limit": self.max_workers,
+                "queued": self._queued,
+                "max_queued": self._max_queued,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+_pools: Dict[str, UpstreamPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(upstream: str = "jira") -> UpstreamPool:
+    """Get or create pool for upstream, sized from settings"""
+    with _pools_lock:
+        pool = _pools.get(upstream)
+        if pool is None:
+            settings = get_settings()
+            limit = settings['executor_upstream_limits'].get(
+                upstream, settings['executor_pool_size']
+            )
+            pool = _pools[upstream] = UpstreamPool(upstream, max(1, limit))
+        return pool
+
+async def run_blocking(fn: Callable[..., T], *args, upstream: str = "jira", **kwargs: Any) -> T:
+    """Offload blocking call to the bounded pool of given upstream"""
+    return await get_pool(upstream).run(fn, *args, **kwargs)
+
+def get_executor_stats() -> Dict[str, Dict[str, int]]:
+    """Get queue depth and throughput counters per upstream"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.name: pool.stats() for pool in pools}
+
+def shutdown_executors() -> None:
+    """Stop all pools, pending calls are cancelled"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
@@ -0,0 +1,131 @@
+import json
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from app.core.config import get_settings
+from app.core.files import atomic_write_text
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+# Logical field -> (display name looked up in JIRA, id used until resolved)
+DEFAULT_FIELDS: Dict[str, tuple] = {
+    'epic_link': ('Epic Link', 'customfield_10601'),
+    'epic_name': ('Epic Name', 'customfield_10604'),
+    'story_points': ('Story Points', None),
+    'team': ('Team', None)
+}
+
+CUSTOM_FIELD_ID = re.compile(r'^customfield_(\d+)$')
+
+class FieldResolver:
+    """
+    Maps logical field names to the custom field ids of one JIRA instance
+
+    Ids are resolved by display name from a single ``fields()`` listing and
+    cached on disk per server URL, so a restart needs no lookup and several
+    instances can share one cache file. Until resolved, the historical ids
+    are used.
+    """
+
+    def __init__(self, server: str, path: Optional[str] = None, names: Optional[Dict[str, str]] = None):
+        self.server = server.rstrip('/')
+        self.path = Path(path) if path else None
+        # Logical field -> display name or explicit customfield id
+        self.names = {logical: name for logical, (name, _) in DEFAULT_FIELDS.items()}
+        self.names.update(names or {})
+        self._ids: Dict[str, str] = {
+            logical: default for logical, (_, default) in DEFAULT_FIELDS.items() if default
+        }
+        self._ids.update({
+            logical: value for logical, value in self.names.items() if CUSTOM_FIELD_ID.match(value)
+        })
+        self.resolved_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """Take ids from the disk cache; returns whether this server was cached"""
+        if not self.path or not self.path.exists():
+            return False
+        try:
+            cached = json.loads(self.path.read_text(encoding='utf-8')).get(self.server)
+        except Exception as e:
+            logger.error(f"Error reading field cache {self.path}: {str(e)}")
+            return False
+        if not cached or cached.get('names') != self.names:
+            return False
+        with self._lock:
+            self._ids = dict(cached['ids'])
+            self.resolved_at = cached['resolved_at']
+        return True
+
+    def update(self, fields: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+        """Resolve all logical fields from a JIRA ``fields()`` listing and persist them"""
+        by_name: Dict[str, str] = {}
+        for field in fields:
+            for name in [field.get('name')] + list(field.get('clauseNames') or []):
+                if name:
+                    by_name.setdefault(name.lower(), field['id'])
+
+        ids: Dict[str, str] = {}
+        for logical, name in self.names.items():
+            field_id = name if CUSTOM_FIELD_ID.match(name) else by_name.get(name.lower())
+            if field_id:
+                ids[logical] = field_id
+            elif logical in self._ids:
+                # Keep the id in use rather than dropping a field JIRA lists under another name
+                ids[logical] = self._ids[logical]
+                logger.warning(f"JIRA field '{name}' ({logical}) not found on {self.server}, keeping {ids[logical]}")
+            else:
+                logger.warning(f"JIRA field '{name}' ({logical}) not found on {self.server}")
+
+        with self._lock:
+            self._ids = ids
+            self.resolved_at = time.time()
+        self._save()
+        return ids
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            cache = json.loads(self.path.read_text(encoding='utf-8')) if self.path.exists() else {}
+            cache[self.server] = {'names': self.names, 'ids': self._ids, 'resolved_at': self.resolved_at}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.path, json.dumps(cache, indent=2))
+        except Exception as e:
+            logger.error(f"Error writing field cache {self.path}: {str(e)}")
+
+    def field_id(self, logical: str) -> Optional[str]:
+        """JIRA field id of a logical field, None if the instance has no such field"""
+        return self._ids.get(logical)
+
+    def resolve(self, field: str) -> Optional[str]:
+        """Translate a logical field to its id, other field names pass through"""
+        if field in self.names:
+            return self.field_id(field)
+        return field
+
+    def jql_ref(self, logical: str) -> str:
+        """Reference to a logical field usable in JQL"""
+        match = CUSTOM_FIELD_ID.match(self.field_id(logical) or '')
+        if match:
+            return f'cf[{match.group(1)}]'
+        return f'"{self.names[logical]}"'
+
+@lru_cache()
+def get_field_resolver() -> FieldResolver:
+    """Get resolver of the configured JIRA instance, restored from the disk cache"""
+    settings = get_settings()
+    resolver = FieldResolver(settings['jira_url'], settings['field_cache_path'], settings['jira_fields'])
+    resolver.load()
+    return resolver
+
+def resolve_field(field: str) -> Optional[str]:
+    return get_field_resolver().resolve(field)
+
+def field_id(logical: str) -> Optional[str]:
+    return get_field_resolver().field_id(logical)
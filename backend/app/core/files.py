@@ -0,0 +1,21 @@
+import os
+import threading
+from pathlib import Path
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write a file so readers see either the old or the new content, never a partial one
+
+    The temp file is private to the writing process and thread, so workers
+    writing the same file at once cannot mix their contents.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as tmp:
+            tmp.write(text)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
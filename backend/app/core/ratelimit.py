@@ -0,0 +1,222 @@
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Mapping, Optional
+from app.core.config import get_settings
+from app.core.errors import UpstreamError, UpstreamThrottledError
+
+class Priority(IntEnum):
+    """Who waits for a JIRA call; lower values are served first"""
+    INTERACTIVE = 0
+    BULK = 1
+    BACKGROUND = 2
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar('jira_priority', default=Priority.INTERACTIVE)
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Make JIRA calls inside the block (and pool threads started from it) run at priority"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+THROTTLED_STATUSES = (429, 503)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given as seconds or HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by all JIRA calls of the process
+
+    Starts at ``rate`` calls per second with ``burst`` tokens and never goes
+    above the fill rate JIRA announces in ``X-RateLimit-*`` headers. Every
+    429/503 halves the rate and blocks all callers until ``Retry-After`` (or
+    a jittered exponential backoff) has passed; successful calls grow the
+    rate back. Lower priorities leave part of the bucket to interactive
+    reads: bulk work only takes a token while a quarter of the burst stays
+    free, background work while half of it does.
+    """
+
+    RESERVE = {Priority.INTERACTIVE: 0.0, Priority.BULK: 0.25, Priority.BACKGROUND: 0.5}
+    DECREASE = 0.5
+    INCREASE = 0.05
+    MIN_RATE = 0.05
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 30.0
+    ):
+        # rate <= 0 disables the bucket, Retry-After handling still applies
+        self.enabled = rate > 0
+        self.max_rate = rate
+        self.ceiling = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.capacity = float(self.burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {"acquired": 0, "waited": 0.0, "throttled": 0, "retries": 0, "rejected": 0}
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self, priority: Priority) -> float:
+        """Take a token; returns 0 or the seconds to wait before trying again"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if not self.enabled:
+                self._stats["acquired"] += 1
+                return 0.0
+            self._refill(now)
+            needed = min(self.capacity, 1.0 + self.capacity * self.RESERVE[priority])
+            if self._tokens >= needed:
+                self._tokens -= 1.0
+                self._stats["acquired"] += 1
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    def _before_wait(self, wait: float, priority: Priority) -> None:
+        # Interactive callers get an answer instead of hanging behind a long Retry-After
+        if priority == Priority.INTERACTIVE and wait > self.max_delay:
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise UpstreamThrottledError("JIRA rate limit exceeded", retry_after=wait)
+        with self._lock:
+            self._stats["waited"] += wait
+
+    async def acquire(self, priority: Optional[Priority] = None) -> None:
+        """Wait for a token without blocking the event loop"""
+        priority = current_priority() if priority is None else priority
+        while True:
+            wait = self._take(priority)
+            if not wait:
+                return
+            self._before_wait(wait, priority)
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, priority: Optional[Priority] = None) -> None:
+        """Wait for a token in a worker thread"""
+        priority = current_priority() if priority is None else priority
+        while True:
+            wait = self._take(priority)
+            if not wait:
+                return
+            self._before_wait(wait, priority)
+            time.sleep(wait)
+
+    def observe(self, status_code: int, headers: Mapping[str, str], attempt: int = 0) -> Optional[float]:
+        """
+        Adapt to a JIRA response
+
+        Returns None if the call went through, otherwise the delay before
+        it may be retried (every caller waits that long).
+        """
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        fill_rate = _header_float(headers, 'X-RateLimit-FillRate')
+        interval = _header_float(headers, 'X-RateLimit-Interval-Seconds')
+        limit = _header_float(headers, 'X-RateLimit-Limit')
+        remaining = _header_float(headers, 'X-RateLimit-Remaining')
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.enabled:
+                if fill_rate and interval:
+                    self.ceiling = min(self.max_rate, fill_rate / interval)
+                    self.rate = min(self.rate, self.ceiling)
+                if limit:
+                    self.capacity = max(1.0, min(float(self.burst), limit))
+                    self._tokens = min(self._tokens, self.capacity)
+                if remaining is not None:
+                    self._tokens = min(self._tokens, remaining)
+
+            if status_code not in THROTTLED_STATUSES:
+                if self.enabled:
+                    self.rate = min(self.ceiling, self.rate + self.ceiling * self.INCREASE)
+                return None
+
+            self._stats["throttled"] += 1
+            if self.enabled:
+                self.rate = max(self.ceiling * self.MIN_RATE, self.rate * self.DECREASE)
+                self._tokens = 0.0
+            if retry_after is not None:
+                # Spread the callers released together by the same Retry-After
+                delay = retry_after + random.uniform(0, self.backoff)
+            else:
+                delay = random.uniform(0, min(self.max_delay, self.backoff * 2 ** attempt))
+            self._blocked_until = max(self._blocked_until, now + delay)
+            return delay
+
+    def retry(self, status_code: int, delay: float, attempt: int) -> None:
+        """Count a retry of a throttled call, raise once retries are exhausted"""
+        with self._lock:
+            if attempt < self.max_retries:
+                self._stats["retries"] += 1
+                return
+            self._stats["rejected"] += 1
+        error = UpstreamThrottledError if status_code == 429 else UpstreamError
+        raise error(f"JIRA responded {status_code} after {attempt} retries", retry_after=delay)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                **self._stats,
+                "rate": self.rate,
+                "ceiling": self.ceiling,
+                "tokens": self._tokens,
+                "capacity": self.capacity,
+                "blocked_for": max(0.0, self._blocked_until - time.monotonic())
+            }
+
+@lru_cache()
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Get limiter shared by the async and sync JIRA clients"""
+    settings = get_settings()
+    return AdaptiveRateLimiter(
+        rate=settings['jira_rate_limit'],
+        burst=settings['jira_rate_burst'],
+        max_retries=settings['jira_max_retries'],
+        backoff=settings['jira_retry_backoff'],
+        max_delay=settings['jira_retry_max_delay']
+    )
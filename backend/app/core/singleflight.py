@@ -0,0 +1,57 @@
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one
+
+    The first caller for a key starts the work; callers arriving while it is
+    in flight await the same result (or exception). Each waiter is shielded,
+    so one cancelled request does not cancel the call for the others.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        # Futures belong to one event loop, keep in-flight calls per loop
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats = {"calls": 0, "shared": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+        future = calls.get(key)
+        if future is None:
+            self._stats["calls"] += 1
+            future = asyncio.ensure_future(fn())
+            calls[key] = future
+
+            def forget(done: asyncio.Future) -> None:
+                if calls.get(key) is done:
+                    del calls[key]
+                # Mark exception retrieved even if every waiter went away
+                if not done.cancelled():
+                    done.exception()
+
+            future.add_done_callback(forget)
+        else:
+            self._stats["shared"] += 1
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, Any]:
+        in_flight = sum(len(calls) for calls in self._calls.values())
+        return {**self._stats, "in_flight": in_flight}
+
+_flights: Dict[str, SingleFlight] = {}
+
+def get_flight(name: str) -> SingleFlight:
+    """Get shared single-flight group by name"""
+    if name not in _flights:
+        _flights[name] = SingleFlight(name)
+    return _flights[name]
+
+def get_singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: flight.stats() for name, flight in _flights.items()}
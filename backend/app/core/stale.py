@@ -0,0 +1,152 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, Set, Tuple, TypeVar
+from app.core.config import get_settings
+from app.core.errors import UpstreamError
+from app.core.logging import get_logger
+from app.core.ratelimit import Priority, request_priority
+
+logger = get_logger()
+
+T = TypeVar('T')
+
+class Staleness:
+    """Per-request flag set when any part of the response came from last-known-good data"""
+
+    def __init__(self):
+        self.stale = False
+
+_staleness: contextvars.ContextVar[Optional[Staleness]] = contextvars.ContextVar('staleness', default=None)
+
+@contextmanager
+def track_staleness() -> Iterator[Staleness]:
+    """Collect stale markers of everything run inside the block, including tasks and pool threads"""
+    staleness = Staleness()
+    token = _staleness.set(staleness)
+    try:
+        yield staleness
+    finally:
+        _staleness.reset(token)
+
+def mark_response_stale() -> None:
+    staleness = _staleness.get()
+    if staleness is not None:
+        staleness.stale = True
+
+class LastKnownGood:
+    """
+    Small bounded LRU of recent successful upstream reads
+
+    Kept in process memory, apart from the cache backend, so it still
+    answers when both JIRA and a shared cache are unreachable. Entries older
+    than ``max_age`` seconds are not served.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_age: float = 86400):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {"served": 0, "refreshed": 0, "evictions": 0}
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if time.time() - item[1] > self.max_age:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def serve_stale(self, key: Hashable) -> Optional[Any]:
+        """Get value to answer with while the upstream fails"""
+        value = self.get(key)
+        if value is not None:
+            with self._lock:
+                self._stats["served"] += 1
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+            with request_priority(Priority.BACKGROUND):
+                value = await fetch()
+            if value is None:
+                self.delete(key)
+            else:
+                self.put(key, value)
+            with self._lock:
+                self._stats["refreshed"] += 1
+        except Exception as e:
+            logger.debug(f"Background refresh of {key} failed: {str(e)}")
+        finally:
+            self._refreshing.discard(key)
+
+    def refresh_in_background(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], delay: float = 0.0) -> None:
+        """Retry the read once the upstream may answer again, one refresh per key at a time"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        # Not tied to the request: its stale marker must not be touched after the response
+        task = contextvars.Context().run(asyncio.create_task, self._refresh(key, fetch, delay))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "refreshing": len(self._refreshing)
+            }
+
+@lru_cache()
+def get_last_known_good() -> LastKnownGood:
+    settings = get_settings()
+    return LastKnownGood(settings['last_known_good_max_entries'], settings['last_known_good_max_age'])
+
+async def with_last_known_good(key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run an upstream read, falling back to its last successful result
+
+    When the upstream fails the last-known-good value is returned, the
+    response is marked stale and the read is retried in the background.
+    Without a stored value the error propagates.
+    """
+    store = get_last_known_good()
+    try:
+        value = await fetch()
+    except UpstreamError as e:
+        stale = store.serve_stale(key)
+        if stale is None:
+            raise
+        mark_response_stale()
+        store.refresh_in_background(key, fetch, delay=e.retry_after or 0.0)
+        return stale
+    if value is None:
+        store.delete(key)
+    else:
+        store.put(key, value)
+    return value
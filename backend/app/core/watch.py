@@ -0,0 +1,209 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+# Called with a changed file, or with a directory whose contents are unknown
+OnChange = Callable[[Path], None]
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT = struct.Struct('iIII')
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """libc exposing inotify, None where it is not available"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+def snapshot(root: Path, pattern: str) -> Dict[Path, Tuple[int, int]]:
+    """(mtime, size) of files matching ``pattern`` under ``root``"""
+    files = {}
+    for path in root.glob(pattern):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+class PollingWatcher:
+    """Reports files under ``root`` whose mtime or size changed, checked every ``interval`` seconds"""
+
+    name = "poll"
+
+    def __init__(self, root: Path, on_change: OnChange, interval: float = 2.0, pattern: str = "*/*"):
+        self.root = root
+        self.on_change = on_change
+        self.interval = interval
+        self.pattern = pattern
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._files = snapshot(self.root, self.pattern)
+        self._thread = threading.Thread(target=self._run, name=f"watch-{self.root.name}", daemon=True)
+        self._thread.start()
+
+    def poll(self) -> None:
+        """Compare the directory with the last snapshot and report differences"""
+        files = snapshot(self.root, self.pattern)
+        changed = [path for path in files.keys() | self._files.keys() if files.get(path) != self._files.get(path)]
+        self._files = files
+        for path in changed:
+            self.on_change(path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"Error polling {self.root}: {str(e)}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+class InotifyWatcher:
+    """
+    Reports changes under ``root`` and its direct subdirectories as the kernel sees them
+
+    Subdirectories created later are watched as they appear. When the event
+    queue overflows ``root`` itself is reported.
+    """
+
+    name = "inotify"
+
+    def __init__(self, root: Path, on_change: OnChange, libc: Optional[ctypes.CDLL] = None):
+        self.root = root
+        self.on_change = on_change
+        self._libc = libc or _load_libc()
+        self._fd = -1
+        self._dirs: Dict[int, Path] = {}
+        self._stop_read, self._stop_write = -1, -1
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._libc is None:
+            raise OSError("inotify is not available")
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            self._watch(self.root)
+            for path in self.root.iterdir():
+                if path.is_dir():
+                    self._watch(path)
+        except OSError:
+            os.close(self._fd)
+            raise
+        self._stop_read, self._stop_write = os.pipe()
+        self._thread = threading.Thread(target=self._run, name=f"watch-{self.root.name}", daemon=True)
+        self._thread.start()
+
+    def _watch(self, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"Cannot watch {path}")
+        self._dirs[wd] = path
+
+    def _run(self) -> None:
+        while True:
+            ready, _, _ = select.select([self._fd, self._stop_read], [], [])
+            if self._stop_read in ready:
+                return
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            try:
+                self._dispatch(data)
+            except Exception as e:
+                logger.error(f"Error handling changes in {self.root}: {str(e)}")
+
+    def _dispatch(self, data: bytes) -> None:
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            offset += _EVENT.size + length
+
+            if mask & _IN_Q_OVERFLOW:
+                self.on_change(self.root)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._dirs[wd]
+                continue
+            if not name:
+                # The watched directory itself was removed or moved
+                self.on_change(directory)
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO) and directory == self.root:
+                self._watch(path)
+            self.on_change(path)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        os.write(self._stop_write, b'\0')
+        self._thread.join()
+        for fd in (self._fd, self._stop_read, self._stop_write):
+            os.close(fd)
+        self._thread = None
+
+def create_watcher(root: Path, on_change: OnChange, mode: str = "auto", interval: float = 2.0):
+    """
+    Start watching ``root``: inotify where available, else polling
+
+    ``mode`` is ``auto``, ``inotify``, ``poll`` or ``off``; None is
+    returned for ``off`` or when ``root`` does not exist.
+    """
+    if mode == "off" or not root.is_dir():
+        return None
+    if mode in ("auto", "inotify"):
+        watcher = InotifyWatcher(root, on_change)
+        try:
+            watcher.start()
+            return watcher
+        except OSError as e:
+            if mode == "inotify":
+                raise
+            logger.warning(f"inotify unavailable for {root} ({str(e)}), polling every {interval}s")
+    watcher = PollingWatcher(root, on_change, interval)
+    watcher.start()
+    return watcher
@@ -1,16 +1,88 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from app.api.v1 import api_router
+from app.core.cache import close_cache_backend, get_cache_stats
+from app.core.config import get_settings
+from app.core.breaker import get_circuit_breaker
+from app.core.errors import UpstreamError
+from app.core.executor import get_executor_stats, shutdown_executors
+from app.core.ratelimit import get_rate_limiter
+from app.core.singleflight import get_singleflight_stats
+from app.core.stale import get_last_known_good, track_staleness
+from app.services.jira import close_async_jira_client
+from app.services.label_index import get_label_index, rebuild_label_index_periodically
+from app.services.metadata import get_metadata_registry, refresh_metadata_periodically
+from app.services.mirror_store import close_mirror_store, get_mirror_store
+from app.services.sync import create_sync_worker
+from app.services.templates import close_template_service, get_template_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    metadata_refresh = asyncio.create_task(refresh_metadata_periodically(get_metadata_registry()))
+    label_index_rebuild = None
+    if get_settings()['read_mode'] == 'mirror':
+        app.state.sync_worker = create_sync_worker(get_mirror_store())
+        app.state.sync_worker.start()
+    else:
+        # The mirror answers label reads itself
+        label_index_rebuild = asyncio.create_task(rebuild_label_index_periodically(get_label_index()))
+    yield
+    metadata_refresh.cancel()
+    if label_index_rebuild is not None:
+        label_index_rebuild.cancel()
+    if app.state.sync_worker is not None:
+        await app.state.sync_worker.stop()
+    await close_async_jira_client()
+    shutdown_executors()
+    close_cache_backend()
+    close_mirror_store()
+    close_template_service()
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="JIRA Sonnet API")
+    app = FastAPI(title="JIRA Sonnet API", lifespan=lifespan)
+    app.state.sync_worker = None
     
     # Include main API router
     app.include_router(api_router)
+
+    @app.middleware("http")
+    async def mark_stale_responses(request: Request, call_next):
+        # Responses built from last-known-good data while JIRA fails carry a Warning
+        with track_staleness() as staleness:
+            response = await call_next(request)
+        if staleness.stale:
+            response.headers["Warning"] = '110 - "Response is Stale"'
+        return response
+
+    @app.exception_handler(UpstreamError)
+    async def upstream_error_handler(request: Request, exc: UpstreamError) -> JSONResponse:
+        # Throttling/outage of JIRA is reported as such, never as a missing resource
+        headers = {}
+        if exc.retry_after is not None:
+            headers["Retry-After"] = str(max(1, round(exc.retry_after)))
+        return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)}, headers=headers)
     
     @app.get("/health")
     async def health_check() -> dict[str, str]:
         return {"status": "ok"}
     
+    @app.get("/metrics")
+    async def metrics() -> Dict[str, Any]:
+        return {
+            "executor": get_executor_stats(),
+            "cache": get_cache_stats(),
+            "metadata": get_metadata_registry().stats(),
+            "singleflight": get_singleflight_stats(),
+            "ratelimit": get_rate_limiter().stats(),
+            "breaker": get_circuit_breaker().stats(),
+            "last_known_good": get_last_known_good().stats(),
+            "sync": app.state.sync_worker.stats() if app.state.sync_worker else None,
+            "templates": get_template_service().store.stats()
+        }
+    
     return app
 
-app = create_app()
\ No newline at end of file
+app = create_app()
@@ -1,10 +1,73 @@
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Set, Tuple, Type
 from pydantic import BaseModel, Field
+from app.core.fields import resolve_field
 
 class BaseSchema(BaseModel):
+    # Schema attribute -> JIRA field (or logical field, see app.core.fields) it is read from
+    JIRA_FIELDS: ClassVar[Dict[str, str]] = {
+        'created': 'created',
+        'updated': 'updated',
+        'summary': 'summary',
+        'description': 'description'
+    }
+
     key: str = Field(pattern=r"[A-Z]+-\d+")
     created: datetime
     updated: datetime
     summary: str = Field(min_length=1, max_length=255)
-    description: Optional[str] = None
\ No newline at end of file
+    description: Optional[str] = None
+
+def jira_fields_for(schema: Type[BaseModel], attributes: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    JIRA fields needed to fill schema attributes (all declared ones by default)
+
+    Logical fields such as ``epic_name`` are translated to the custom field
+    ids of the configured JIRA instance.
+    """
+    mapping: Dict[str, str] = getattr(schema, 'JIRA_FIELDS', {})
+    names = mapping.keys() if attributes is None else attributes
+    fields: List[str] = []
+    for name in names:
+        field = resolve_field(mapping[name]) if name in mapping else None
+        if field and field not in fields:
+            fields.append(field)
+    return fields
+
+def parse_sparse_fields(value: Optional[str], schema: Type[BaseModel]) -> Optional[Set[str]]:
+    """Parse ?fields=a,b into schema attribute names, `key` is always kept"""
+    if not value:
+        return None
+    requested = {name.strip() for name in value.split(',') if name.strip()}
+    unknown = requested - set(schema.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested | {'key'}
+
+ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+
+def issue_key_order(key: str) -> Tuple[str, int]:
+    """Sort key matching JIRA's ``ORDER BY key``: project, then issue number (P-9 before P-10)"""
+    project, _, number = key.rpartition('-')
+    return (project, int(number)) if number.isdigit() else (key, -1)
+
+def parse_issue_keys(values: Iterable[str], limit: int) -> List[str]:
+    """Parse issue keys (comma-separated items allowed), keeping order and dropping repeats"""
+    keys = [key.strip() for value in values for key in value.split(',') if key.strip()]
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        raise ValueError("No issue keys given")
+    if len(keys) > limit:
+        raise ValueError(f"At most {limit} keys per request, got {len(keys)}")
+    invalid = [key for key in keys if not ISSUE_KEY.match(key)]
+    if invalid:
+        raise ValueError(f"Invalid issue keys: {', '.join(invalid)}")
+    return keys
+
+def build_partial(schema: Type[BaseModel], values: Dict[str, Any]) -> BaseModel:
+    """Build schema from a subset of attributes, validating each one given"""
+    instance = schema.model_construct()
+    for name, value in values.items():
+        schema.__pydantic_validator__.validate_assignment(instance, name, value)
+    return instance
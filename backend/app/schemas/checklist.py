@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -6,11 +8,29 @@ class ChecklistType(str, Enum):
     DOR = "dor"
     DOD = "dod"
 
-class ChecklistTemplate(BaseModel):
-    """Schema for DoR/DoD checklists"""
+class TemplateView(str, Enum):
+    """What GET /templates/{type} returns per template"""
+    FULL = "full"        # whole template with content
+    SUMMARY = "summary"  # metadata only, see TemplateSummary
+
+class TemplateSummary(BaseModel):
+    """Template metadata without content, for list views"""
     key: str = Field(..., description="Unique identifier")
     name: str = Field(..., description="Display name")
     type: ChecklistType = Field(..., description="Type of checklist (DoR/DoD)")
     description: str = Field(..., description="Template description")
     version: str = Field(..., description="Template version")
-    content: str = Field(..., description="Checklist content")
\ No newline at end of file
+    tags: List[str] = Field(default_factory=list, description="Template tags")
+
+class ChecklistTemplate(TemplateSummary):
+    """Schema for DoR/DoD checklists"""
+    content: str = Field(..., description="Checklist content")
+
+class TemplateRevision(BaseModel):
+    """One change of a template file"""
+    revision: int = Field(..., description="Sequential revision number")
+    action: str = Field(..., description="create | update | delete")
+    at: datetime = Field(..., description="When the change was written")
+    name: Optional[str] = Field(None, description="Template name after the change")
+    version: Optional[str] = Field(None, description="Template version after the change")
+    diff: str = Field(..., description="Unified diff of the template file")
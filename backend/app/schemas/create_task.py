@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional
+from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -10,6 +10,12 @@ class TaskPriority(str, Enum):
     LOW = "Low"
     LOWEST = "Lowest"
 
+class TaskReturn(str, Enum):
+    """What POST /tasks returns after the issue is created"""
+    MINIMAL = "minimal"  # id/key/self from the create response
+    FULL = "full"        # issue re-read from JIRA
+    ASYNC = "async"      # minimal now, full issue cached in the background
+
 class CreateTaskRequest(BaseModel):
     # Required fields
     project_key: str = Field(..., description="Project key")
@@ -32,6 +38,10 @@ class CreateTaskRequest(BaseModel):
     assignee: Optional[str] = None
     reporter: Optional[str] = None  # Add reporter field
 
+    # DoR/DoD checklists appended to the description
+    dor_template: Optional[str] = Field(None, description="DoR template key")
+    dod_template: Optional[str] = Field(None, description="DoD template key")
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -45,9 +55,24 @@ class CreateTaskRequest(BaseModel):
                 "epic_link": "PROJ-123",
                 "labels": ["backend", "feature"],
                 "assignee": "john.doe",
+                "dor_template": "standard",
                 "custom_fields": {
                     "story_points": 5,
                     "team": "backend"
                 }
             }
-        }
\ No newline at end of file
+        }
+
+class BulkTaskResult(BaseModel):
+    """Outcome of one item of a bulk create, `index` is its position in the request"""
+    index: int
+    status: str = Field(..., description="created | failed")
+    key: Optional[str] = None
+    id: Optional[str] = None
+    error: Optional[Any] = Field(None, description="JIRA field errors or message")
+    retry_after: Optional[float] = Field(None, description="Seconds to wait before retrying a failed item")
+
+class BulkCreateTasksResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkTaskResult]
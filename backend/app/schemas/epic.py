@@ -1,7 +1,36 @@
-from typing import List
-from pydantic import Field
+from typing import ClassVar, Dict, List
+from pydantic import BaseModel, Field
 from .base import BaseSchema
+from .task import TaskSchema
 
 class EpicSchema(BaseSchema):
+    # Epic name is a custom field resolved per instance, child keys come from the aggregate search
+    JIRA_FIELDS: ClassVar[Dict[str, str]] = {
+        **BaseSchema.JIRA_FIELDS,
+        'name': 'epic_name'
+    }
+
     name: str = Field(min_length=1, max_length=255)
-    tasks: List[str] = []  # Changed from Field(default_list=[]) to direct default
\ No newline at end of file
+    tasks: List[str] = []  # Changed from Field(default_list=[]) to direct default
+
+class EpicAggregate(BaseModel):
+    """Epic together with its child tasks, loaded by one search"""
+    epic: EpicSchema
+    tasks: List[TaskSchema] = []
+
+class BlockedTask(BaseModel):
+    """Task waiting on blockers that are not done yet"""
+    key: str
+    blockers: List[str] = Field(..., description="Unresolved blocking tasks, in or outside the epic")
+
+class EpicAnalysis(BaseModel):
+    """Blocking-link analysis of an epic's tasks"""
+    epic: str
+    tasks: int = Field(..., description="Tasks in the epic")
+    links: int = Field(..., description="Blocking links between tasks of the epic")
+    order: List[str] = Field(..., description="Tasks in an order where blockers come first")
+    critical_path: List[str] = Field(..., description="Longest chain of blocking tasks by remaining estimate")
+    critical_path_hours: float = Field(..., description="Remaining original estimate along the critical path")
+    blocked: List[BlockedTask] = Field(default_factory=list)
+    cycles: List[str] = Field(default_factory=list, description="Tasks on blocking cycles, left out of order")
+    unestimated: List[str] = Field(default_factory=list, description="Open tasks without an original estimate")
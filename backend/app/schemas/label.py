@@ -1,9 +1,17 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import ClassVar, Dict, List, Optional
 from datetime import datetime
 
 class LabelSchema(BaseModel):
     """Schema for JIRA label"""
+    # Labels are aggregated from the issues that carry them
+    JIRA_FIELDS: ClassVar[Dict[str, str]] = {
+        'key': 'labels',
+        'used_in': 'labels',
+        'created': 'created',
+        'updated': 'updated'
+    }
+
     key: str = Field(..., description="Label key (usually lowercase)")
     name: str = Field(..., description="Label display name")
     description: Optional[str] = Field(None, description="Optional label description")
@@ -1,7 +1,8 @@
 from enum import Enum
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Dict, List, Optional, Set, Tuple
 from pydantic import BaseModel, Field, HttpUrl
+from app.schemas.base import ISSUE_KEY
 
 class LinkType(str, Enum):
     """Internal JIRA link types"""
@@ -11,6 +12,39 @@ class LinkType(str, Enum):
     DUPLICATES = "duplicates"
     DUPLICATED_BY = "is duplicated by"
 
+# Link type seen from the other end; "relates to" is its own inverse
+INVERSE_LINK_TYPES: Dict[LinkType, LinkType] = {
+    LinkType.BLOCKS: LinkType.BLOCKED_BY,
+    LinkType.BLOCKED_BY: LinkType.BLOCKS,
+    LinkType.RELATES_TO: LinkType.RELATES_TO,
+    LinkType.DUPLICATES: LinkType.DUPLICATED_BY,
+    LinkType.DUPLICATED_BY: LinkType.DUPLICATES
+}
+
+def canonical_edge(source: str, link_type: LinkType, target: str) -> Tuple[str, LinkType, str]:
+    """Same edge for both ends of a link: active types only, symmetric ones ordered by key"""
+    if link_type in (LinkType.BLOCKED_BY, LinkType.DUPLICATED_BY):
+        return target, INVERSE_LINK_TYPES[link_type], source
+    if link_type == LinkType.RELATES_TO and target < source:
+        return target, link_type, source
+    return source, link_type, target
+
+def parse_link_types(value: Optional[str]) -> Optional[Set[LinkType]]:
+    """Parse ?types=blocks,is blocked by into link types"""
+    if not value:
+        return None
+    types = set()
+    for name in value.split(','):
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            types.add(LinkType(name))
+        except ValueError:
+            allowed = ', '.join(t.value for t in LinkType)
+            raise ValueError(f"Unknown link type '{name}', expected one of: {allowed}")
+    return types or None
+
 class ResourceType(str, Enum):
     """External resource types"""
     CONFLUENCE = "confluence"
@@ -26,6 +60,12 @@ class BaseLink(BaseModel):
 
 class TaskLink(BaseLink):
     """Internal task link model"""
+    JIRA_FIELDS: ClassVar[Dict[str, str]] = {
+        'id': 'issuelinks',
+        'type': 'issuelinks',
+        'target': 'issuelinks'
+    }
+
     type: LinkType = Field(..., description="Link type")
     target: str = Field(..., description="Target task key")
 
@@ -46,4 +86,42 @@ class CreateExternalLinkRequest(BaseModel):
     type: ResourceType = Field(..., description="Resource type")
     target: str = Field(..., description="Resource identifier")
     title: str = Field(..., description="Link title")
-    url: HttpUrl = Field(..., description="Resource URL")
\ No newline at end of file
+    url: HttpUrl = Field(..., description="Resource URL")
+
+class LinkGraphNode(BaseModel):
+    """Task reached by the traversal"""
+    key: str = Field(..., description="Task key")
+    depth: int = Field(..., description="Hops from the root task")
+
+class LinkGraphEdge(BaseModel):
+    """Link between two tasks, reported once in its active direction"""
+    source: str = Field(..., description="Source task key")
+    type: LinkType = Field(..., description="Link type")
+    target: str = Field(..., description="Target task key")
+
+class LinkGraph(BaseModel):
+    """Tasks linked to a root task, up to a depth"""
+    root: str = Field(..., description="Root task key")
+    depth: int = Field(..., description="Requested depth")
+    nodes: List[LinkGraphNode] = Field(default_factory=list, description="Tasks in breadth-first order")
+    edges: List[LinkGraphEdge] = Field(default_factory=list, description="Links between the tasks")
+    truncated: bool = Field(False, description="Node limit reached before the requested depth")
+
+class BulkTaskLinkRequest(CreateTaskLinkRequest):
+    """One link of a bulk create"""
+    source: str = Field(..., pattern=ISSUE_KEY.pattern, description="Source task key")
+    target: str = Field(..., pattern=ISSUE_KEY.pattern, description="Target task key")
+
+class BulkLinkResult(BaseModel):
+    """Outcome of one item of a bulk link create, `index` is its position in the request"""
+    index: int
+    status: str = Field(..., description="created | exists | failed")
+    id: Optional[str] = Field(None, description="JIRA link id")
+    error: Optional[str] = None
+    retry_after: Optional[float] = Field(None, description="Seconds to wait before retrying a failed item")
+
+class BulkCreateLinksResponse(BaseModel):
+    created: int
+    existing: int
+    failed: int
+    results: List[BulkLinkResult]
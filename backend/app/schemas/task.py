@@ -1,10 +1,24 @@
 from datetime import datetime
-from typing import Optional, List
-from pydantic import Field
+from typing import ClassVar, Dict, Optional, List
+from pydantic import BaseModel, Field
 from .base import BaseSchema
 
 class TaskSchema(BaseSchema):
+    # Only attributes the services fill are projected from JIRA
+    JIRA_FIELDS: ClassVar[Dict[str, str]] = BaseSchema.JIRA_FIELDS
+
     assignee: Optional[str] = None
     due_date: Optional[datetime] = None
     epic_key: Optional[str] = Field(None, pattern=r"[A-Z]+-\d+")
-    labels: List[str] = []
\ No newline at end of file
+    labels: List[str] = []
+
+class TaskBatchRequest(BaseModel):
+    """Body of POST /tasks/batch"""
+    keys: List[str] = Field(..., min_length=1, description="Issue keys, results keep this order")
+    fields: Optional[str] = Field(None, description="Comma-separated attributes to return")
+
+class TaskBatchItem(BaseModel):
+    """Result for one requested key"""
+    key: str
+    status: str = Field(..., description="ok | not_found | error")
+    task: Optional[TaskSchema] = None
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple, Union
+from app.core.config import get_settings
+from app.core.errors import UpstreamError
+from app.core.executor import run_blocking
+from app.core.logging import get_logger
+from app.core.ratelimit import Priority, request_priority
+from app.schemas.link import BulkLinkResult, BulkTaskLinkRequest, LinkType, TaskLink, canonical_edge
+from app.services.link_graph import get_links_of
+from app.services.links import LinksService
+
+logger = get_logger()
+
+Edge = Tuple[str, LinkType, str]
+
+def _link_ids(links: Dict[str, Union[List[TaskLink], None, Exception]]) -> Dict[Edge, str]:
+    """Ids of known links by canonical edge, so either end's copy matches"""
+    return {
+        canonical_edge(link.source, link.type, link.target): link.id
+        for task_links in links.values() if isinstance(task_links, list) for link in task_links
+    }
+
+def _failed(index: int, error: Exception) -> BulkLinkResult:
+    """Failed item; throttling and open circuits carry when to retry"""
+    retry_after = error.retry_after if isinstance(error, UpstreamError) else None
+    return BulkLinkResult(index=index, status="failed", error=str(error), retry_after=retry_after)
+
+async def create_links_bulk(
+    service: LinksService,
+    requests: List[BulkTaskLinkRequest],
+    concurrency: Optional[int] = None
+) -> List[BulkLinkResult]:
+    """
+    Create many task links, skipping ones that already exist
+
+    Links of all source tasks are read in one batched lookup; requested
+    links found there, or repeated in the request, are reported as
+    ``exists`` with their id. The rest are created with at most
+    ``concurrency`` calls in flight on the jira-write pool at bulk priority.
+    Ids JIRA does not return on create are read back with one more batched
+    lookup. Results are in request order, so an import can be re-run as is.
+    JIRA errors, throttling included, fail only their own item.
+    """
+    concurrency = max(1, concurrency or get_settings()['bulk_link_concurrency'])
+    known = await get_links_of([request.source for request in requests])
+    existing = _link_ids(known)
+
+    results: List[Optional[BulkLinkResult]] = [None] * len(requests)
+    first: Dict[Edge, int] = {}
+    to_create: List[int] = []
+    for index, request in enumerate(requests):
+        edge = canonical_edge(request.source, request.type, request.target)
+        if request.source == request.target:
+            results[index] = BulkLinkResult(index=index, status="failed", error="Task cannot link to itself")
+        elif known.get(request.source) is None:
+            results[index] = BulkLinkResult(index=index, status="failed", error=f"Task {request.source} not found")
+        elif isinstance(known[request.source], Exception):
+            results[index] = _failed(index, known[request.source])
+        elif edge in existing:
+            results[index] = BulkLinkResult(index=index, status="exists", id=existing[edge])
+        elif edge not in first:
+            first[edge] = index
+            to_create.append(index)
+
+    limit = asyncio.Semaphore(concurrency)
+
+    async def create(index: int) -> None:
+        request = requests[index]
+        try:
+            async with limit:
+                link_id = await run_blocking(
+                    service.add_task_link, request.source, request.type, request.target, upstream="jira-write"
+                )
+        except Exception as e:
+            # Links created so far stay reported, a retry of the failed ones is safe
+            logger.error(f"Error creating link {request.source} -> {request.target}: {str(e)}")
+            results[index] = _failed(index, e)
+            return
+        results[index] = BulkLinkResult(index=index, status="created", id=link_id)
+
+    with request_priority(Priority.BULK):
+        await asyncio.gather(*(create(index) for index in to_create))
+
+    unresolved = [index for index in to_create if results[index].status == "created" and results[index].id is None]
+    if unresolved:
+        # Creation dropped both ends from the cache, this reads them fresh
+        created = _link_ids(await get_links_of([requests[index].source for index in unresolved]))
+        for index in unresolved:
+            request = requests[index]
+            results[index].id = created.get(canonical_edge(request.source, request.type, request.target))
+
+    # Repeats within the request share the outcome of their first occurrence
+    for index, request in enumerate(requests):
+        if results[index] is None:
+            origin = results[first[canonical_edge(request.source, request.type, request.target)]]
+            status = "exists" if origin.status == "created" else origin.status
+            results[index] = BulkLinkResult(
+                index=index, status=status, id=origin.id, error=origin.error, retry_after=origin.retry_after
+            )
+
+    logger.info(
+        f"Bulk linked {sum(r.status == 'created' for r in results)} new, "
+        f"{sum(r.status == 'exists' for r in results)} existing of {len(requests)} links"
+    )
+    return results
@@ -0,0 +1,171 @@
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+from app.core.cache import get_cache
+from app.core.errors import UpstreamError
+from app.core.logging import get_logger
+from app.core.singleflight import get_flight
+from app.schemas.epic import BlockedTask, EpicAnalysis
+from app.schemas.link import LinkType
+from app.services.jira import epic_aggregate_jql, get_async_jira_client
+from app.services.search import iter_search
+
+logger = get_logger()
+
+ANALYSIS_FIELDS = ['issuelinks', 'timetracking', 'status']
+
+def is_done(issue) -> bool:
+    """Whether an issue (or linked issue stub) is in a done status category"""
+    status = getattr(issue.fields, 'status', None)
+    category = getattr(status, 'statusCategory', None)
+    return getattr(category, 'key', None) == 'done'
+
+def original_estimate_hours(issue) -> Optional[float]:
+    """Original estimate as set by TasksService through ``timetracking``"""
+    timetracking = getattr(issue.fields, 'timetracking', None)
+    seconds = getattr(timetracking, 'originalEstimateSeconds', None)
+    return seconds / 3600 if seconds is not None else None
+
+def blocking_links(issue) -> List[Tuple[str, str, bool]]:
+    """(blocker, blocked, blocker done) pairs from the issue's links"""
+    pairs = []
+    for link in getattr(issue.fields, 'issuelinks', None) or []:
+        if hasattr(link, 'outwardIssue') and link.type.outward == LinkType.BLOCKS.value:
+            pairs.append((issue.key, link.outwardIssue.key, is_done(issue)))
+        elif hasattr(link, 'inwardIssue') and link.type.inward == LinkType.BLOCKED_BY.value:
+            pairs.append((link.inwardIssue.key, issue.key, is_done(link.inwardIssue)))
+    return pairs
+
+class BlockingGraph:
+    """
+    Compact "blocks" graph of an epic's tasks
+
+    Tasks are numbered 0..n-1 and edges kept as integer successor lists,
+    with remaining estimates in a flat array, so ordering and path search
+    run in O(tasks + links) without touching JIRA.
+    """
+
+    def __init__(self, keys: List[str], remaining_hours: List[float]):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+        self.weights = array('d', remaining_hours)
+        self.successors: List[List[int]] = [[] for _ in keys]
+        self.indegree = array('l', [0] * len(keys))
+        self._edges: Set[Tuple[int, int]] = set()
+
+    def add_edge(self, blocker: str, blocked: str) -> None:
+        edge = (self.index[blocker], self.index[blocked])
+        # Both ends of a link report it
+        if edge in self._edges or edge[0] == edge[1]:
+            return
+        self._edges.add(edge)
+        self.successors[edge[0]].append(edge[1])
+        self.indegree[edge[1]] += 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+    def topological_order(self) -> List[int]:
+        """Kahn's algorithm; tasks on cycles are left out"""
+        indegree = array('l', self.indegree)
+        ready = deque(i for i in range(len(self.keys)) if not indegree[i])
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for successor in self.successors[node]:
+                indegree[successor] -= 1
+                if not indegree[successor]:
+                    ready.append(successor)
+        return order
+
+    def critical_path(self, order: List[int]) -> Tuple[List[int], float]:
+        """Heaviest chain by remaining hours (ties: more tasks) over the acyclic part"""
+        size = len(self.keys)
+        hours = array('d', self.weights)
+        length = array('l', [1] * size)
+        previous = array('l', [-1] * size)
+        for node in order:
+            for successor in self.successors[node]:
+                candidate = (hours[node] + self.weights[successor], length[node] + 1)
+                if candidate > (hours[successor], length[successor]):
+                    hours[successor], length[successor] = candidate
+                    previous[successor] = node
+        if not order:
+            return [], 0.0
+        end = max(order, key=lambda node: (hours[node], length[node]))
+        path = []
+        node = end
+        while node != -1:
+            path.append(node)
+            node = previous[node]
+        path.reverse()
+        return path, hours[end]
+
+def build_analysis(key: str, issues: List) -> EpicAnalysis:
+    """Analyze blocking links of the epic children among ``issues``"""
+    children = [issue for issue in issues if issue.key != key]
+    keys = [issue.key for issue in children]
+    done = {issue.key: is_done(issue) for issue in children}
+    estimates = {issue.key: original_estimate_hours(issue) for issue in children}
+    graph = BlockingGraph(keys, [0.0 if done[k] else (estimates[k] or 0.0) for k in keys])
+
+    # blocked task -> unresolved blockers, including ones outside the epic
+    waiting: Dict[str, Set[str]] = {}
+    for issue in children:
+        for blocker, blocked, blocker_done in blocking_links(issue):
+            if blocker in graph.index and blocked in graph.index:
+                graph.add_edge(blocker, blocked)
+                blocker_done = done[blocker]
+            if blocked in done and not done[blocked] and not blocker_done:
+                waiting.setdefault(blocked, set()).add(blocker)
+
+    order = graph.topological_order()
+    in_order = set(order)
+    path, path_hours = graph.critical_path(order)
+    return EpicAnalysis(
+        epic=key,
+        tasks=len(keys),
+        links=graph.edge_count,
+        order=[keys[i] for i in order],
+        critical_path=[keys[i] for i in path],
+        critical_path_hours=round(path_hours, 2),
+        blocked=[BlockedTask(key=task, blockers=sorted(blockers)) for task, blockers in sorted(waiting.items())],
+        cycles=[keys[i] for i in range(len(keys)) if i not in in_order],
+        unestimated=[k for k in keys if not done[k] and estimates[k] is None]
+    )
+
+async def analyze_epic(key: str) -> Optional[EpicAnalysis]:
+    """
+    Blocking-link analysis of an epic
+
+    The epic, its tasks, their links, estimates and statuses are read with
+    one paginated search; the result is cached like other epic reads.
+    Returns None if the epic does not exist.
+    """
+    cache = get_cache("epic_analysis", EpicAnalysis)
+    entry = cache.get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.value
+    return await get_flight("jira").do(("epic_analysis", key), lambda: _load_analysis(key))
+
+async def _load_analysis(key: str) -> Optional[EpicAnalysis]:
+    try:
+        issues = [
+            issue async for issue in iter_search(
+                get_async_jira_client(), epic_aggregate_jql(key), fields=ANALYSIS_FIELDS
+            )
+        ]
+    except UpstreamError:
+        raise
+    except Exception as e:
+        # JIRA rejects the epic link clause of a missing epic with 400
+        logger.error(f"Error loading epic {key} for analysis: {str(e)}")
+        return None
+    if not any(issue.key == key for issue in issues):
+        return None
+    analysis = build_analysis(key, issues)
+    get_cache("epic_analysis", EpicAnalysis).set(key, analysis)
+    logger.info(f"Analyzed epic {key}: {analysis.tasks} tasks, {analysis.links} blocking links")
+    return analysis
@@ -1,54 +1,120 @@
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional
 import requests
+from app.core.cache import get_cache
+from app.core.config import get_settings
+from app.core.errors import UpstreamError
+from app.core.singleflight import get_flight
 from app.schemas.link import ExternalLink, ResourceType
-from app.services.jira import get_jira_client
+from app.services.jira import get_async_jira_client, get_jira_client
+from app.services.mirror_store import get_read_mirror, mark_stale_in_mirror
 from app.core.logging import get_logger
 
 logger = get_logger()
 
+def determine_link_type(url: str) -> ResourceType:
+    """Determine resource type from URL"""
+    if 'confluence' in url.lower():
+        return ResourceType.CONFLUENCE
+    elif 'docs.google.com' in url.lower():
+        return ResourceType.GDOC
+    else:
+        return ResourceType.WEB
+
+def external_links_from_remote(task_key: str, remote_links) -> List[ExternalLink]:
+    """Convert JIRA remote links of a task to external links"""
+    links = []
+    for remote_link in remote_links:
+        # Extract URL and title from response
+        link_object = remote_link.raw.get('object', {})
+        url = link_object.get('url')
+        title = link_object.get('title')
+
+        logger.debug(f"Processing remote link: url={url}, title={title}")
+
+        if not url:
+            continue
+
+        links.append(ExternalLink(
+            id=str(remote_link.id),
+            type=determine_link_type(url),
+            source=task_key,
+            target=title or url,
+            title=title or url,
+            url=url
+        ))
+    return links
+
+async def get_external_links_for(keys: List[str]) -> Dict[str, List[ExternalLink]]:
+    """
+    Get external links of many tasks
+
+    The mirror and the external links cache answer first. JIRA has no batch
+    endpoint for remote links, so the rest are read one task per call with
+    at most ``remote_links_concurrency`` calls in flight. Tasks JIRA fails
+    to read (e.g. deleted meanwhile) get an empty list.
+    """
+    results: Dict[str, List[ExternalLink]] = {}
+    mirror = get_read_mirror()
+    cache = get_cache("external_links", List[ExternalLink])
+    missing = []
+    for key in dict.fromkeys(keys):
+        links = mirror.get_external_links(key) if mirror else None
+        if links is None:
+            entry = cache.get(key)
+            links = entry.value if entry is not None and entry.is_fresh() else None
+        if links is None:
+            missing.append(key)
+        else:
+            results[key] = links
+
+    limit = asyncio.Semaphore(get_settings()['remote_links_concurrency'])
+    client = get_async_jira_client()
+
+    async def fetch(key: str) -> None:
+        try:
+            async with limit:
+                remote_links = await get_flight("jira").do(("remote_links", key), lambda: client.remote_links(key))
+        except UpstreamError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting external links for task {key}: {str(e)}")
+            results[key] = []
+            return
+        results[key] = external_links_from_remote(key, remote_links)
+        cache.set(key, results[key])
+
+    await asyncio.gather(*(fetch(key) for key in missing))
+    return {key: results[key] for key in dict.fromkeys(keys)}
+
 class ExternalLinksService:
     """Service for managing external links"""
     
     def get_external_links(self, task_key: str) -> List[ExternalLink]:
         """Get all external links for a task"""
+        mirror = get_read_mirror()
+        links = mirror.get_external_links(task_key) if mirror else None
+        if links is not None:
+            return links
+
+        cache = get_cache("external_links", List[ExternalLink])
+        entry = cache.get(task_key)
+        if entry is not None and entry.is_fresh():
+            return entry.value
+
         try:
             client = get_jira_client()
-            # Get fresh issue data
-            issue = client.issue(task_key, fields=['remotelinks'])
-            
-            # Get remote links
-            remote_links = client.remote_links(issue)
+            # Remote links are read by issue key, no need to load the issue first
+            remote_links = client.remote_links(task_key)
             logger.debug(f"Remote links response: {[link.raw for link in remote_links]}")
             
-            if not remote_links:
-                logger.debug("No remote links found")
-                return []
-                
-            links = []
-            for remote_link in remote_links:
-                # Extract URL and title from response
-                link_object = remote_link.raw.get('object', {})
-                url = link_object.get('url')
-                title = link_object.get('title')
-                
-                logger.debug(f"Processing remote link: url={url}, title={title}")
-                
-                if not url:
-                    continue
-                    
-                link_type = self._determine_link_type(url)
-                links.append(ExternalLink(
-                    id=str(remote_link.id),
-                    type=link_type,
-                    source=task_key,
-                    target=title or url,
-                    title=title or url,
-                    url=url
-                ))
-            
+            links = external_links_from_remote(task_key, remote_links)
             logger.debug(f"Found {len(links)} external links")
+            cache.set(task_key, links)
             return links
             
+        except UpstreamError:
+            raise
         except Exception as e:
             logger.error(f"Error getting external links for task {task_key}: {str(e)}")
             logger.exception(e)  # Log full traceback
@@ -82,6 +148,9 @@ class ExternalLinksService:
                 }
             )
             
+            get_cache("external_links", List[ExternalLink]).delete(task_key)
+            mark_stale_in_mirror(task_key)
+            
             # Return ExternalLink object
             return ExternalLink(
                 id=str(remote_link.id),
@@ -92,6 +161,8 @@ class ExternalLinksService:
                 url=url
             )
             
+        except UpstreamError:
+            raise
         except Exception as e:
             logger.error(f"Error creating external link for task {task_key}: {str(e)}")
             logger.exception(e)
@@ -99,9 +170,4 @@ class ExternalLinksService:
             
     def _determine_link_type(self, url: str) -> ResourceType:
         """Determine resource type from URL"""
-        if 'confluence' in url.lower():
-            return ResourceType.CONFLUENCE
-        elif 'docs.google.com' in url.lower():
-            return ResourceType.GDOC
-        else:
-            return ResourceType.WEB
\ No newline at end of file
+        return determine_link_type(url)
@@ -1,79 +1,352 @@
+import asyncio
 from functools import lru_cache
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 from jira import JIRA
+from app.core.cache import Cache, CacheEntry, get_cache
 from app.core.config import get_settings
+from app.core.fields import field_id, get_field_resolver
+from app.core.breaker import get_circuit_breaker
+from app.core.errors import UpstreamError
+from app.core.ratelimit import get_rate_limiter
+from app.core.singleflight import get_flight
+from app.core.stale import with_last_known_good
+from app.schemas.base import build_partial, issue_key_order, jira_fields_for
 from app.schemas.task import TaskSchema
-from app.schemas.epic import EpicSchema
+from app.schemas.epic import EpicAggregate, EpicSchema
+from app.services.jira_transport import AsyncJiraClient, RateLimitedAdapter, SyncJiraFallback
+from app.services.mirror_store import get_read_mirror
+from app.services.search import iter_search, iter_search_pages
 
 @lru_cache()
 def get_jira_client() -> JIRA:
     settings = get_settings()
-    return JIRA(
+    client = JIRA(
         server=settings['jira_url'],
-        basic_auth=(settings['jira_user'], settings['jira_token'])
+        basic_auth=(settings['jira_user'], settings['jira_token']),
+        # Retries of throttled calls are left to the rate limiter
+        max_retries=0
     )
+    adapter = RateLimitedAdapter(get_rate_limiter(), get_circuit_breaker())
+    client._session.mount('https://', adapter)
+    client._session.mount('http://', adapter)
+    return client
 
-async def get_task(key: str) -> Optional[TaskSchema]:
+@lru_cache()
+def get_async_jira_client() -> Union[AsyncJiraClient, SyncJiraFallback]:
+    """Get shared awaitable JIRA client, falling back to the sync one if disabled"""
+    settings = get_settings()
+    if not settings['jira_async_transport']:
+        return SyncJiraFallback(get_jira_client())
+    return AsyncJiraClient(
+        server=settings['jira_url'],
+        basic_auth=(settings['jira_user'], settings['jira_token']),
+        max_connections=settings['jira_max_connections'],
+        max_keepalive=settings['jira_max_keepalive'],
+        timeout=settings['jira_timeout'],
+        http2=settings['jira_http2'],
+        rate_limiter=get_rate_limiter(),
+        breaker=get_circuit_breaker()
+    )
+
+async def close_async_jira_client() -> None:
+    """Release pooled connections of the shared async client"""
+    if get_async_jira_client.cache_info().currsize:
+        await get_async_jira_client().aclose()
+        get_async_jira_client.cache_clear()
+
+def epic_aggregate_fields() -> List[str]:
+    """Fields needed to build an epic and its tasks from one search"""
+    return list(dict.fromkeys(jira_fields_for(EpicSchema) + jira_fields_for(TaskSchema)))
+
+def epic_tasks_jql(key: str) -> str:
+    """JQL for epic children, ordered so that pages are stable"""
+    epic_link = get_field_resolver().jql_ref('epic_link')
+    return f'{epic_link} = {key} AND issuetype = Engineer ORDER BY key ASC'
+
+def epic_aggregate_jql(key: str) -> str:
+    """JQL matching the epic itself and its children in one search"""
+    epic_link = get_field_resolver().jql_ref('epic_link')
+    return f'key = {key} OR ({epic_link} = {key} AND issuetype = Engineer) ORDER BY key ASC'
+
+def task_from_issue(issue) -> TaskSchema:
+    return TaskSchema(
+        key=issue.key,
+        summary=issue.fields.summary,
+        description=issue.fields.description,
+        created=issue.fields.created,
+        updated=issue.fields.updated
+    )
+
+def partial_task_from_issue(issue, fields: Set[str]) -> TaskSchema:
+    """Build task with only the requested attributes"""
+    values = {
+        name: getattr(issue.fields, TaskSchema.JIRA_FIELDS[name], None)
+        for name in fields if name in TaskSchema.JIRA_FIELDS
+    }
+    return build_partial(TaskSchema, {'key': issue.key, **values})
+
+def get_task_cache() -> Cache:
+    """Get shared cache of tasks keyed by issue key"""
+    return get_cache("task", TaskSchema, ttl=get_settings()['task_cache_ttl'])
+
+async def get_task(key: str, fields: Optional[Set[str]] = None) -> Optional[TaskSchema]:
+    """
+    Get task by key
+
+    With ``fields`` (schema attribute names) only those attributes are
+    requested from JIRA and the returned task is partial.
+    """
+    mirror = get_read_mirror()
+    task = mirror.get_task(key) if mirror else None
+    if task is not None:
+        if fields is not None:
+            return build_partial(TaskSchema, task.model_dump(include=fields))
+        return task
+
+    cache = get_task_cache()
+    entry = cache.get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.value
+
+    # Concurrent requests for the same task share one upstream call;
+    # while JIRA fails the last successful read is served as stale
+    flight_key = ("task", key, frozenset(fields) if fields is not None else None)
+    return await with_last_known_good(
+        flight_key,
+        lambda: get_flight("jira").do(flight_key, lambda: _fetch_task(key, fields, entry))
+    )
+
+async def _fetch_task(key: str, fields: Optional[Set[str]], entry: Optional[CacheEntry]) -> Optional[TaskSchema]:
+    """Read task from JIRA, revalidating a stale cache entry if there is one"""
+    cache = get_task_cache()
+    try:
+        client = get_async_jira_client()
+
+        # Stale entry: fetch only `updated` and keep cached task if unchanged
+        if entry is not None:
+            probe = await client.issue(key, fields=['updated'])
+            if str(probe.fields.updated) == entry.version:
+                cache.touch(key, entry)
+                return entry.value
+
+        if fields is not None:
+            issue = await client.issue(key, fields=jira_fields_for(TaskSchema, fields))
+            return partial_task_from_issue(issue, fields)
+
+        issue = await client.issue(key, fields=jira_fields_for(TaskSchema))
+        task = task_from_issue(issue)
+        cache.set(key, task, version=str(issue.fields.updated))
+        return task
+    except UpstreamError:
+        # Throttled or unavailable is not "not found"
+        raise
+    except Exception as e:
+        return None
+
+async def get_tasks(
+    keys: List[str],
+    fields: Optional[Set[str]] = None
+) -> Dict[str, Union[TaskSchema, None, Exception]]:
+    """
+    Get many tasks by key
+
+    Keys served by the mirror or fresh cache entries are answered locally;
+    the rest are read with ``key in (...)`` searches of at most
+    ``batch_chunk_size`` keys, run concurrently. The result maps every key
+    to its task, None if JIRA does not have it, or the error of its chunk.
+    """
+    results: Dict[str, Union[TaskSchema, None, Exception]] = {}
+    mirror = get_read_mirror()
+    cache = get_task_cache()
+    missing = []
+    for key in dict.fromkeys(keys):
+        task = mirror.get_task(key) if mirror else None
+        if task is None:
+            entry = cache.get(key)
+            task = entry.value if entry is not None and entry.is_fresh() else None
+        if task is None:
+            missing.append(key)
+        elif fields is not None:
+            results[key] = build_partial(TaskSchema, task.model_dump(include=fields))
+        else:
+            results[key] = task
+
+    settings = get_settings()
+    chunk_size = settings['batch_chunk_size']
+    limit = asyncio.Semaphore(settings['search_concurrency'])
+    projection = jira_fields_for(TaskSchema, fields) if fields is not None else jira_fields_for(TaskSchema)
+    client = get_async_jira_client()
+
+    async def fetch_chunk(chunk: List[str]) -> None:
+        # Unknown keys would fail a validated query, unvalidated ones just drop them
+        jql = f'key in ({", ".join(chunk)})'
+        try:
+            async with limit:
+                issues = await get_flight("jira").do(
+                    ("search", jql, frozenset(fields) if fields is not None else None),
+                    lambda: client.search_issues(jql, maxResults=len(chunk), validate_query=False, fields=projection)
+                )
+        except Exception as e:
+            print(f"Error in get_tasks: {str(e)}")
+            results.update({key: e for key in chunk})
+            return
+
+        found = {}
+        for issue in issues:
+            if fields is not None:
+                found[issue.key] = partial_task_from_issue(issue, fields)
+            else:
+                found[issue.key] = task_from_issue(issue)
+                cache.set(issue.key, found[issue.key], version=str(issue.fields.updated))
+        results.update({key: found.get(key) for key in chunk})
+
+    await asyncio.gather(*(
+        fetch_chunk(missing[start:start + chunk_size]) for start in range(0, len(missing), chunk_size)
+    ))
+    return results
+
+async def load_epic_aggregate(key: str) -> Optional[EpicAggregate]:
+    """
+    Load epic and its children with a single paginated search
+
+    The result is cached, so /epics/{key} and /epics/{key}/tasks rendered
+    for the same page share one upstream round-trip.
+    """
+    mirror = get_read_mirror()
+    aggregate = mirror.get_epic_aggregate(key) if mirror else None
+    if aggregate is not None:
+        return aggregate
+
+    entry = get_cache("epic_aggregate", EpicAggregate).get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.value
+
+    flight_key = ("epic_aggregate", key)
+    return await with_last_known_good(
+        flight_key,
+        lambda: get_flight("jira").do(flight_key, lambda: _fetch_epic_aggregate(key))
+    )
+
+async def _fetch_epic_aggregate(key: str) -> Optional[EpicAggregate]:
+    """Search epic and its children and cache the aggregate"""
     try:
-        client = get_jira_client()
-        issue = client.issue(key)
-        return TaskSchema(
-            key=issue.key,
-            summary=issue.fields.summary,
-            description=issue.fields.description,
-            created=issue.fields.created,
-            updated=issue.fields.updated
+        client = get_async_jira_client()
+        epic = None
+        tasks = []
+        async for issue in iter_search(client, epic_aggregate_jql(key), fields=epic_aggregate_fields()):
+            if issue.key == key:
+                epic = issue
+            else:
+                tasks.append(task_from_issue(issue))
+
+        if epic is None:
+            return None
+
+        tasks.sort(key=lambda task: issue_key_order(task.key))
+        result = EpicAggregate(
+            epic=EpicSchema(
+                key=epic.key,
+                name=getattr(epic.fields, field_id('epic_name') or '', None),
+                summary=epic.fields.summary,
+                description=epic.fields.description,
+                created=epic.fields.created,
+                updated=epic.fields.updated,
+                tasks=[task.key for task in tasks]
+            ),
+            tasks=tasks
         )
+        get_cache("epic_aggregate", EpicAggregate).set(key, result)
+        return result
+    except UpstreamError:
+        raise
     except Exception as e:
+        print(f"Error in load_epic_aggregate: {str(e)}")
         return None
 
 async def get_epic(key: str) -> Optional[EpicSchema]:
+    aggregate = await load_epic_aggregate(key)
+    return aggregate.epic if aggregate else None
+
+async def get_epic_tasks(key: str) -> Optional[List[TaskSchema]]:
+    aggregate = await load_epic_aggregate(key)
+    return aggregate.tasks if aggregate else None
+
+async def get_epic_tasks_page(
+    key: str,
+    start_at: int = 0,
+    limit: int = 50
+) -> Optional[Tuple[List[TaskSchema], Optional[int]]]:
+    """Get one page of epic tasks and the offset of the next page, if any"""
+    # Served from the mirror or from the aggregate when the epic page was just loaded
+    mirror = get_read_mirror()
+    aggregate = mirror.get_epic_aggregate(key) if mirror else None
+    if aggregate is None:
+        entry = get_cache("epic_aggregate", EpicAggregate).get(key)
+        if entry is not None and entry.is_fresh():
+            aggregate = entry.value
+    if aggregate is not None:
+        all_tasks = aggregate.tasks
+        next_start = start_at + limit if start_at + limit < len(all_tasks) else None
+        return all_tasks[start_at:start_at + limit], next_start
+
     try:
-        client = get_jira_client()
-        epic = client.issue(key)
-        
-        # Get epic name from customfield_10604
-        epic_name = getattr(epic.fields, 'customfield_10604', None)
-        
-        # Get linked tasks using Epic Link field with epic key
-        tasks = client.search_issues(
-            f'"Epic Link" = {key} AND issuetype = Engineer',
-            maxResults=50
-        )
-        task_keys = [task.key for task in tasks]
-        
-        return EpicSchema(
-            key=epic.key,
-            name=epic_name,
-            summary=epic.fields.summary,
-            description=epic.fields.description,
-            created=epic.fields.created,
-            updated=epic.fields.updated,
-            tasks=task_keys
+        return await with_last_known_good(
+            ("epic_tasks_page", key, start_at, limit),
+            lambda: _fetch_epic_tasks_page(key, start_at, limit)
         )
+    except UpstreamError:
+        raise
     except Exception as e:
-        print(f"Error in get_epic: {str(e)}")
+        print(f"Error in get_epic_tasks_page: {str(e)}")
         return None
 
-async def get_epic_tasks(key: str) -> Optional[List[TaskSchema]]:
+async def _fetch_epic_tasks_page(key: str, start_at: int, limit: int) -> Tuple[List[TaskSchema], Optional[int]]:
+    client = get_async_jira_client()
+    jql = epic_tasks_jql(key)
+    page = await get_flight("jira").do(
+        ("search", jql, start_at, limit),
+        lambda: client.search_issues(jql, startAt=start_at, maxResults=limit, fields=jira_fields_for(TaskSchema))
+    )
+    tasks = [task_from_issue(task) for task in page]
+    next_start = start_at + len(page)
+    return tasks, next_start if page and next_start < page.total else None
+
+async def open_epic_task_stream(key: str) -> Optional[AsyncIterator[List[TaskSchema]]]:
+    """
+    Start streaming epic tasks page by page
+
+    The first page is fetched eagerly so a missing epic is reported as None
+    before any response bytes are sent.
+    """
+    mirror = get_read_mirror()
+    aggregate = mirror.get_epic_aggregate(key) if mirror else None
+    if aggregate is not None:
+        async def mirrored() -> AsyncIterator[List[TaskSchema]]:
+            size = get_settings()['search_page_size']
+            for start in range(0, len(aggregate.tasks), size):
+                yield aggregate.tasks[start:start + size]
+        return mirrored()
+
     try:
-        client = get_jira_client()
-        
-        # Search tasks using Epic Link field with epic key
-        tasks = client.search_issues(
-            f'"Epic Link" = {key} AND issuetype = Engineer',
-            maxResults=50
+        pages = iter_search_pages(
+            get_async_jira_client(),
+            epic_tasks_jql(key),
+            fields=jira_fields_for(TaskSchema)
         )
-        return [
-            TaskSchema(
-                key=task.key,
-                summary=task.fields.summary,
-                description=task.fields.description,
-                created=task.fields.created,
-                updated=task.fields.updated
-            ) 
-            for task in tasks
-        ]
+        first = await pages.__anext__()
+    except UpstreamError:
+        raise
     except Exception as e:
-        print(f"Error in get_epic_tasks: {str(e)}")
-        return None
\ No newline at end of file
+        print(f"Error in open_epic_task_stream: {str(e)}")
+        return None
+
+    async def stream() -> AsyncIterator[List[TaskSchema]]:
+        try:
+            yield [task_from_issue(task) for task in first]
+            async for page in pages:
+                yield [task_from_issue(task) for task in page]
+        finally:
+            # Cancel in-flight page requests if the client goes away
+            await pages.aclose()
+
+    return stream()
\ No newline at end of file
@@ -0,0 +1,236 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+import httpx
+from jira import JIRA
+from jira.client import ResultList
+from jira.resources import Issue, RemoteLink
+import requests
+from requests.adapters import HTTPAdapter
+from app.core.breaker import CircuitBreaker
+from app.core.errors import UpstreamError
+from app.core.executor import run_blocking
+from app.core.logging import get_logger
+from app.core.ratelimit import AdaptiveRateLimiter
+
+logger = get_logger()
+
+Fields = Optional[Union[str, List[str]]]
+
+def http2_available() -> bool:
+    """Check whether the optional ``h2`` package is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _call_failed(status_code: int) -> Optional[bool]:
+    """Breaker outcome of a response; throttling is left to the rate limiter"""
+    if status_code == 429:
+        return None
+    return status_code >= 500
+
+def _fields_param(fields: Fields) -> Optional[str]:
+    """Normalize a field list to JIRA's comma-separated form"""
+    if fields is None or isinstance(fields, str):
+        return fields
+    return ','.join(fields)
+
+class AsyncJiraClient:
+    """
+    Non-blocking JIRA REST client
+
+    Keeps one pooled set of keep-alive connections (HTTP/2 when ``h2`` is
+    installed) and returns the same ``Issue``/``ResultList`` objects as
+    ``jira.JIRA``, so services only have to ``await`` the calls.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        basic_auth: Tuple[str, str],
+        max_connections: int = 100,
+        max_keepalive: int = 20,
+        timeout: float = 30.0,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.server = server.rstrip('/')
+        self.rate_limiter = rate_limiter
+        self.breaker = breaker
+        use_http2 = http2 and http2_available()
+        if http2 and not use_http2:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+
+        # Options consumed by jira.resources when parsing raw JSON
+        self._options: Dict[str, Any] = {
+            **JIRA.DEFAULT_OPTIONS,
+            'server': self.server
+        }
+        self._http = httpx.AsyncClient(
+            base_url=f"{self.server}/rest/api/2",
+            auth=basic_auth,
+            http2=use_http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive
+            ),
+            timeout=timeout,
+            headers={'Accept': 'application/json'},
+            transport=transport
+        )
+
+    async def _attempt(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """One HTTP call, counted by the circuit breaker"""
+        if self.breaker is None:
+            return await self._http_request(method, path, **kwargs)
+        with self.breaker.call() as call:
+            response = await self._http_request(method, path, **kwargs)
+            call.failed = _call_failed(response.status_code)
+        return response
+
+    async def _http_request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        try:
+            return await self._http.request(method, path, **kwargs)
+        except httpx.TransportError as e:
+            raise UpstreamError(f"JIRA request {method} {path} failed: {str(e)}") from e
+
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send through the rate limiter, retrying throttled calls"""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await self._attempt(method, path, **kwargs)
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            response = await self._attempt(method, path, **kwargs)
+            delay = limiter.observe(response.status_code, response.headers, attempt)
+            if delay is None:
+                return response
+            limiter.retry(response.status_code, delay, attempt)
+            logger.warning(f"JIRA responded {response.status_code} to {method} {path}, retrying in {delay:.1f}s")
+            attempt += 1
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        response = await self._send(method, path, **kwargs)
+        # JIRA failing is not an answer about the resource
+        if response.status_code >= 500:
+            raise UpstreamError(f"JIRA responded {response.status_code} to {method} {path}")
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    async def issue(self, key: str, fields: Fields = None) -> Issue:
+        """Get single issue, optionally limited to ``fields``"""
+        params = {}
+        if fields is not None:
+            params['fields'] = _fields_param(fields)
+        raw = await self._request('GET', f'/issue/{key}', params=params)
+        return Issue(self._options, None, raw=raw)
+
+    async def search_issues(
+        self,
+        jql_str: str,
+        startAt: int = 0,
+        maxResults: int = 50,
+        validate_query: bool = True,
+        fields: Fields = None
+    ) -> ResultList:
+        """Run JQL search and return one page of issues"""
+        payload: Dict[str, Any] = {
+            'jql': jql_str,
+            'startAt': startAt,
+            'maxResults': maxResults,
+            'validateQuery': validate_query
+        }
+        if fields is not None:
+            payload['fields'] = fields.split(',') if isinstance(fields, str) else list(fields)
+        raw = await self._request('POST', '/search', json=payload)
+        issues = [Issue(self._options, None, raw=item) for item in raw.get('issues', [])]
+        return ResultList(
+            issues,
+            raw.get('startAt', startAt),
+            raw.get('maxResults', maxResults),
+            raw.get('total')
+        )
+
+    async def remote_links(self, key: str) -> List[RemoteLink]:
+        """Get remote (external) links of an issue"""
+        raw = await self._request('GET', f'/issue/{key}/remotelink')
+        return [RemoteLink(self._options, None, raw=item) for item in raw or []]
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self._http.aclose()
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter of the sync ``jira.JIRA`` session sharing the async client's limiter and breaker"""
+
+    def __init__(self, rate_limiter: AdaptiveRateLimiter, breaker: Optional[CircuitBreaker] = None, **kwargs):
+        self.rate_limiter = rate_limiter
+        self.breaker = breaker
+        super().__init__(**kwargs)
+
+    def _http_send(self, request, **kwargs):
+        try:
+            return super().send(request, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise UpstreamError(f"JIRA request {request.method} {request.url} failed: {str(e)}") from e
+
+    def _attempt(self, request, **kwargs):
+        if self.breaker is None:
+            return self._http_send(request, **kwargs)
+        with self.breaker.call() as call:
+            response = self._http_send(request, **kwargs)
+            call.failed = _call_failed(response.status_code)
+        return response
+
+    def send(self, request, **kwargs):
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            limiter.acquire_sync()
+            response = self._attempt(request, **kwargs)
+            delay = limiter.observe(response.status_code, response.headers, attempt)
+            if delay is not None:
+                limiter.retry(response.status_code, delay, attempt)
+                logger.warning(f"JIRA responded {response.status_code} to {request.method} {request.url}, retrying in {delay:.1f}s")
+                response.close()
+                attempt += 1
+                continue
+            if response.status_code >= 500:
+                response.close()
+                raise UpstreamError(f"JIRA responded {response.status_code} to {request.method} {request.url}")
+            return response
+
+class SyncJiraFallback:
+    """Awaitable facade over the blocking ``jira.JIRA`` client, offloaded to the jira pool"""
+
+    def __init__(self, client: JIRA):
+        self._client = client
+
+    async def issue(self, key: str, fields: Fields = None) -> Issue:
+        return await run_blocking(self._client.issue, key, fields=_fields_param(fields))
+
+    async def search_issues(
+        self,
+        jql_str: str,
+        startAt: int = 0,
+        maxResults: int = 50,
+        validate_query: bool = True,
+        fields: Fields = None
+    ) -> ResultList:
+        return await run_blocking(
+            self._client.search_issues,
+            jql_str,
+            startAt=startAt,
+            maxResults=maxResults,
+            validate_query=validate_query,
+            fields=fields if fields is not None else '*all'
+        )
+
+    async def remote_links(self, key: str) -> List[RemoteLink]:
+        return await run_blocking(self._client.remote_links, key)
+
+    async def aclose(self) -> None:
+        """Sync client owns its session, nothing to release"""
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import math
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from app.core.config import get_settings
+from app.core.executor import run_blocking
+from app.core.files import atomic_write_text
+from app.core.logging import get_logger
+from app.core.ratelimit import Priority, request_priority
+from app.core.stale import mark_response_stale
+from app.schemas.base import jira_fields_for
+from app.schemas.label import LabelSchema
+from app.services.jira import get_async_jira_client
+from app.services.search import iter_search
+
+logger = get_logger()
+
+class LabelIndex:
+    """
+    Inverted label -> issue keys index for one project
+
+    Built once by a paginated scan, then kept current with
+    ``updated >= -Nm`` searches and persisted as a JSON snapshot, so label
+    lookups never scan the project. Full scans run in the background (see
+    ``rebuild_label_index_periodically``); requests only wait for one when
+    there is no index to serve yet.
+    """
+
+    # Re-read a little more than the gap since the last sync
+    SYNC_OVERLAP_MINUTES = 2
+
+    def __init__(self, project: str, path: Optional[str] = None):
+        self.project = project
+        self.path = Path(path) if path else None
+        # issue key -> {"labels": [...], "created": ..., "updated": ...}
+        self._issues: Dict[str, Dict[str, Any]] = {}
+        self._labels: Dict[str, Set[str]] = {}
+        self._summaries: Dict[str, LabelSchema] = {}
+        self.last_sync: Optional[float] = None
+        self.last_full_sync: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._rebuild: Optional[asyncio.Future] = None
+
+    def load(self) -> None:
+        """Restore index from snapshot, if present"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            snapshot = json.loads(self.path.read_text(encoding='utf-8'))
+            if snapshot.get('project') != self.project:
+                return
+            for key, issue in snapshot['issues'].items():
+                self._apply(key, issue['labels'], issue['created'], issue['updated'])
+            self.last_sync = snapshot['last_sync']
+            self.last_full_sync = snapshot['last_full_sync']
+            logger.info(f"Loaded label index for {self.project}: {len(self._labels)} labels")
+        except Exception as e:
+            logger.error(f"Error loading label index {self.path}: {str(e)}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state for ``save``; issue entries are replaced, never mutated, so a shallow copy is enough"""
+        return {
+            'project': self.project,
+            'last_sync': self.last_sync,
+            'last_full_sync': self.last_full_sync,
+            'issues': dict(self._issues)
+        }
+
+    def save(self, snapshot: Optional[Dict[str, Any]] = None) -> None:
+        """Write snapshot atomically; blocking, see ``sync``"""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, json.dumps(snapshot or self.snapshot(), default=str))
+
+    def _apply(self, key: str, labels: List[str], created: Any, updated: Any) -> None:
+        """Replace labels of one issue in the index"""
+        previous = self._issues.get(key)
+        old_labels = set(previous['labels']) if previous else set()
+        new_labels = set(labels)
+
+        for label in old_labels - new_labels:
+            keys = self._labels.get(label)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._labels[label]
+        for label in new_labels - old_labels:
+            self._labels.setdefault(label, set()).add(key)
+
+        if new_labels:
+            self._issues[key] = {'labels': sorted(new_labels), 'created': created, 'updated': updated}
+        else:
+            self._issues.pop(key, None)
+
+        # Dates of an issue may change even if its labels did not
+        for label in old_labels | new_labels:
+            self._summaries.pop(label, None)
+
+    async def sync(self, client: Any, full: bool = False) -> int:
+        """Pull changed issues from JIRA; returns number of issues applied"""
+        started = time.time()
+        # Key order does not shift while issues are updated, so no page skips an issue
+        if full or self.last_sync is None:
+            jql = f'project = {self.project} AND labels IS NOT EMPTY ORDER BY key ASC'
+        else:
+            minutes = math.ceil((started - self.last_sync) / 60) + self.SYNC_OVERLAP_MINUTES
+            jql = f'project = {self.project} AND updated >= -{minutes}m ORDER BY key ASC'
+
+        # Collect first so a failed scan leaves the index untouched
+        issues = [issue async for issue in iter_search(client, jql, fields=jira_fields_for(LabelSchema))]
+
+        if full or self.last_sync is None:
+            for key in list(self._issues):
+                self._apply(key, [], None, None)
+            self.last_full_sync = started
+        for issue in issues:
+            self._apply(issue.key, list(issue.fields.labels or []), issue.fields.created, issue.fields.updated)
+        self.last_sync = started
+
+        await run_blocking(self.save, self.snapshot(), upstream="label_index")
+        logger.info(f"Label index for {self.project} synced: {len(issues)} issues, {len(self._labels)} labels")
+        return len(issues)
+
+    def needs_rebuild(self) -> bool:
+        """Whether the index was never fully built or its full rebuild is due"""
+        return (
+            self.last_full_sync is None
+            or time.time() - self.last_full_sync >= get_settings()['label_index_full_rebuild']
+        )
+
+    async def rebuild(self, client: Any) -> None:
+        """Full scan, shared by everyone asking while one is running"""
+        if self._rebuild is None or self._rebuild.done():
+            self._rebuild = asyncio.ensure_future(self.sync(client, full=True))
+        await asyncio.shield(self._rebuild)
+
+    async def ensure_fresh(self, client: Any) -> None:
+        """Apply recent changes if the index is older than the refresh interval"""
+        if self.last_sync is None:
+            # Nothing to serve yet, wait for the first build
+            await self.rebuild(client)
+            return
+        if self._rebuild is not None and not self._rebuild.done():
+            # The running rebuild re-reads everything anyway
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if time.time() - self.last_sync < get_settings()['label_index_refresh']:
+                return
+            try:
+                await self.sync(client)
+            except Exception as e:
+                # Serve the last indexed state rather than failing the request
+                logger.error(f"Label index sync failed, serving stale index: {str(e)}")
+                mark_response_stale()
+
+    def get(self, label: str) -> Optional[LabelSchema]:
+        """Get label summary"""
+        summary = self._summaries.get(label)
+        if summary is not None:
+            return summary
+        keys = self._labels.get(label)
+        if not keys:
+            return None
+        issues = [self._issues[key] for key in sorted(keys)]
+        summary = LabelSchema(
+            key=label,
+            name=label.capitalize(),
+            created=min((issue['created'] for issue in issues), key=str),
+            updated=max((issue['updated'] for issue in issues), key=str),
+            used_in=sorted(keys)
+        )
+        self._summaries[label] = summary
+        return summary
+
+    def all(self) -> List[LabelSchema]:
+        """Get summaries of all labels"""
+        return [self.get(label) for label in sorted(self._labels)]
+
+@lru_cache()
+def get_label_index() -> LabelIndex:
+    """Get process-wide index of the configured project, restored from snapshot"""
+    settings = get_settings()
+    index = LabelIndex(settings['jira_project'], settings['label_index_path'])
+    index.load()
+    return index
+
+async def rebuild_label_index_periodically(index: LabelIndex) -> None:
+    """Build the index now if due, then rebuild it every LABEL_INDEX_FULL_REBUILD seconds"""
+    while True:
+        if index.needs_rebuild():
+            try:
+                with request_priority(Priority.BACKGROUND):
+                    await index.rebuild(get_async_jira_client())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Label index rebuild of {index.project} failed: {str(e)}")
+        await asyncio.sleep(get_settings()['label_index_refresh'])
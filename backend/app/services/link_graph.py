@@ -0,0 +1,133 @@
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple, Union
+from app.core.cache import get_cache
+from app.core.config import get_settings
+from app.core.errors import UpstreamError
+from app.core.logging import get_logger
+from app.core.singleflight import get_flight
+from app.schemas.base import ISSUE_KEY, jira_fields_for
+from app.schemas.link import LinkGraph, LinkGraphEdge, LinkGraphNode, LinkType, TaskLink, canonical_edge
+from app.services.jira import get_async_jira_client
+from app.services.links import task_links_from_issue
+from app.services.mirror_store import get_read_mirror
+
+logger = get_logger()
+
+async def get_links_of(keys: List[str]) -> Dict[str, Union[List[TaskLink], None, Exception]]:
+    """
+    Get direct links of many tasks
+
+    The mirror and the links cache (shared with ``LinksService``) answer
+    first; the rest are read with concurrent ``key in (...)`` searches of at
+    most ``batch_chunk_size`` keys. The result maps every key to its links,
+    None if JIRA does not have it (or it is not an issue key), or the error
+    of its chunk.
+    """
+    results: Dict[str, Union[List[TaskLink], None, Exception]] = {}
+    mirror = get_read_mirror()
+    cache = get_cache("links", List[TaskLink])
+    missing = []
+    for key in dict.fromkeys(keys):
+        if not ISSUE_KEY.match(key):
+            # Keys go into JQL unquoted, anything else could change the query
+            results[key] = None
+            continue
+        links = mirror.get_task_links(key) if mirror else None
+        if links is None:
+            entry = cache.get(key)
+            links = entry.value if entry is not None and entry.is_fresh() else None
+        if links is None:
+            missing.append(key)
+        else:
+            results[key] = links
+
+    settings = get_settings()
+    chunk_size = settings['batch_chunk_size']
+    limit = asyncio.Semaphore(settings['search_concurrency'])
+    client = get_async_jira_client()
+
+    async def fetch_chunk(chunk: List[str]) -> None:
+        jql = f'key in ({", ".join(chunk)})'
+        try:
+            async with limit:
+                issues = await get_flight("jira").do(
+                    ("links", jql),
+                    lambda: client.search_issues(
+                        jql, maxResults=len(chunk), validate_query=False, fields=jira_fields_for(TaskLink)
+                    )
+                )
+        except Exception as e:
+            logger.error(f"Error getting links of {len(chunk)} tasks: {str(e)}")
+            results.update({key: e for key in chunk})
+            return
+
+        found = {}
+        for issue in issues:
+            found[issue.key] = task_links_from_issue(issue.key, issue)
+            cache.set(issue.key, found[issue.key])
+        results.update({key: found.get(key) for key in chunk})
+
+    await asyncio.gather(*(
+        fetch_chunk(missing[start:start + chunk_size]) for start in range(0, len(missing), chunk_size)
+    ))
+    return results
+
+async def get_link_graph(
+    key: str,
+    depth: int,
+    types: Optional[Set[LinkType]] = None,
+    max_nodes: Optional[int] = None
+) -> Optional[LinkGraph]:
+    """
+    Expand links of a task breadth-first, up to ``depth`` hops
+
+    Each level is read with one batched lookup; only links of ``types`` (as
+    seen from the task being expanded) are followed. Every task is expanded
+    once, so cycles end the walk instead of looping. Tasks whose links
+    could not be read are kept as leaves and mark the graph truncated.
+    Returns None if the root task does not exist.
+    """
+    max_nodes = max_nodes or get_settings()['link_graph_max_nodes']
+    depths: Dict[str, int] = {key: 0}
+    edges: Dict[Tuple[str, LinkType, str], LinkGraphEdge] = {}
+    truncated = False
+    frontier = [key]
+
+    for level in range(depth):
+        if not frontier:
+            break
+        links = await get_links_of(frontier)
+        if level == 0:
+            if links.get(key) is None:
+                return None
+            if isinstance(links[key], UpstreamError):
+                raise links[key]
+
+        next_frontier = []
+        for source in frontier:
+            source_links = links.get(source)
+            if isinstance(source_links, Exception):
+                truncated = True
+                continue
+            for link in source_links or []:
+                if types and link.type not in types:
+                    continue
+                if link.target not in depths:
+                    if len(depths) >= max_nodes:
+                        truncated = True
+                        continue
+                    depths[link.target] = level + 1
+                    next_frontier.append(link.target)
+                edge = canonical_edge(source, link.type, link.target)
+                if edge not in edges:
+                    edges[edge] = LinkGraphEdge(source=edge[0], type=edge[1], target=edge[2])
+        frontier = next_frontier
+
+    logger.debug(f"Link graph of {key}: {len(depths)} tasks, {len(edges)} links")
+    return LinkGraph(
+        root=key,
+        depth=depth,
+        nodes=[LinkGraphNode(key=node, depth=node_depth) for node, node_depth in depths.items()],
+        edges=list(edges.values()),
+        truncated=truncated
+    )
@@ -1,66 +1,116 @@
+import re
 from typing import List, Optional
 from datetime import datetime
-from app.schemas.link import TaskLink, LinkType
+from app.core.cache import get_cache
+from app.core.errors import UpstreamError
+from app.schemas.base import jira_fields_for
+from app.schemas.link import TaskLink, LinkType, canonical_edge
 from app.services.jira import get_jira_client
+from app.services.mirror_store import get_read_mirror, mark_stale_in_mirror
 from app.core.logging import get_logger
 
 logger = get_logger()
 
+_LINK_ID = re.compile(r'/issueLink/(\d+)')
+
+def link_id_from_response(response) -> Optional[str]:
+    """Id of a created issue link from the ``Location`` JIRA may send, None if absent"""
+    headers = getattr(response, 'headers', None) or {}
+    match = _LINK_ID.search(headers.get('Location') or '')
+    return match.group(1) if match else None
+
+def task_links_from_issue(task_key: str, issue) -> List[TaskLink]:
+    """Convert issuelinks of a JIRA issue to task links, skipping types without a LinkType"""
+    links = []
+    for link in issue.fields.issuelinks:
+        # Get target issue and link type
+        if hasattr(link, "outwardIssue"):
+            target = link.outwardIssue
+            link_type = link.type.outward
+        elif hasattr(link, "inwardIssue"):
+            target = link.inwardIssue
+            link_type = link.type.inward
+        else:
+            continue
+        if link_type not in LinkType._value2member_map_:
+            # Types like "clones" have no internal counterpart
+            logger.debug(f"Skipping link {link.id} of {task_key} with unknown type {link_type!r}")
+            continue
+
+        links.append(TaskLink(
+            id=str(link.id),
+            type=link_type,
+            source=task_key,
+            target=target.key
+        ))
+    return links
+
 class LinksService:
     """Service for managing task links"""
     
     def get_task_links(self, task_key: str) -> List[TaskLink]:
         """Get all links for a task"""
+        mirror = get_read_mirror()
+        links = mirror.get_task_links(task_key) if mirror else None
+        if links is not None:
+            return links
+
+        cache = get_cache("links", List[TaskLink])
+        entry = cache.get(task_key)
+        if entry is not None and entry.is_fresh():
+            return entry.value
+
         try:
             client = get_jira_client()
-            issue = client.issue(task_key)
+            issue = client.issue(task_key, fields=','.join(jira_fields_for(TaskLink)))
             
-            links = []
-            for link in issue.fields.issuelinks:
-                # Get target issue and link type
-                if hasattr(link, "outwardIssue"):
-                    target = link.outwardIssue
-                    link_type = link.type.outward
-                elif hasattr(link, "inwardIssue"):
-                    target = link.inwardIssue
-                    link_type = link.type.inward
-                else:
-                    continue
-                    
-                links.append(TaskLink(
-                    id=str(link.id),
-                    type=link_type,
-                    source=task_key,
-                    target=target.key
-                ))
-                
+            links = task_links_from_issue(task_key, issue)
+            cache.set(task_key, links)
             return links
             
+        except UpstreamError:
+            raise
         except Exception as e:
             logger.error(f"Error getting links for task {task_key}: {str(e)}")
             return []
             
+    def add_task_link(self, source: str, link_type: LinkType, target: str) -> Optional[str]:
+        """
+        Create link in JIRA, errors propagate
+
+        Passive types are created as their active inverse between swapped
+        tasks. Returns the link id when JIRA reports it.
+        """
+        outward, active_type, inward = canonical_edge(source, link_type, target)
+        response = get_jira_client().create_issue_link(
+            type=self._map_to_jira_link_type(active_type),
+            inwardIssue=inward,
+            outwardIssue=outward
+        )
+
+        # Both ends now show the new link
+        cache = get_cache("links", List[TaskLink])
+        cache.delete(source)
+        cache.delete(target)
+        mark_stale_in_mirror(source, target)
+        return link_id_from_response(response)
+
     def create_task_link(self, source: str, link_type: LinkType, target: str) -> Optional[TaskLink]:
         """Create new task link"""
         try:
-            client = get_jira_client()
-            
-            # Create link in JIRA
-            client.create_issue_link(
-                type=self._map_to_jira_link_type(link_type),
-                inwardIssue=target,
-                outwardIssue=source
-            )
+            link_id = self.add_task_link(source, link_type, target)
             
             # Return new link object
             return TaskLink(
-                id="new",  # JIRA doesn't return link ID
+                id=link_id or "new",  # JIRA may not report the link ID
                 type=link_type,
                 source=source,
                 target=target,
                 created=datetime.now()
             )
             
+        except UpstreamError:
+            raise
         except Exception as e:
             logger.error(f"Error creating link {source} -> {target}: {str(e)}")
             return None
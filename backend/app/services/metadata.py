@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from jira import JIRA
+from app.core.config import get_settings
+from app.core.executor import run_blocking
+from app.core.fields import get_field_resolver
+from app.core.logging import get_logger
+from app.core.ratelimit import Priority, request_priority
+from app.services.jira import get_jira_client
+
+logger = get_logger()
+
+@dataclass
+class JiraMetadata:
+    """Snapshot of rarely changing JIRA configuration"""
+    fields: List[Dict[str, Any]] = field(default_factory=list)
+    priorities: List[Dict[str, str]] = field(default_factory=list)
+    link_types: List[Dict[str, str]] = field(default_factory=list)
+    # project key -> issue types, filled as projects are asked for
+    issue_types: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
+    loaded_at: Optional[float] = None
+
+class MetadataRegistry:
+    """
+    Process-wide cache of JIRA fields, issue types, priorities and link types
+
+    Loaded once (at startup or on first use) and replaced as a whole on
+    refresh, so readers never see a half-updated snapshot. A failed refresh
+    keeps serving the previous one.
+    """
+
+    def __init__(self):
+        self._metadata = JiraMetadata()
+        self._lock = threading.Lock()
+        self._refreshes = 0
+        self._failures = 0
+
+    def _load_issue_types(self, client: JIRA, project_key: str) -> List[Dict[str, str]]:
+        project = client.project(project_key)
+        return [{'id': t.id, 'name': t.name} for t in project.issueTypes]
+
+    def refresh(self, client: Optional[JIRA] = None) -> JiraMetadata:
+        """Reload everything from JIRA, including issue types of known projects"""
+        client = client or get_jira_client()
+        try:
+            fields = client.fields()
+            metadata = JiraMetadata(
+                fields=[
+                    {'id': f['id'], 'name': f['name'], 'custom': f.get('custom', False), 'schema': f.get('schema')}
+                    for f in fields
+                ],
+                priorities=[{'id': p.id, 'name': p.name} for p in client.priorities()],
+                link_types=[
+                    {'id': t.id, 'name': t.name, 'inward': t.inward, 'outward': t.outward}
+                    for t in client.issue_link_types()
+                ],
+                issue_types={key: self._load_issue_types(client, key) for key in list(self._metadata.issue_types)},
+                loaded_at=time.time()
+            )
+        except Exception as e:
+            self._failures += 1
+            logger.error(f"Error refreshing JIRA metadata: {str(e)}")
+            raise
+        with self._lock:
+            self._metadata = metadata
+            self._refreshes += 1
+        # Same listing resolves custom field ids, no separate lookup
+        get_field_resolver().update(fields)
+        logger.info(
+            f"Loaded JIRA metadata: {len(metadata.fields)} fields, "
+            f"{len(metadata.priorities)} priorities, {len(metadata.link_types)} link types"
+        )
+        return metadata
+
+    def get(self, client: Optional[JIRA] = None) -> JiraMetadata:
+        """Current snapshot, loading it on first use"""
+        metadata = self._metadata
+        if metadata.loaded_at is None:
+            return self.refresh(client)
+        return metadata
+
+    def field_ids(self, client: Optional[JIRA] = None) -> Dict[str, str]:
+        """Map field name -> field id"""
+        return {f['name']: f['id'] for f in self.get(client).fields}
+
+    def issue_types(self, project_key: str, client: Optional[JIRA] = None) -> List[Dict[str, str]]:
+        """Issue types of project, fetched from JIRA only the first time"""
+        types = self._metadata.issue_types.get(project_key)
+        if types is None:
+            types = self._load_issue_types(client or get_jira_client(), project_key)
+            with self._lock:
+                self._metadata.issue_types[project_key] = types
+        return types
+
+    def stats(self) -> Dict[str, Any]:
+        metadata = self._metadata
+        return {
+            "loaded_at": metadata.loaded_at,
+            "fields": len(metadata.fields),
+            "projects": len(metadata.issue_types),
+            "refreshes": self._refreshes,
+            "failures": self._failures
+        }
+
+@lru_cache()
+def get_metadata_registry() -> MetadataRegistry:
+    return MetadataRegistry()
+
+async def refresh_metadata_periodically(registry: MetadataRegistry) -> None:
+    """Load metadata now, then every METADATA_REFRESH_INTERVAL seconds"""
+    while True:
+        try:
+            with request_priority(Priority.BACKGROUND):
+                await run_blocking(registry.refresh)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Already logged; keep the previous snapshot until next round
+            pass
+        await asyncio.sleep(get_settings()['metadata_refresh_interval'])
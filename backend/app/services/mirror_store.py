@@ -0,0 +1,355 @@
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.schemas.base import issue_key_order
+from app.schemas.epic import EpicAggregate, EpicSchema
+from app.schemas.label import LabelSchema
+from app.schemas.link import ExternalLink, TaskLink
+from app.schemas.task import TaskSchema
+
+logger = get_logger()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    issue_type TEXT,
+    summary TEXT,
+    description TEXT,
+    created TEXT,
+    updated TEXT,
+    epic_key TEXT,
+    epic_name TEXT,
+    -- Set when changed through this API; links are then read from JIRA until resynced
+    stale INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS issues_epic_key ON issues(epic_key);
+CREATE TABLE IF NOT EXISTS labels (
+    issue_key TEXT NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (issue_key, label)
+);
+CREATE INDEX IF NOT EXISTS labels_label ON labels(label);
+CREATE TABLE IF NOT EXISTS issue_links (
+    source TEXT NOT NULL,
+    id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    target TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issue_links_source ON issue_links(source);
+CREATE TABLE IF NOT EXISTS remote_links (
+    issue_key TEXT NOT NULL,
+    id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    target TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS remote_links_issue_key ON remote_links(issue_key);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync REAL,
+    last_full_sync REAL,
+    lease_owner TEXT,
+    lease_until REAL
+);
+"""
+
+@dataclass
+class MirroredIssue:
+    """Everything the mirror keeps about one issue"""
+    key: str
+    issue_type: Optional[str]
+    summary: Optional[str]
+    description: Optional[str]
+    created: Optional[str]
+    updated: Optional[str]
+    epic_key: Optional[str] = None
+    epic_name: Optional[str] = None
+    labels: List[str] = field(default_factory=list)
+    links: List[TaskLink] = field(default_factory=list)
+    # None keeps the remote links already mirrored
+    remote_links: Optional[List[ExternalLink]] = None
+
+@dataclass
+class SyncState:
+    last_sync: Optional[float] = None
+    last_full_sync: Optional[float] = None
+
+class MirrorStore:
+    """
+    Local SQLite copy of a JIRA project
+
+    Written by the sync worker and read by services in mirror read mode.
+    WAL mode lets every worker process read while one of them syncs.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    # Sync state
+
+    def get_state(self, project: str) -> SyncState:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_sync, last_full_sync FROM sync_state WHERE project = ?",
+                (project,)
+            ).fetchone()
+        return SyncState(*row) if row else SyncState()
+
+    def set_state(self, project: str, state: SyncState) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sync_state (project, last_sync, last_full_sync) VALUES (?, ?, ?) "
+                "ON CONFLICT(project) DO UPDATE SET "
+                "last_sync = excluded.last_sync, last_full_sync = excluded.last_full_sync",
+                (project, state.last_sync, state.last_full_sync)
+            )
+
+    def acquire_lease(self, project: str, owner: str, ttl: float) -> bool:
+        """Claim the right to sync project, so only one worker process does it"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO sync_state (project) VALUES (?)", (project,)
+            )
+            cursor = self._conn.execute(
+                "UPDATE sync_state SET lease_owner = ?, lease_until = ? "
+                "WHERE project = ? AND (lease_owner IS NULL OR lease_owner = ? OR lease_until < ?)",
+                (owner, now + ttl, project, owner, now)
+            )
+        return cursor.rowcount == 1
+
+    def is_fresh(self, project: str, max_staleness: float) -> bool:
+        """Whether the last sync of project is recent enough to serve reads"""
+        last_sync = self.get_state(project).last_sync
+        return last_sync is not None and time.time() - last_sync <= max_staleness
+
+    # Writes
+
+    def get_versions(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Map issue key -> mirrored `updated` value for keys present and not stale"""
+        keys = list(keys)
+        if not keys:
+            return {}
+        placeholders = ','.join('?' * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, updated FROM issues WHERE key IN ({placeholders}) AND stale = 0", keys
+            ).fetchall()
+        return dict(rows)
+
+    def apply(self, project: str, issues: List[MirroredIssue]) -> None:
+        """Replace mirrored state of issues in one transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for issue in issues:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO issues "
+                        "(key, project, issue_type, summary, description, created, updated, epic_key, epic_name) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (issue.key, project, issue.issue_type, issue.summary, issue.description,
+                         issue.created, issue.updated, issue.epic_key, issue.epic_name)
+                    )
+                    self._conn.execute("DELETE FROM labels WHERE issue_key = ?", (issue.key,))
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO labels (issue_key, label) VALUES (?, ?)",
+                        [(issue.key, label) for label in issue.labels]
+                    )
+                    self._conn.execute("DELETE FROM issue_links WHERE source = ?", (issue.key,))
+                    self._conn.executemany(
+                        "INSERT INTO issue_links (source, id, type, target) VALUES (?, ?, ?, ?)",
+                        [(issue.key, link.id, link.type.value, link.target) for link in issue.links]
+                    )
+                    if issue.remote_links is not None:
+                        self._conn.execute("DELETE FROM remote_links WHERE issue_key = ?", (issue.key,))
+                        self._conn.executemany(
+                            "INSERT INTO remote_links (issue_key, id, type, target, title, url) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            [(issue.key, link.id, link.type.value, link.target, link.title, str(link.url))
+                             for link in issue.remote_links]
+                        )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def mark_stale(self, key: str) -> None:
+        """Make the next sync re-read an issue and serve its links live until then"""
+        with self._lock:
+            self._conn.execute("UPDATE issues SET stale = 1 WHERE key = ?", (key,))
+
+    def forget(self, key: str) -> None:
+        """Drop an issue and everything mirrored about it"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM issues WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM labels WHERE issue_key = ?", (key,))
+            self._conn.execute("DELETE FROM issue_links WHERE source = ?", (key,))
+            self._conn.execute("DELETE FROM remote_links WHERE issue_key = ?", (key,))
+            self._conn.execute("COMMIT")
+
+    def keys(self, project: str) -> Set[str]:
+        """Keys of mirrored issues of project"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT key FROM issues WHERE project = ?", (project,))}
+
+    def retain_only(self, project: str, keys: Set[str]) -> int:
+        """Forget issues of project not seen by a full sync; returns number removed"""
+        removed = [key for key in self.keys(project) if key not in keys]
+        for key in removed:
+            self.forget(key)
+        return len(removed)
+
+    # Reads
+
+    def _task(self, row) -> TaskSchema:
+        key, summary, description, created, updated = row
+        return TaskSchema(key=key, summary=summary, description=description, created=created, updated=updated)
+
+    def get_task(self, key: str) -> Optional[TaskSchema]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, summary, description, created, updated FROM issues WHERE key = ?",
+                (key,)
+            ).fetchone()
+        return self._task(row) if row else None
+
+    def get_epic_aggregate(self, key: str) -> Optional[EpicAggregate]:
+        with self._lock:
+            epic = self._conn.execute(
+                "SELECT key, epic_name, summary, description, created, updated FROM issues "
+                "WHERE key = ? AND issue_type = 'Epic' AND epic_name IS NOT NULL",
+                (key,)
+            ).fetchone()
+            if epic is None:
+                # Not mirrored, not an epic or unnamed: same as live mode's 404
+                return None
+            tasks = self._conn.execute(
+                "SELECT key, summary, description, created, updated FROM issues "
+                "WHERE epic_key = ? AND issue_type = 'Engineer'",
+                (key,)
+            ).fetchall()
+
+        tasks = sorted((self._task(row) for row in tasks), key=lambda task: issue_key_order(task.key))
+        epic_key, name, summary, description, created, updated = epic
+        return EpicAggregate(
+            epic=EpicSchema(
+                key=epic_key,
+                name=name,
+                summary=summary,
+                description=description,
+                created=created,
+                updated=updated,
+                tasks=[task.key for task in tasks]
+            ),
+            tasks=tasks
+        )
+
+    def get_task_links(self, key: str) -> Optional[List[TaskLink]]:
+        """Links of a mirrored issue, None if the issue is not mirrored or stale"""
+        with self._lock:
+            if not self._conn.execute("SELECT 1 FROM issues WHERE key = ? AND stale = 0", (key,)).fetchone():
+                return None
+            rows = self._conn.execute(
+                "SELECT id, type, target FROM issue_links WHERE source = ? ORDER BY rowid", (key,)
+            ).fetchall()
+        return [TaskLink(id=id, type=type, source=key, target=target) for id, type, target in rows]
+
+    def get_external_links(self, key: str) -> Optional[List[ExternalLink]]:
+        """Remote links of a mirrored issue, None if the issue is not mirrored or stale"""
+        with self._lock:
+            if not self._conn.execute("SELECT 1 FROM issues WHERE key = ? AND stale = 0", (key,)).fetchone():
+                return None
+            rows = self._conn.execute(
+                "SELECT id, type, target, title, url FROM remote_links WHERE issue_key = ? ORDER BY rowid",
+                (key,)
+            ).fetchall()
+        return [
+            ExternalLink(id=id, type=type, source=key, target=target, title=title, url=url)
+            for id, type, target, title, url in rows
+        ]
+
+    def get_labels(self, project: str, label: Optional[str] = None) -> List[LabelSchema]:
+        """Label summaries of project, optionally only one label"""
+        query = (
+            "SELECT labels.label, issues.key, issues.created, issues.updated FROM labels "
+            "JOIN issues ON issues.key = labels.issue_key WHERE issues.project = ?"
+        )
+        params = [project]
+        if label is not None:
+            query += " AND labels.label = ?"
+            params.append(label)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY labels.label, issues.key", params).fetchall()
+
+        grouped: Dict[str, List[tuple]] = {}
+        for row in rows:
+            grouped.setdefault(row[0], []).append(row)
+        return [
+            LabelSchema(
+                key=name,
+                name=name.capitalize(),
+                created=min(row[2] for row in issues),
+                updated=max(row[3] for row in issues),
+                used_in=[row[1] for row in issues]
+            )
+            for name, issues in grouped.items()
+        ]
+
+    def stats(self, project: str) -> Dict[str, object]:
+        state = self.get_state(project)
+        with self._lock:
+            (issues,) = self._conn.execute(
+                "SELECT COUNT(*) FROM issues WHERE project = ?", (project,)
+            ).fetchone()
+        return {
+            "issues": issues,
+            "last_sync": state.last_sync,
+            "last_full_sync": state.last_full_sync,
+            "lag": time.time() - state.last_sync if state.last_sync else None
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+@lru_cache()
+def get_mirror_store() -> MirrorStore:
+    return MirrorStore(get_settings()['mirror_path'])
+
+def get_read_mirror() -> Optional[MirrorStore]:
+    """Mirror to serve reads from, or None when reads must go to JIRA"""
+    settings = get_settings()
+    if settings['read_mode'] != 'mirror':
+        return None
+    store = get_mirror_store()
+    if not store.is_fresh(settings['jira_project'], settings['mirror_max_staleness']):
+        return None
+    return store
+
+def mark_stale_in_mirror(*keys: str) -> None:
+    """Flag issues changed through this API in the mirror"""
+    if get_settings()['read_mode'] != 'mirror':
+        return
+    store = get_mirror_store()
+    for key in keys:
+        store.mark_stale(key)
+
+def close_mirror_store() -> None:
+    if get_mirror_store.cache_info().currsize:
+        get_mirror_store().close()
+        get_mirror_store.cache_clear()
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, AsyncIterator, Optional, Set
+from jira.client import ResultList
+from app.core.config import get_settings
+from app.services.jira_transport import Fields
+
+async def iter_search_pages(
+    client: Any,
+    jql: str,
+    fields: Fields = None,
+    page_size: Optional[int] = None,
+    concurrency: Optional[int] = None
+) -> AsyncIterator[ResultList]:
+    """
+    Walk every page of a JQL search
+
+    The first page tells the total; the remaining ``startAt`` pages are
+    fetched with at most ``concurrency`` requests in flight and yielded in
+    completion order, so memory stays bounded by the window, not the result.
+    """
+    settings = get_settings()
+    page_size = page_size or settings['search_page_size']
+    concurrency = max(1, concurrency or settings['search_concurrency'])
+
+    first = await client.search_issues(jql, startAt=0, maxResults=page_size, fields=fields)
+    yield first
+
+    # JIRA may cap maxResults below what was asked for
+    step = first.maxResults or page_size
+    starts = iter(range(step, first.total, step))
+    pending: Set[asyncio.Future] = set()
+
+    def fill_window() -> None:
+        for start in starts:
+            pending.add(asyncio.ensure_future(
+                client.search_issues(jql, startAt=start, maxResults=step, fields=fields)
+            ))
+            if len(pending) >= concurrency:
+                return
+
+    fill_window()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            for page in done:
+                yield page.result()
+            fill_window()
+    finally:
+        for page in pending:
+            page.cancel()
+
+async def iter_search(client: Any, jql: str, **kwargs) -> AsyncIterator[Any]:
+    """Yield issues of every search page as pages arrive"""
+    async for page in iter_search_pages(client, jql, **kwargs):
+        for issue in page:
+            yield issue
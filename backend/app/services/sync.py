@@ -0,0 +1,191 @@
+import asyncio
+import math
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional, Set
+from app.core.config import get_settings
+from app.core.fields import field_id
+from app.core.logging import get_logger
+from app.core.ratelimit import Priority, request_priority
+from app.schemas.base import jira_fields_for
+from app.schemas.task import TaskSchema
+from app.services.external_links import external_links_from_remote
+from app.services.jira import get_async_jira_client
+from app.services.links import task_links_from_issue
+from app.services.mirror_store import MirroredIssue, MirrorStore, SyncState
+from app.services.search import iter_search_pages
+
+logger = get_logger()
+
+def mirror_fields() -> List[str]:
+    """Fields stored by the mirror"""
+    extra = ['issuetype', 'labels', 'issuelinks', field_id('epic_link'), field_id('epic_name')]
+    return list(dict.fromkeys(jira_fields_for(TaskSchema) + [field for field in extra if field]))
+
+class SyncWorker:
+    """
+    Background task mirroring one JIRA project into a MirrorStore
+
+    Each pass searches ``updated >= -Nm`` (N covers the gap since the last
+    pass plus an overlap); a periodic full pass, ordered by key so updates
+    during the scan do not shift its pages, also drops issues deleted in
+    JIRA once a ``key in (...)`` search confirms they are gone. Remote links
+    are only re-read for issues whose ``updated`` changed. A lease in the
+    store, renewed after every page, keeps other worker processes from
+    syncing the same project concurrently.
+    """
+
+    SYNC_OVERLAP_MINUTES = 2
+
+    def __init__(
+        self,
+        store: MirrorStore,
+        project: str,
+        interval: float,
+        full_interval: float,
+        client: Optional[Any] = None
+    ):
+        self.store = store
+        self.project = project
+        self.interval = interval
+        self.full_interval = full_interval
+        # Outlives one interval, and is renewed per page, so a slow pass keeps it
+        self.lease_ttl = interval * 3
+        self._client = client
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+        self._stats: Dict[str, Any] = {"passes": 0, "failures": 0, "issues": 0, "last_error": None}
+
+    @property
+    def client(self) -> Any:
+        return self._client or get_async_jira_client()
+
+    def _mirrored(self, issue, remote_links) -> MirroredIssue:
+        fields = issue.fields
+        issue_type = getattr(fields, 'issuetype', None)
+        return MirroredIssue(
+            key=issue.key,
+            issue_type=getattr(issue_type, 'name', None),
+            summary=fields.summary,
+            description=fields.description,
+            created=str(fields.created),
+            updated=str(fields.updated),
+            epic_key=getattr(fields, field_id('epic_link') or '', None),
+            epic_name=getattr(fields, field_id('epic_name') or '', None),
+            labels=list(getattr(fields, 'labels', None) or []),
+            links=task_links_from_issue(issue.key, issue),
+            remote_links=None if remote_links is None else external_links_from_remote(issue.key, remote_links)
+        )
+
+    async def _apply_page(self, page: List[Any], limit: asyncio.Semaphore) -> None:
+        versions = self.store.get_versions(issue.key for issue in page)
+        changed = [issue for issue in page if versions.get(issue.key) != str(issue.fields.updated)]
+
+        async def fetch_remote(key: str):
+            async with limit:
+                return await self.client.remote_links(key)
+
+        remote = await asyncio.gather(*(fetch_remote(issue.key) for issue in changed))
+        remote_by_key = {issue.key: links for issue, links in zip(changed, remote)}
+        self.store.apply(self.project, [
+            self._mirrored(issue, remote_by_key.get(issue.key)) for issue in changed
+        ])
+
+    def _renew_lease(self) -> None:
+        if not self.store.acquire_lease(self.project, self.owner, ttl=self.lease_ttl):
+            raise RuntimeError(f"Sync lease of {self.project} was taken by another worker")
+
+    async def _confirm_missing(self, keys: List[str], limit: asyncio.Semaphore) -> Set[str]:
+        """Keys JIRA still has among ones a full pass did not see; those found are re-applied"""
+        chunk_size = get_settings()['batch_chunk_size']
+        found = set()
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            issues = await self.client.search_issues(
+                f'key in ({", ".join(chunk)})', maxResults=len(chunk), validate_query=False, fields=mirror_fields()
+            )
+            await self._apply_page(list(issues), limit)
+            found.update(issue.key for issue in issues)
+            self._renew_lease()
+        return found
+
+    async def sync_once(self, full: bool = False) -> int:
+        """Run one sync pass; returns number of issues seen"""
+        started = time.time()
+        state = self.store.get_state(self.project)
+        full = (
+            full
+            or state.last_sync is None
+            or state.last_full_sync is None
+            or started - state.last_full_sync >= self.full_interval
+        )
+        if full:
+            jql = f'project = {self.project} ORDER BY key ASC'
+        else:
+            minutes = math.ceil((started - state.last_sync) / 60) + self.SYNC_OVERLAP_MINUTES
+            jql = f'project = {self.project} AND updated >= -{minutes}m ORDER BY updated ASC'
+
+        limit = asyncio.Semaphore(get_settings()['search_concurrency'])
+        seen = set()
+        async for page in iter_search_pages(self.client, jql, fields=mirror_fields()):
+            await self._apply_page(list(page), limit)
+            seen.update(issue.key for issue in page)
+            self._renew_lease()
+
+        if full:
+            missing = sorted(self.store.keys(self.project) - seen)
+            if missing:
+                seen.update(await self._confirm_missing(missing, limit))
+            removed = self.store.retain_only(self.project, seen)
+            if removed:
+                logger.info(f"Mirror of {self.project}: dropped {removed} deleted issues")
+        self.store.set_state(self.project, SyncState(
+            last_sync=started,
+            last_full_sync=started if full else state.last_full_sync
+        ))
+        self._stats["passes"] += 1
+        self._stats["issues"] += len(seen)
+        logger.info(f"Mirror of {self.project} synced ({'full' if full else 'incremental'}): {len(seen)} issues")
+        return len(seen)
+
+    async def run(self) -> None:
+        """Sync forever, every interval seconds, behind interactive JIRA calls"""
+        with request_priority(Priority.BACKGROUND):
+            while True:
+                try:
+                    if self.store.acquire_lease(self.project, self.owner, ttl=self.lease_ttl):
+                        await self.sync_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._stats["failures"] += 1
+                    self._stats["last_error"] = str(e)
+                    logger.error(f"Mirror sync of {self.project} failed: {str(e)}")
+                await asyncio.sleep(self.interval)
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, **self.store.stats(self.project), "running": bool(self._task and not self._task.done())}
+
+def create_sync_worker(store: MirrorStore) -> SyncWorker:
+    settings = get_settings()
+    return SyncWorker(
+        store,
+        project=settings['jira_project'],
+        interval=settings['mirror_sync_interval'],
+        full_interval=settings['mirror_full_sync']
+    )
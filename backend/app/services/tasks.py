@@ -1,9 +1,19 @@
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, List, Optional, Set
 from datetime import datetime
 
+from app.core.config import get_settings
+from app.core.errors import UpstreamError
+from app.core.executor import run_blocking
+from app.core.fields import field_id
 from app.core.logging import get_logger
-from app.services.jira import get_jira_client 
-from app.schemas.create_task import CreateTaskRequest, TaskPriority
+from app.core.ratelimit import Priority, request_priority
+from app.services.jira import get_jira_client, get_task_cache, task_from_issue
+from app.services.metadata import get_metadata_registry
+from app.services.templates import render_task_description
+from app.schemas.base import jira_fields_for
+from app.schemas.create_task import BulkTaskResult, CreateTaskRequest, TaskPriority, TaskReturn
+from app.schemas.task import TaskSchema
 
 logger = get_logger(__name__)
 
@@ -12,79 +22,142 @@ class TasksService:
     
     def __init__(self):
         self.client = get_jira_client()
-        # Important: These are the correct custom field IDs for JIRA
+        # Custom field ids are resolved per JIRA instance, see app.core.fields
         self.field_config = {
-            'EPIC_LINK_FIELD': 'customfield_10601',  # Epic Link field ID
             'TIME_TRACKING': 'timetracking',  # Built-in JIRA field
         }
 
-    def create_task(self, request: CreateTaskRequest) -> Optional[dict]:
+    def _build_fields(self, request: CreateTaskRequest) -> dict:
+        """Map create request to JIRA issue fields"""
+        # Create base issue with all fields at once
+        fields = {
+            'project': {'key': request.project_key},
+            'summary': request.summary,
+            'issuetype': {'name': request.issue_type},
+            'priority': {'name': request.priority.value}
+        }
+
+        # Add optional fields
+        description = render_task_description(request)
+        if description:
+            fields['description'] = description
+            
+        if request.due_date:
+            fields['duedate'] = request.due_date.strftime('%Y-%m-%d')
+            
+        if request.labels:
+            fields['labels'] = request.labels
+            
+        if request.assignee:
+            fields['assignee'] = {'name': request.assignee}
+
+        # Epic Link is a custom field whose id differs between instances
+        if request.epic_link:
+            epic_link_field = field_id('epic_link')
+            if not epic_link_field:
+                raise ValueError("Epic Link field is not available on this JIRA instance")
+            fields[epic_link_field] = request.epic_link
+            logger.info(f"Setting Epic Link {request.epic_link} using field {epic_link_field}")
+
+        # Time tracking must use JIRA's format "Xh Ym"
+        if request.estimate:
+            hours = int(request.estimate)
+            minutes = int((request.estimate - hours) * 60)
+            estimate = f"{hours}h {minutes}m"
+            fields[self.field_config['TIME_TRACKING']] = {
+                'originalEstimate': estimate  # Correct format for time tracking
+            }
+            logger.info(f"Setting Time Estimate to {estimate}")
+
+        return fields
+
+    def create_task(self, request: CreateTaskRequest, mode: TaskReturn = TaskReturn.FULL) -> Optional[dict]:
         """
         Create new JIRA issue with all fields including Epic Link and Time Tracking
         
         The method uses specific field IDs and formats:
-        - Epic Link: Uses customfield_10601
+        - Epic Link: Uses the resolved 'epic_link' custom field
         - Time Tracking: Uses built-in 'timetracking' with format "Xh Ym"
+
+        Only ``TaskReturn.FULL`` reads the issue back; other modes return
+        the id/key/self of the create response. Raises ValueError when the
+        request cannot be mapped to fields (unknown template, no Epic Link).
         """
+        fields = self._build_fields(request)
         try:
-            # Create base issue with all fields at once
-            fields = {
-                'project': {'key': request.project_key},
-                'summary': request.summary,
-                'issuetype': {'name': request.issue_type},
-                'priority': {'name': request.priority.value}
-            }
-
-            # Add optional fields
-            if request.description:
-                fields['description'] = request.description
-                
-            if request.due_date:
-                fields['duedate'] = request.due_date.strftime('%Y-%m-%d')
-                
-            if request.labels:
-                fields['labels'] = request.labels
-                
-            if request.assignee:
-                fields['assignee'] = {'name': request.assignee}
-
-            # Epic Link field must use customfield_10601 (not 10014)
-            if request.epic_link:
-                fields[self.field_config['EPIC_LINK_FIELD']] = request.epic_link
-                logger.info(f"Setting Epic Link {request.epic_link} using field {self.field_config['EPIC_LINK_FIELD']}")
-
-            # Time tracking must use JIRA's format "Xh Ym"
-            if request.estimate:
-                hours = int(request.estimate)
-                minutes = int((request.estimate - hours) * 60)
-                estimate = f"{hours}h {minutes}m"
-                fields[self.field_config['TIME_TRACKING']] = {
-                    'originalEstimate': estimate  # Correct format for time tracking
-                }
-                logger.info(f"Setting Time Estimate to {estimate}")
-
-            # Create issue with all fields
-            new_issue = self.client.create_issue(fields=fields)
+            # Create issue with all fields, without jira's own full re-fetch
+            new_issue = self.client.create_issue(fields=fields, prefetch=False)
             logger.info(f"Successfully created task {new_issue.key}")
 
-            # Get and return updated issue
-            updated_issue = self.client.issue(new_issue.key)
+            if mode != TaskReturn.FULL:
+                return new_issue.raw
+
+            # Get and return updated issue, limited to written and schema fields
+            projection = list(dict.fromkeys(list(fields) + jira_fields_for(TaskSchema)))
+            updated_issue = self.client.issue(new_issue.key, fields=','.join(projection))
             return updated_issue.raw
 
+        except UpstreamError:
+            raise
         except Exception as e:
             logger.error(f"Error creating task: {str(e)}")
             return None
 
+    def hydrate_task(self, key: str) -> None:
+        """Read a created task back into the task cache"""
+        try:
+            with request_priority(Priority.BACKGROUND):
+                issue = self.client.issue(key, fields=','.join(jira_fields_for(TaskSchema)))
+            get_task_cache().set(key, task_from_issue(issue), version=str(issue.fields.updated))
+            logger.debug(f"Hydrated task {key}")
+        except Exception as e:
+            logger.error(f"Error hydrating task {key}: {str(e)}")
+
+    def create_tasks_chunk(self, requests: List[CreateTaskRequest], offset: int = 0) -> List[BulkTaskResult]:
+        """
+        Create several issues with one JIRA bulk request
+
+        Issues are not re-fetched after creation; result indexes start at
+        ``offset`` so chunks of a larger import keep request positions.
+        Items whose fields cannot be built fail alone and are not sent.
+        """
+        results: List[Optional[BulkTaskResult]] = [None] * len(requests)
+        valid = []
+        field_list = []
+        for index, request in enumerate(requests):
+            try:
+                field_list.append(self._build_fields(request))
+                valid.append(index)
+            except ValueError as e:
+                results[index] = BulkTaskResult(index=offset + index, status="failed", error=str(e))
+
+        try:
+            created = self.client.create_issues(field_list=field_list, prefetch=False) if field_list else []
+        except Exception as e:
+            logger.error(f"Error bulk creating tasks {offset}..{offset + len(requests) - 1}: {str(e)}")
+            # Throttling and open circuits tell when the chunk is worth retrying
+            retry_after = e.retry_after if isinstance(e, UpstreamError) else None
+            created = [{'status': 'Error', 'issue': None, 'error': str(e), 'retry_after': retry_after}] * len(valid)
+
+        for index, item in zip(valid, created):
+            issue = item['issue']
+            if item['status'] == 'Success' and issue is not None:
+                results[index] = BulkTaskResult(index=offset + index, status="created", key=issue.key, id=str(issue.id))
+            else:
+                results[index] = BulkTaskResult(
+                    index=offset + index, status="failed", error=item['error'], retry_after=item.get('retry_after')
+                )
+        logger.info(f"Bulk created {sum(r.status == 'created' for r in results)}/{len(requests)} tasks")
+        return results
+
     def get_task_types(self, project_key: str) -> list:
         """Get available issue types for project"""
         try:
-            project = self.client.project(project_key)
-            types = [
-                {'id': t.id, 'name': t.name}
-                for t in project.issueTypes
-            ]
+            types = get_metadata_registry().issue_types(project_key, self.client)
             logger.debug(f"Found {len(types)} issue types for project {project_key}")
             return types
+        except UpstreamError:
+            raise
         except Exception as e:
             logger.error(f"Error getting issue types: {str(e)}")
             return []
@@ -92,11 +165,54 @@ class TasksService:
     def get_field_ids(self, issue_key: str) -> dict:
         """Get all available field IDs for issue"""
         try:
-            fields = self.client.fields()
-            return {
-                field['name']: field['id'] 
-                for field in fields
-            }
+            return get_metadata_registry().field_ids(self.client)
+        except UpstreamError:
+            raise
         except Exception as e:
             logger.error(f"Error getting field IDs: {str(e)}")
-            return {}
\ No newline at end of file
+            return {}
+
+async def create_tasks_bulk(
+    service: TasksService,
+    requests: List[CreateTaskRequest],
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None
+) -> AsyncIterator[List[BulkTaskResult]]:
+    """
+    Create tasks in JIRA bulk chunks, yielding each chunk's results as it completes
+
+    At most ``concurrency`` chunks are in flight; they run on the jira-write
+    pool, which bounds concurrent writes across all requests, at bulk
+    priority so interactive reads are not starved.
+    """
+    settings = get_settings()
+    chunk_size = chunk_size or settings['bulk_create_chunk_size']
+    concurrency = max(1, concurrency or settings['bulk_create_concurrency'])
+
+    offsets = iter(range(0, len(requests), chunk_size))
+    pending: Set[asyncio.Future] = set()
+
+    def fill_window() -> None:
+        for offset in offsets:
+            # Set around task creation only, a generator must not leak it to the caller
+            with request_priority(Priority.BULK):
+                pending.add(asyncio.ensure_future(run_blocking(
+                    service.create_tasks_chunk,
+                    requests[offset:offset + chunk_size],
+                    offset,
+                    upstream="jira-write"
+                )))
+            if len(pending) >= concurrency:
+                return
+
+    fill_window()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            for chunk in done:
+                yield chunk.result()
+            fill_window()
+    finally:
+        for chunk in pending:
+            chunk.cancel()
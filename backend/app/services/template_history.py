@@ -0,0 +1,126 @@
+import difflib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.core.files import atomic_write_text
+from app.core.logging import get_logger
+from app.schemas.checklist import ChecklistTemplate, ChecklistType, TemplateRevision
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks only cover threads of one process
+    fcntl = None
+
+logger = get_logger()
+
+def content_diff(before: str, after: str) -> str:
+    """Unified diff between two template file versions"""
+    return ''.join(difflib.unified_diff(
+        before.splitlines(keepends=True), after.splitlines(keepends=True), 'before', 'after', n=1
+    ))
+
+def _last_line(path: Path, block: int = 4096) -> Optional[bytes]:
+    """Last line of a file, read from the end"""
+    try:
+        with open(path, 'rb') as file:
+            end = file.seek(0, os.SEEK_END)
+            tail = b''
+            position = end
+            while position > 0:
+                position = max(0, position - block)
+                file.seek(position)
+                tail = file.read(min(block, end - position)) + tail
+                lines = tail.rstrip(b'\n').rsplit(b'\n', 1)
+                if len(lines) == 2 or position == 0:
+                    return lines[-1] or None
+    except FileNotFoundError:
+        return None
+    return None
+
+class TemplateHistory:
+    """
+    Write coordination and version history of templates, shared by all workers
+
+    Writes of one template are serialized by a lock file, so they also
+    exclude each other across processes. Every write appends a revision
+    with a diff to the template's JSONL log and bumps a generation file,
+    which template stores of all workers check to drop what they parsed.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.generation_path = root / "generation"
+        self._locks: Dict[Tuple[ChecklistType, str], threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self._generation_lock = threading.Lock()
+
+    def _log_path(self, type: ChecklistType, key: str) -> Path:
+        return self.root / type.value / f"{key}.jsonl"
+
+    @contextmanager
+    def _file_lock(self, name: str, local: threading.Lock) -> Iterator[None]:
+        path = self.root / "locks" / f"{name}.lock"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with local, open(path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def lock(self, type: ChecklistType, key: str) -> Iterator[None]:
+        """Hold the write lock of one template"""
+        with self._locks_lock:
+            local = self._locks.setdefault((type, key), threading.Lock())
+        with self._file_lock(f"{type.value}-{key}", local):
+            yield
+
+    def record(
+        self,
+        type: ChecklistType,
+        key: str,
+        action: str,
+        before: str,
+        after: str,
+        template: Optional[ChecklistTemplate] = None
+    ) -> TemplateRevision:
+        """Append a revision; call with the template's lock held"""
+        path = self._log_path(type, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        last = _last_line(path)
+        revision = TemplateRevision(
+            revision=json.loads(last)['revision'] + 1 if last else 1,
+            action=action,
+            at=datetime.now(),
+            name=template.name if template else None,
+            version=template.version if template else None,
+            diff=content_diff(before, after)
+        )
+        with open(path, 'a', encoding='utf-8') as log:
+            log.write(revision.model_dump_json() + '\n')
+        self.bump_generation(type, key)
+        return revision
+
+    def revisions(self, type: ChecklistType, key: str) -> List[TemplateRevision]:
+        """Revisions of a template, oldest first"""
+        try:
+            lines = self._log_path(type, key).read_text(encoding='utf-8').splitlines()
+        except FileNotFoundError:
+            return []
+        return [TemplateRevision.model_validate_json(line) for line in lines if line]
+
+    def bump_generation(self, type: ChecklistType, key: str) -> None:
+        """Tell every worker which template changed"""
+        with self._file_lock("generation", self._generation_lock):
+            try:
+                generation = int(self.generation_path.read_text(encoding='utf-8').partition('\n')[0])
+            except (FileNotFoundError, ValueError):
+                generation = 0
+            atomic_write_text(self.generation_path, f"{generation + 1}\n{type.value}/{key}")
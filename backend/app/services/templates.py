@@ -1,73 +1,400 @@
+import bisect
+import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 import yaml
 from datetime import datetime
-from app.schemas.checklist import ChecklistTemplate, ChecklistType
+from app.core.config import get_settings
+from app.core.files import atomic_write_text
+from app.core.watch import create_watcher
+from app.schemas.checklist import ChecklistTemplate, ChecklistType, TemplateRevision
+from app.schemas.create_task import CreateTaskRequest
+from app.services.template_history import TemplateHistory
 from app.core.logging import get_logger
 
 logger = get_logger()
 
-class TemplateService:
-    """Service for managing DoR/DoD templates"""
+def parse_template(file_path: Path, type: ChecklistType) -> ChecklistTemplate:
+    """Parse markdown template file"""
+    content = file_path.read_text(encoding='utf-8')
     
-    def __init__(self, templates_dir: str = "checklists"):
-        self.base_path = Path(__file__).parent.parent.parent / templates_dir
-        self.templates: Dict[ChecklistType, Dict[str, ChecklistTemplate]] = {
-            ChecklistType.DOR: {},
-            ChecklistType.DOD: {}
-        }
-        self._load_templates()
+    if not content.startswith('---'):
+        raise ValueError(f"No frontmatter found in {file_path}")
+        
+    _, frontmatter, content = content.split('---', 2)
+    metadata = yaml.safe_load(frontmatter)
     
-    def _load_templates(self) -> None:
-        """Load all templates from filesystem"""
-        for checklist_type in ChecklistType:
-            type_dir = self.base_path / checklist_type.value
-            if not type_dir.exists():
-                logger.warning(f"Directory not found: {type_dir}")
+    return ChecklistTemplate(
+        key=file_path.stem,
+        type=type,
+        content=content.strip(),
+        **metadata
+    )
+
+# {{ name }} slots filled per task; other braces are left as written
+PLACEHOLDERS = ('epic', 'assignee', 'labels', 'due_date')
+_PLACEHOLDER = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+class CompiledTemplate:
+    """
+    Template content split once into literal text and placeholder slots
+
+    Rendering only joins strings, so filling a checklist per task does not
+    scan the markdown again.
+    """
+
+    __slots__ = ('literals', 'slots')
+
+    def __init__(self, content: str):
+        literals, slots = [], []
+        start = 0
+        for match in _PLACEHOLDER.finditer(content):
+            if match.group(1) not in PLACEHOLDERS:
                 continue
-                
-            for template_file in type_dir.glob("*.md"):
-                try:
-                    template = self._parse_template(template_file, checklist_type)
-                    self.templates[checklist_type][template.key] = template
-                    logger.info(f"Loaded template: {template.key} ({checklist_type})")
-                except Exception as e:
-                    logger.error(f"Error loading template {template_file}: {str(e)}")
+            literals.append(content[start:match.start()])
+            slots.append(match.group(1))
+            start = match.end()
+        literals.append(content[start:])
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.slots: Tuple[str, ...] = tuple(slots)
+
+    def render(self, values: Dict[str, str]) -> str:
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            parts.append(values.get(slot, ''))
+            parts.append(literal)
+        return ''.join(parts)
+
+def task_placeholders(request: CreateTaskRequest) -> Dict[str, str]:
+    """Placeholder values of a task being created"""
+    return {
+        'epic': request.epic_link or '',
+        'assignee': request.assignee or '',
+        'labels': ', '.join(request.labels or []),
+        'due_date': request.due_date.strftime('%Y-%m-%d') if request.due_date else ''
+    }
+
+def template_file_text(
+    name: str, description: str, version: str, content: str, tags: Optional[List[str]] = None
+) -> str:
+    """Markdown file with frontmatter; values are quoted as YAML needs, so a version stays a string"""
+    metadata: Dict[str, Any] = {'name': name, 'description': description, 'version': version}
+    if tags:
+        metadata['tags'] = tags
+    metadata = yaml.safe_dump(metadata, allow_unicode=True, sort_keys=False)
+    return f"---\n{metadata}---\n{content}"
+
+_WORD = re.compile(r'\w+')
+
+def _words(*texts: str) -> Set[str]:
+    return {word.lower() for text in texts for word in _WORD.findall(text)}
+
+class TemplateIndex:
+    """
+    Search index of one template type
+
+    Keeps keys sorted for stable paging and maps every word of a template's
+    key, name, description, version, tags and content to the templates
+    having it. Query words match as prefixes and all of them must match.
+    """
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self._words: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    def add(self, template: ChecklistTemplate) -> None:
+        self.remove(template.key)
+        bisect.insort(self.keys, template.key)
+        words = _words(
+            template.key, template.name, template.description, template.version, template.content, *template.tags
+        )
+        self._words[template.key] = words
+        for word in words:
+            if word not in self._postings:
+                self._postings[word] = set()
+                self._vocabulary = None
+            self._postings[word].add(template.key)
+
+    def remove(self, key: str) -> None:
+        words = self._words.pop(key, None)
+        if words is None:
+            return
+        del self.keys[bisect.bisect_left(self.keys, key)]
+        for word in words:
+            keys = self._postings[word]
+            keys.discard(key)
+            if not keys:
+                del self._postings[word]
+                self._vocabulary = None
+
+    def search(self, query: Optional[str] = None) -> List[str]:
+        """Sorted keys of templates matching every word of ``query``, all keys without one"""
+        words = _words(query or '')
+        if not words:
+            return list(self.keys)
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        found: Optional[Set[str]] = None
+        for word in words:
+            start = bisect.bisect_left(self._vocabulary, word)
+            matches: Set[str] = set()
+            for known in self._vocabulary[start:]:
+                if not known.startswith(word):
+                    break
+                matches |= self._postings[known]
+            found = matches if found is None else found & matches
+            if not found:
+                return []
+        return sorted(found)
+
+class _Entry(NamedTuple):
+    signature: Tuple[int, int, int]
+    template: ChecklistTemplate
+
+class TemplateStore:
+    """
+    Parsed templates of a checklists directory, kept current file by file
+
+    Nothing is read up front: a template is parsed on first access and a
+    type's directory is listed on first listing. A watcher (inotify, or
+    polling where it is unavailable) marks files changed outside the API;
+    only those are checked again and re-parsed when their mtime or size
+    differ from what was parsed. Writes through the API in any worker are
+    also announced by the history's generation file, checked on access.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        watch_mode: str = "auto",
+        poll_interval: float = 2.0,
+        generation_path: Optional[Path] = None
+    ):
+        self.base_path = base_path
+        self.watch_mode = watch_mode
+        self.poll_interval = poll_interval
+        self.generation_path = generation_path
+        self._generation: Optional[int] = None
+        self._entries: Dict[ChecklistType, Dict[str, _Entry]] = {type: {} for type in ChecklistType}
+        self._listed: Set[ChecklistType] = set()
+        self._dirty: Dict[ChecklistType, Set[str]] = {type: set() for type in ChecklistType}
+        self._compiled: Dict[ChecklistType, Dict[str, CompiledTemplate]] = {type: {} for type in ChecklistType}
+        self._index: Dict[ChecklistType, TemplateIndex] = {type: TemplateIndex() for type in ChecklistType}
+        self._lock = threading.RLock()
+        self._watcher = None
+        self._stats = {"parsed": 0, "compiled": 0, "changes": 0}
+
+    def _ensure_watching(self) -> None:
+        if self._watcher is not None or self.watch_mode == "off":
+            return
+        try:
+            self._watcher = create_watcher(self.base_path, self.invalidate, self.watch_mode, self.poll_interval)
+        except Exception as e:
+            logger.error(f"Error watching templates in {self.base_path}: {str(e)}")
+            self.watch_mode = "off"
+            return
+        if self._watcher is not None:
+            logger.info(f"Watching templates in {self.base_path} ({self._watcher.name})")
+
+    def _check_generation(self) -> None:
+        """
+        Drop what was parsed of templates any worker wrote since the last check
+
+        The generation file holds a write counter and the last written
+        template; if more than one write was missed, everything is dropped.
+        """
+        if self.generation_path is None:
+            return
+        try:
+            number, _, changed = self.generation_path.read_text(encoding='utf-8').partition('\n')
+            generation = int(number)
+        except (FileNotFoundError, ValueError):
+            generation, changed = 0, ''
+        if self._generation is not None and generation != self._generation:
+            type_name, _, key = changed.partition('/')
+            types = [type for type in ChecklistType if type.value == type_name]
+            if generation == self._generation + 1 and types:
+                self._forget(types[0], key)
+            else:
+                for type in ChecklistType:
+                    for key in list(self._entries[type]):
+                        self._forget(type, key)
+                    self._listed.discard(type)
+        self._generation = generation
+
+    def _drop(self, type: ChecklistType, key: str) -> None:
+        self._entries[type].pop(key, None)
+        self._compiled[type].pop(key, None)
+        self._index[type].remove(key)
+
+    def _forget(self, type: ChecklistType, key: str) -> None:
+        self._drop(type, key)
+        self._dirty[type].add(key)
+
+    def _load(self, type: ChecklistType, key: str) -> Optional[ChecklistTemplate]:
+        """Re-parse one template file if it changed since it was parsed"""
+        self._dirty[type].discard(key)
+        path = self.base_path / type.value / f"{key}.md"
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._drop(type, key)
+            return None
+        # Atomic writes replace the inode, so same-size writes within one mtime tick still differ
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        entry = self._entries[type].get(key)
+        if entry is not None and entry.signature == signature:
+            return entry.template
+        try:
+            template = parse_template(path, type)
+        except Exception as e:
+            logger.error(f"Error loading template {path}: {str(e)}")
+            self._drop(type, key)
+            return None
+        self._entries[type][key] = _Entry(signature, template)
+        self._compiled[type].pop(key, None)
+        self._index[type].add(template)
+        self._stats["parsed"] += 1
+        logger.debug(f"Loaded template: {key} ({type})")
+        return template
+
+    def get(self, type: ChecklistType, key: str) -> Optional[ChecklistTemplate]:
+        with self._lock:
+            self._ensure_watching()
+            self._check_generation()
+            entry = self._entries[type].get(key)
+            if key in self._dirty[type] or (entry is None and type not in self._listed):
+                return self._load(type, key)
+            return entry.template if entry is not None else None
+
+    def list(self, type: ChecklistType) -> List[ChecklistTemplate]:
+        """All templates of a type, by key"""
+        return self.search(type)
+
+    def search(
+        self,
+        type: ChecklistType,
+        query: Optional[str] = None,
+        start: int = 0,
+        limit: Optional[int] = None
+    ) -> List[ChecklistTemplate]:
+        """Templates of a type matching ``query``, by key, from position ``start``"""
+        with self._lock:
+            self._ensure_watching()
+            self._check_generation()
+            if type in self._listed:
+                for key in list(self._dirty[type]):
+                    self._load(type, key)
+            else:
+                type_dir = self.base_path / type.value
+                if not type_dir.exists():
+                    logger.warning(f"Directory not found: {type_dir}")
+                keys = [path.stem for path in type_dir.glob("*.md")]
+                for key in set(self._entries[type]) - set(keys):
+                    self._drop(type, key)
+                for key in keys:
+                    self._load(type, key)
+                self._listed.add(type)
+            keys = self._index[type].search(query)
+            keys = keys[start:start + limit] if limit is not None else keys[start:]
+            return [self._entries[type][key].template for key in keys]
+
+    def compiled(self, type: ChecklistType, key: str) -> Optional[CompiledTemplate]:
+        """Compiled form of a template, compiled again only after the file changes"""
+        with self._lock:
+            template = self.get(type, key)
+            if template is None:
+                return None
+            compiled = self._compiled[type].get(key)
+            if compiled is None:
+                compiled = self._compiled[type][key] = CompiledTemplate(template.content)
+                self._stats["compiled"] += 1
+            return compiled
+
+    def reload(self, type: ChecklistType, key: str) -> Optional[ChecklistTemplate]:
+        """Pick up a file written or removed through the API without waiting for the watcher"""
+        with self._lock:
+            self._check_generation()
+            return self._load(type, key)
+
+    def invalidate(self, path: Path) -> None:
+        """Mark a changed file, or everything in a changed directory, to be checked on next access"""
+        try:
+            parts = path.relative_to(self.base_path).parts
+        except ValueError:
+            return
+        with self._lock:
+            self._stats["changes"] += 1
+            for type in ChecklistType:
+                if parts and parts[0] != type.value:
+                    continue
+                if len(parts) <= 1:
+                    self._listed.discard(type)
+                    self._dirty[type].update(self._entries[type])
+                elif len(parts) == 2 and path.suffix == '.md':
+                    self._dirty[type].add(path.stem)
+
+    def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "watcher": self._watcher.name if self._watcher is not None else None,
+                "templates": sum(len(entries) for entries in self._entries.values()),
+                "pending": sum(len(keys) for keys in self._dirty.values())
+            }
+
+class TemplateService:
+    """Service for managing DoR/DoD templates"""
     
-    def _parse_template(self, file_path: Path, type: ChecklistType) -> ChecklistTemplate:
-        """Parse markdown template file"""
-        content = file_path.read_text(encoding='utf-8')
-        
-        if not content.startswith('---'):
-            raise ValueError(f"No frontmatter found in {file_path}")
-            
-        _, frontmatter, content = content.split('---', 2)
-        metadata = yaml.safe_load(frontmatter)
-        
-        return ChecklistTemplate(
-            key=file_path.stem,
-            type=type,
-            content=content.strip(),
-            **metadata
+    def __init__(self, templates_dir: str = "checklists", history_dir: Optional[str] = None):
+        self.base_path = Path(__file__).parent.parent.parent / templates_dir
+        settings = get_settings()
+        self.history = TemplateHistory(Path(history_dir or settings['template_history_path']))
+        self.store = TemplateStore(
+            self.base_path,
+            settings['template_watch'],
+            settings['template_poll_interval'],
+            generation_path=self.history.generation_path
         )
     
     def get_template(self, type: ChecklistType, key: str) -> Optional[ChecklistTemplate]:
         """Get template by type and key"""
-        return self.templates[type].get(key)
+        return self.store.get(type, key)
     
-    def get_templates(self, type: ChecklistType) -> List[ChecklistTemplate]:
-        """Get all templates of given type"""
-        return list(self.templates[type].values())
+    def get_templates(
+        self,
+        type: ChecklistType,
+        query: Optional[str] = None,
+        start: int = 0,
+        limit: Optional[int] = None
+    ) -> List[ChecklistTemplate]:
+        """Get templates of given type, optionally matching words of ``query``, ordered by key"""
+        return self.store.search(type, query, start, limit)
+
+    def get_history(self, type: ChecklistType, key: str) -> List[TemplateRevision]:
+        """Get revisions of a template written through the API, oldest first"""
+        return self.history.revisions(type, key)
     
     def delete_template(self, type: ChecklistType, key: str) -> bool:
         """Delete template file"""
         try:
             template_path = self.base_path / type.value / f"{key}.md"
-            if not template_path.exists():
-                return False
-                
-            template_path.unlink()
-            del self.templates[type][key]
+            with self.history.lock(type, key):
+                if not template_path.exists():
+                    return False
+
+                before = template_path.read_text(encoding='utf-8')
+                template_path.unlink()
+                self.store.reload(type, key)
+                self.history.record(type, key, "delete", before, "")
             logger.info(f"Deleted template: {key} ({type})")
             return True
         except Exception as e:
@@ -81,28 +408,28 @@ class TemplateService:
         name: str,
         description: str,
         content: str,
-        version: str = "1.0"
+        version: str = "1.0",
+        tags: Optional[List[str]] = None
     ) -> Optional[ChecklistTemplate]:
         """Update existing template"""
         try:
             template_path = self.base_path / type.value / f"{key}.md"
-            if not template_path.exists():
-                return None
-                
             # Create template content
-            template_content = f"""---
-name: {name}
-description: {description}
-version: {version}
----
-{content}"""
-
-            # Write to file
-            template_path.write_text(template_content, encoding='utf-8')
-            
-            # Update cache
-            template = self._parse_template(template_path, type)
-            self.templates[type][key] = template
+            template_content = template_file_text(name, description, version, content, tags)
+
+            with self.history.lock(type, key):
+                if not template_path.exists():
+                    return None
+
+                # Replace the file whole, readers never see it half-written
+                before = template_path.read_text(encoding='utf-8')
+                atomic_write_text(template_path, template_content)
+
+                # Update cache
+                template = self.store.reload(type, key)
+                self.history.record(type, key, "update", before, template_content, template)
+            if template is None:
+                return None
             
             logger.info(f"Updated template: {key} ({type})")
             return template
@@ -118,32 +445,29 @@ version: {version}
         name: str,
         description: str,
         content: str,
-        version: str = "1.0"
+        version: str = "1.0",
+        tags: Optional[List[str]] = None
     ) -> Optional[ChecklistTemplate]:
         """Create new template file"""
         try:
             template_path = self.base_path / type.value / f"{key}.md"
-            if template_path.exists():
-                logger.warning(f"Template {key} already exists")
-                return None
-                
-            # Create directory if not exists
-            template_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Create template content
-            template_content = f"""---
-name: {name}
-description: {description}
-version: {version}
----
-{content}"""
-
-            # Write to file
-            template_path.write_text(template_content, encoding='utf-8')
-            
-            # Parse and cache template
-            template = self._parse_template(template_path, type)
-            self.templates[type][key] = template
+            template_content = template_file_text(name, description, version, content, tags)
+
+            with self.history.lock(type, key):
+                if template_path.exists():
+                    logger.warning(f"Template {key} already exists")
+                    return None
+
+                # Create directory if not exists
+                template_path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_text(template_path, template_content)
+
+                # Parse and cache template
+                template = self.store.reload(type, key)
+                self.history.record(type, key, "create", "", template_content, template)
+            if template is None:
+                return None
             
             logger.info(f"Created template: {key} ({type})")
             return template
@@ -160,4 +484,32 @@ def get_template_service() -> TemplateService:
     global _template_service
     if _template_service is None:
         _template_service = TemplateService()
-    return _template_service
\ No newline at end of file
+    return _template_service
+
+def render_task_description(request: CreateTaskRequest) -> Optional[str]:
+    """
+    Description of a task being created, followed by its DoR/DoD checklists
+
+    Checklists are rendered from compiled templates with the task's
+    placeholders. Raises ValueError for an unknown template.
+    """
+    sections = [request.description] if request.description else []
+    checklists = [(ChecklistType.DOR, request.dor_template), (ChecklistType.DOD, request.dod_template)]
+    if any(key for _, key in checklists):
+        store = get_template_service().store
+        values = task_placeholders(request)
+        for type, key in checklists:
+            if not key:
+                continue
+            compiled = store.compiled(type, key)
+            if compiled is None:
+                raise ValueError(f"{type.value.upper()} template '{key}' not found")
+            sections.append(compiled.render(values))
+    return '\n\n'.join(sections) or None
+
+def close_template_service() -> None:
+    """Stop watching the templates directory"""
+    global _template_service
+    if _template_service is not None:
+        _template_service.store.close()
+        _template_service = None
@@ -1,6 +1,14 @@
 import pytest
 import os
 from dotenv import load_dotenv
+from app.core.cache import clear_caches
+from app.core.breaker import get_circuit_breaker
+from app.core.fields import get_field_resolver
+from app.core.ratelimit import get_rate_limiter
+from app.core.stale import get_last_known_good
+from app.services.label_index import get_label_index
+from app.services.metadata import get_metadata_registry
+from app.services.mirror_store import close_mirror_store
 
 def pytest_configure(config):
     """Configure pytest with custom markers"""
@@ -53,4 +61,28 @@ def env_setup():
         if value is not None:
             os.environ[key] = value
         else:
-            os.environ.pop(key, None)
\ No newline at end of file
+            os.environ.pop(key, None)
+
+@pytest.fixture(autouse=True)
+def reset_caches(monkeypatch, tmp_path):
+    """Start every test with empty service caches, label index, mirror, metadata, field ids, rate limiter, breaker and last-known-good reads"""
+    monkeypatch.setenv('LABEL_INDEX_PATH', str(tmp_path / 'label_index.json'))
+    monkeypatch.setenv('MIRROR_PATH', str(tmp_path / 'mirror.sqlite3'))
+    monkeypatch.setenv('FIELD_CACHE_PATH', str(tmp_path / 'fields.json'))
+    clear_caches()
+    get_label_index.cache_clear()
+    close_mirror_store()
+    get_metadata_registry.cache_clear()
+    get_field_resolver.cache_clear()
+    get_rate_limiter.cache_clear()
+    get_circuit_breaker.cache_clear()
+    get_last_known_good.cache_clear()
+    yield
+    clear_caches()
+    get_label_index.cache_clear()
+    close_mirror_store()
+    get_metadata_registry.cache_clear()
+    get_field_resolver.cache_clear()
+    get_rate_limiter.cache_clear()
+    get_circuit_breaker.cache_clear()
+    get_last_known_good.cache_clear()
@@ -0,0 +1,97 @@
+import json
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+from datetime import datetime
+from app.main import app
+from app.core.pagination import decode_cursor, encode_cursor
+from app.schemas.epic import EpicAnalysis
+from app.schemas.link import ExternalLink, ResourceType
+from app.schemas.task import TaskSchema
+
+client = TestClient(app)
+
+def make_task(index: int) -> TaskSchema:
+    return TaskSchema(
+        key=f"TEST-{index}",
+        summary=f"Task {index}",
+        created=datetime.now(),
+        updated=datetime.now()
+    )
+
+def test_read_epic_tasks_first_page():
+    """Test first page returns cursor of the next one"""
+    page = ([make_task(1), make_task(2)], 2)
+    with patch('app.api.v1.epics.get_epic_tasks_page', return_value=page) as mock_page:
+        response = client.get("/api/v1/epics/TEST-100/tasks?limit=2")
+    
+    assert response.status_code == 200
+    assert [task["key"] for task in response.json()] == ["TEST-1", "TEST-2"]
+    assert decode_cursor(response.headers["X-Next-Cursor"]) == 2
+    mock_page.assert_called_once_with("TEST-100", 0, 2)
+
+def test_read_epic_tasks_with_cursor():
+    """Test cursor is decoded into offset and last page has no cursor"""
+    with patch('app.api.v1.epics.get_epic_tasks_page', return_value=([make_task(3)], None)) as mock_page:
+        response = client.get(f"/api/v1/epics/TEST-100/tasks?cursor={encode_cursor(2)}&limit=2")
+    
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+    mock_page.assert_called_once_with("TEST-100", 2, 2)
+
+def test_read_epic_tasks_invalid_cursor():
+    response = client.get("/api/v1/epics/TEST-100/tasks?cursor=garbage")
+    assert response.status_code == 400
+
+def test_read_epic_tasks_not_found():
+    with patch('app.api.v1.epics.get_epic_tasks_page', return_value=None):
+        response = client.get("/api/v1/epics/TEST-100/tasks")
+    assert response.status_code == 404
+
+def test_stream_epic_tasks():
+    """Test tasks are streamed as NDJSON lines"""
+    async def pages():
+        yield [make_task(1), make_task(2)]
+        yield [make_task(3)]
+
+    with patch('app.api.v1.epics.open_epic_task_stream', return_value=pages()):
+        response = client.get("/api/v1/epics/TEST-100/tasks/stream")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["key"] for line in lines] == ["TEST-1", "TEST-2", "TEST-3"]
+
+def test_stream_epic_tasks_not_found():
+    with patch('app.api.v1.epics.open_epic_task_stream', return_value=None):
+        response = client.get("/api/v1/epics/TEST-100/tasks/stream")
+    assert response.status_code == 404
+
+def test_read_epic_analysis():
+    analysis = EpicAnalysis(
+        epic="TEST-1", tasks=2, links=1, order=["TEST-2", "TEST-3"],
+        critical_path=["TEST-2", "TEST-3"], critical_path_hours=4.0
+    )
+    with patch('app.api.v1.epics.analyze_epic', return_value=analysis):
+        response = client.get("/api/v1/epics/TEST-1/analysis")
+        assert response.status_code == 200
+        assert response.json()["critical_path"] == ["TEST-2", "TEST-3"]
+
+def test_read_epic_analysis_not_found():
+    with patch('app.api.v1.epics.analyze_epic', return_value=None):
+        assert client.get("/api/v1/epics/TEST-404/analysis").status_code == 404
+
+def test_read_epic_external_links():
+    links = {
+        "TEST-2": [ExternalLink(id="10", type=ResourceType.WEB, source="TEST-2", target="Spec", title="Spec", url="https://example.com/spec")],
+        "TEST-3": []
+    }
+    with patch('app.api.v1.epics.get_epic_tasks', return_value=[make_task(2), make_task(3)]), \
+         patch('app.api.v1.epics.get_external_links_for', return_value=links) as mock_links:
+        response = client.get("/api/v1/epics/TEST-1/external-links")
+        assert response.status_code == 200
+        assert [link["source"] for link in response.json()] == ["TEST-2"]
+        mock_links.assert_called_once_with(["TEST-2", "TEST-3"])
+
+def test_read_epic_external_links_not_found():
+    with patch('app.api.v1.epics.get_epic_tasks', return_value=None):
+        assert client.get("/api/v1/epics/TEST-404/external-links").status_code == 404
@@ -1,8 +1,8 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 from app.main import app
-from app.schemas.link import LinkType, ResourceType, TaskLink, ExternalLink
+from app.schemas.link import BulkLinkResult, LinkGraph, LinkType, ResourceType, TaskLink, ExternalLink
 
 client = TestClient(app)
 
@@ -135,4 +135,42 @@ def test_create_task_link_error(mock_links_service):
     
     # Verify error response
     assert response.status_code == 400
-    assert response.json()["detail"] == "Failed to create link"
\ No newline at end of file
+    assert response.json()["detail"] == "Failed to create link"
+
+def test_get_link_graph():
+    """Test graph endpoint parses depth and link types"""
+    graph = LinkGraph(root="PROJ-123", depth=3, nodes=[{"key": "PROJ-123", "depth": 0}])
+    with patch('app.api.v1.links.get_link_graph', AsyncMock(return_value=graph)) as mock_graph:
+        response = client.get("/api/v1/tasks/PROJ-123/links/graph?depth=3&types=is blocked by")
+    assert response.status_code == 200
+    assert response.json()["nodes"] == [{"key": "PROJ-123", "depth": 0}]
+    mock_graph.assert_awaited_once_with("PROJ-123", 3, {LinkType.BLOCKED_BY})
+
+def test_get_link_graph_rejects_bad_input():
+    assert client.get("/api/v1/tasks/PROJ-123/links/graph?types=parent of").status_code == 400
+    assert client.get("/api/v1/tasks/PROJ-123/links/graph?depth=50").status_code == 400
+    assert client.get("/api/v1/tasks/abc) OR project = X/links/graph").status_code == 400
+
+def test_get_link_graph_not_found():
+    with patch('app.api.v1.links.get_link_graph', AsyncMock(return_value=None)):
+        assert client.get("/api/v1/tasks/PROJ-404/links/graph").status_code == 404
+
+def test_create_links_bulk():
+    """Test bulk endpoint counts per-item outcomes"""
+    results = [
+        BulkLinkResult(index=0, status="created", id="200"),
+        BulkLinkResult(index=1, status="exists", id="100")
+    ]
+    with patch('app.api.v1.links.create_links_bulk', AsyncMock(return_value=results)) as mock_bulk:
+        response = client.post("/api/v1/links/bulk", json=[
+            {"source": "PROJ-1", "type": "blocks", "target": "PROJ-2"},
+            {"source": "PROJ-2", "type": "relates to", "target": "PROJ-3"}
+        ])
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["existing"], data["failed"]) == (1, 1, 0)
+    assert [result["id"] for result in data["results"]] == ["200", "100"]
+    assert [request.source for request in mock_bulk.await_args.args[1]] == ["PROJ-1", "PROJ-2"]
+
+def test_create_links_bulk_rejects_empty_request():
+    assert client.post("/api/v1/links/bulk", json=[]).status_code == 422
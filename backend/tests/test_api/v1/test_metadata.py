@@ -0,0 +1,27 @@
+from fastapi.testclient import TestClient
+from unittest.mock import Mock
+from app.main import app
+
+client = TestClient(app)
+
+def test_refresh_metadata(mocker):
+    """Test cache-bust endpoint reloads metadata"""
+    jira = Mock()
+    jira.fields.return_value = [{"id": "summary", "name": "Summary"}]
+    jira.priorities.return_value = []
+    jira.issue_link_types.return_value = []
+    mocker.patch('app.services.metadata.get_jira_client', return_value=jira)
+
+    response = client.post("/api/v1/metadata/refresh")
+
+    assert response.status_code == 200
+    assert response.json()["fields"] == 1
+    assert client.get("/api/v1/metadata/").json()["fields"][0]["id"] == "summary"
+    jira.fields.assert_called_once()
+
+def test_refresh_metadata_failure(mocker):
+    jira = Mock()
+    jira.fields.side_effect = Exception("JIRA down")
+    mocker.patch('app.services.metadata.get_jira_client', return_value=jira)
+
+    assert client.post("/api/v1/metadata/refresh").status_code == 503
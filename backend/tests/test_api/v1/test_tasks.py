@@ -1,10 +1,13 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
 from datetime import datetime
+from app.core.cache import clear_caches
+from app.core.errors import CircuitOpenError, UpstreamThrottledError
 from app.main import app
 from app.schemas.task import TaskSchema
-from app.schemas.create_task import TaskPriority
+from app.schemas.create_task import TaskPriority, TaskReturn
 
 client = TestClient(app)
 
@@ -62,6 +65,17 @@ def test_read_task_success(mock_task):
         assert response.status_code == 200
         assert response.json()["key"] == "TEST-123"
 
+def test_read_task_sparse_fields(mock_task):
+    with patch('app.api.v1.tasks.get_task', return_value=mock_task) as mock_get_task:
+        response = client.get("/api/v1/tasks/TEST-123?fields=summary")
+        assert response.status_code == 200
+        assert response.json() == {"key": "TEST-123", "summary": "Test Task"}
+        mock_get_task.assert_called_once_with("TEST-123", fields={"key", "summary"})
+
+def test_read_task_unknown_field():
+    response = client.get("/api/v1/tasks/TEST-123?fields=nonexistent")
+    assert response.status_code == 400
+
 def test_read_task_not_found():
     with patch('app.api.v1.tasks.get_task', return_value=None) as mock_get_task:
         print(f"DEBUG: Mock configured: {mock_get_task}")  # Debug print
@@ -75,6 +89,32 @@ def test_read_task_error():
         response = client.get("/api/v1/tasks/TEST-123")
         assert response.status_code == 500
 
+def test_read_task_throttled():
+    """Test JIRA throttling is reported as 429 with Retry-After, not as 404"""
+    error = UpstreamThrottledError("JIRA rate limit exceeded", retry_after=12.4)
+    with patch('app.api.v1.tasks.get_task', side_effect=error):
+        response = client.get("/api/v1/tasks/TEST-123")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "12"
+
+def test_read_task_served_stale_while_jira_down():
+    """Test last known task is returned with a Warning while JIRA fails"""
+    issue = Mock(key="TEST-123")
+    issue.fields.summary = "Test Task"
+    issue.fields.description = None
+    issue.fields.created = datetime(2024, 1, 1)
+    issue.fields.updated = datetime(2024, 1, 2)
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.issue = AsyncMock(return_value=issue)
+        assert "Warning" not in client.get("/api/v1/tasks/TEST-123").headers
+
+        clear_caches()
+        mock_client.return_value.issue = AsyncMock(side_effect=CircuitOpenError("jira is unavailable", retry_after=30))
+        response = client.get("/api/v1/tasks/TEST-123")
+        assert response.status_code == 200
+        assert response.json()["summary"] == "Test Task"
+        assert response.headers["Warning"] == '110 - "Response is Stale"'
+
 def test_create_task_minimal(mock_tasks_service):
     """Test creating task with minimal fields"""
     response = client.post(
@@ -113,6 +153,14 @@ def test_create_task_full(mock_tasks_service):
     data = response.json()
     assert data["key"] == "PROJ-123"
 
+def test_create_task_unknown_template(mock_tasks_service):
+    """Test why fields could not be built reaches the client"""
+    mock_tasks_service.create_task.side_effect = ValueError("DOR template 'missing' not found")
+    response = client.post("/api/v1/tasks", json={"project_key": "PROJ", "summary": "Test task", "dor_template": "missing"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "DOR template 'missing' not found"
+
 def test_get_task_types(mock_tasks_service):
     """Test getting task types"""
     response = client.get("/api/v1/tasks/types/PROJ")
@@ -120,4 +168,99 @@ def test_get_task_types(mock_tasks_service):
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
-    assert data[0]["name"] == "Engineer"
\ No newline at end of file
+    assert data[0]["name"] == "Engineer"
+def bulk_create(field_list, prefetch=True):
+    return [
+        {"status": "Success", "issue": Mock(key=f"PROJ-{i}", id=str(i)), "error": None, "input_fields": fields}
+        for i, fields in enumerate(field_list)
+    ]
+
+def test_create_tasks_bulk(mock_jira_client):
+    """Test bulk endpoint returns per-item results in request order"""
+    mock_jira_client.create_issues.side_effect = bulk_create
+    response = client.post(
+        "/api/v1/tasks/bulk",
+        json=[{"project_key": "PROJ", "summary": f"Task {i}"} for i in range(3)]
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 3
+    assert data["failed"] == 0
+    assert [r["index"] for r in data["results"]] == [0, 1, 2]
+
+def test_create_tasks_bulk_stream(mock_jira_client, monkeypatch):
+    """Test streamed bulk create reports progress per chunk"""
+    monkeypatch.setenv("BULK_CREATE_CHUNK_SIZE", "2")
+    mock_jira_client.create_issues.side_effect = bulk_create
+    response = client.post(
+        "/api/v1/tasks/bulk/stream",
+        json=[{"project_key": "PROJ", "summary": f"Task {i}"} for i in range(5)]
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 3
+    assert lines[-1]["done"] == 5
+    assert sum(len(line["results"]) for line in lines) == 5
+
+def test_create_tasks_bulk_limits(monkeypatch):
+    """Test empty and oversized bulk requests are rejected"""
+    monkeypatch.setenv("BULK_CREATE_MAX_ITEMS", "2")
+    assert client.post("/api/v1/tasks/bulk", json=[]).status_code == 422
+    response = client.post(
+        "/api/v1/tasks/bulk",
+        json=[{"project_key": "PROJ", "summary": "Task"}] * 3
+    )
+    assert response.status_code == 422
+    assert client.post("/api/v1/tasks/bulk", json=[{"summary": "no project"}]).status_code == 422
+
+def test_create_task_async_return(mock_tasks_service):
+    """Test async mode answers 202 and hydrates the task in the background"""
+    response = client.post(
+        "/api/v1/tasks?return=async",
+        json={"project_key": "PROJ", "summary": "Test task"}
+    )
+
+    assert response.status_code == 202
+    assert response.json()["key"] == "PROJ-123"
+    assert mock_tasks_service.create_task.call_args.args[1] == TaskReturn.ASYNC
+    mock_tasks_service.hydrate_task.assert_called_once_with("PROJ-123")
+
+def test_create_task_invalid_return(mock_tasks_service):
+    response = client.post(
+        "/api/v1/tasks?return=everything",
+        json={"project_key": "PROJ", "summary": "Test task"}
+    )
+    assert response.status_code == 422
+
+def test_read_tasks_batch(mock_task):
+    """Test batch read keeps request order and marks missing keys"""
+    async def fake_get_tasks(keys, fields=None):
+        return {"TEST-123": mock_task, "TEST-404": None}
+
+    with patch('app.api.v1.tasks.get_tasks', fake_get_tasks):
+        response = client.post("/api/v1/tasks/batch", json={"keys": ["TEST-404", "TEST-123"]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["key"] for item in data] == ["TEST-404", "TEST-123"]
+    assert data[0]["status"] == "not_found"
+    assert data[1]["task"]["summary"] == "Test Task"
+
+def test_read_tasks_by_query(mock_task):
+    """Test GET /tasks?keys= with sparse fields"""
+    async def fake_get_tasks(keys, fields=None):
+        assert keys == ["TEST-123"]
+        return {"TEST-123": mock_task}
+
+    with patch('app.api.v1.tasks.get_tasks', fake_get_tasks):
+        response = client.get("/api/v1/tasks/?keys=TEST-123,TEST-123&fields=summary")
+
+    assert response.status_code == 200
+    assert response.json() == [{"key": "TEST-123", "status": "ok", "task": {"key": "TEST-123", "summary": "Test Task"}}]
+
+def test_read_tasks_invalid_key():
+    """Test keys that could break the JQL are rejected"""
+    response = client.post("/api/v1/tasks/batch", json={"keys": ["TEST-1) OR (project = X"]})
+    assert response.status_code == 400
@@ -3,7 +3,8 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch, Mock
 from datetime import datetime
 from app.main import app
-from app.schemas.checklist import ChecklistType, ChecklistTemplate
+from app.core.pagination import decode_cursor, encode_cursor
+from app.schemas.checklist import ChecklistType, ChecklistTemplate, TemplateRevision
 
 client = TestClient(app)
 
@@ -197,4 +198,47 @@ def test_create_template_service_error(mock_template_service):
     )
     
     assert response.status_code == 500
-    assert "Failed to create template" in response.json()["detail"]
\ No newline at end of file
+    assert "Failed to create template" in response.json()["detail"]
+
+def test_get_template_history(mock_template_service):
+    """Test revisions of a template are listed oldest first"""
+    mock_template_service.get_history.return_value = [
+        TemplateRevision(revision=1, action="create", at=datetime.now(), name="Release", version="1.0", diff="+* Tagged\n")
+    ]
+    response = client.get("/api/v1/templates/dod/release/history")
+    assert response.status_code == 200
+    assert response.json()[0]["action"] == "create"
+    mock_template_service.get_history.assert_called_once_with(ChecklistType.DOD, "release")
+
+def test_get_template_history_not_found(mock_template_service):
+    mock_template_service.get_history.return_value = []
+    assert client.get("/api/v1/templates/dod/missing/history").status_code == 404
+
+def test_list_templates_search_page(mock_template, mock_template_service):
+    """Test one extra template is asked for to decide on the next page cursor"""
+    mock_template_service.get_templates.return_value = [mock_template, mock_template]
+
+    response = client.get("/api/v1/templates/dor?q=standard&limit=1")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert decode_cursor(response.headers["X-Next-Cursor"]) == 1
+    mock_template_service.get_templates.assert_called_once_with(ChecklistType.DOR, "standard", 0, 2)
+
+    mock_template_service.get_templates.return_value = []
+    response = client.get(f"/api/v1/templates/dor?q=standard&limit=1&cursor={encode_cursor(1)}")
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+def test_list_templates_summary(mock_template, mock_template_service):
+    mock_template_service.get_templates.return_value = [mock_template]
+
+    response = client.get("/api/v1/templates/dor?view=summary")
+    assert response.status_code == 200
+    assert response.json() == [{
+        "key": "standard", "name": "Standard Template", "type": "dor",
+        "description": "Standard checklist template", "version": "1.0", "tags": []
+    }]
+
+def test_list_templates_invalid_cursor(mock_template_service):
+    assert client.get("/api/v1/templates/dor?cursor=bad").status_code == 400
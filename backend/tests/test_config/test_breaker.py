@@ -0,0 +1,65 @@
+import pytest
+from unittest.mock import patch
+from app.core.breaker import CircuitBreaker
+from app.core.errors import CircuitOpenError, UpstreamError, UpstreamThrottledError
+
+def fail(breaker):
+    with pytest.raises(UpstreamError):
+        with breaker.call():
+            raise UpstreamError("down")
+
+def test_opens_on_failure_rate():
+    """Test circuit opens once enough calls in the window failed"""
+    breaker = CircuitBreaker("test", window=4, min_calls=4, failure_rate=0.5)
+    with breaker.call():
+        pass
+    fail(breaker)
+    with breaker.call():
+        pass
+    assert breaker.state == CircuitBreaker.CLOSED
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert 0 < error.value.retry_after <= 30
+    assert breaker.stats()["rejected"] == 1
+
+def test_slow_calls_count_as_failures():
+    """Test calls slower than the latency threshold trip the circuit"""
+    breaker = CircuitBreaker("test", window=2, min_calls=2, slow_call=1.0)
+    breaker.record(False, duration=2.0)
+    breaker.record(False, duration=0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["slow"] == 1
+
+def test_throttling_and_unrelated_errors_do_not_count():
+    """Test 429s and client errors leave the circuit alone"""
+    breaker = CircuitBreaker("test", window=2, min_calls=2)
+    for error in (UpstreamThrottledError("429"), ValueError("bad input")):
+        with pytest.raises(type(error)):
+            with breaker.call():
+                raise error
+    with breaker.call() as call:
+        call.failed = None
+    assert breaker.stats()["window"] == 0
+
+def test_half_open_probe():
+    """Test a single probe after the reset timeout closes or reopens the circuit"""
+    breaker = CircuitBreaker("test", window=1, min_calls=1, reset_timeout=10)
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    later = breaker._opened_at + 11
+    with patch('app.core.breaker.time.monotonic', return_value=later):
+        assert breaker.before_call() is True
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record(True, probe=True)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with patch('app.core.breaker.time.monotonic', return_value=breaker._opened_at + 11):
+        with breaker.call():
+            pass
+    assert breaker.state == CircuitBreaker.CLOSED
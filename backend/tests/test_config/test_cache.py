@@ -0,0 +1,161 @@
+import socketserver
+import threading
+import time
+from typing import List
+from unittest.mock import patch
+import pytest
+from app.core.cache import Cache, MemoryBackend, RedisBackend, SQLiteBackend
+from app.schemas.label import LabelSchema
+
+LABEL = LabelSchema(
+    key="bug",
+    name="Bug",
+    created="2024-01-01T10:00:00+03:00",
+    updated="2024-01-02T10:00:00+03:00",
+    used_in=["TEST-1"]
+)
+
+class RespHandler(socketserver.StreamRequestHandler):
+    """Minimal Redis-protocol stand-in: GET/SET PX/DEL/SCAN"""
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    @staticmethod
+    def bulk(value):
+        return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        store = self.server.store
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            command = args[0].upper()
+            if command == b"GET":
+                item = store.get(args[1])
+                alive = item is not None and item[1] > time.time()
+                self.wfile.write(self.bulk(item[0] if alive else None))
+            elif command == b"SET":
+                store[args[1]] = (args[2], time.time() + int(args[4]) / 1000)
+                self.wfile.write(b"+OK\r\n")
+            elif command == b"DEL":
+                removed = sum(store.pop(key, None) is not None for key in args[1:])
+                self.wfile.write(b":%d\r\n" % removed)
+            elif command == b"SCAN":
+                prefix = args[3].rstrip(b"*")
+                keys = [key for key in store if key.startswith(prefix)]
+                reply = b"*2\r\n" + self.bulk(b"0") + b"*%d\r\n" % len(keys)
+                self.wfile.write(reply + b"".join(self.bulk(key) for key in keys))
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+
+@pytest.fixture
+def redis_standin():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), RespHandler)
+    server.daemon_threads = True
+    server.store = {}
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryBackend(max_entries=16)
+    elif request.param == "sqlite":
+        backend = SQLiteBackend(str(tmp_path / "cache.sqlite3"))
+    else:
+        backend = RedisBackend(request.getfixturevalue("redis_standin"))
+    yield backend
+    backend.close()
+
+def test_roundtrip_and_counters(backend):
+    """Test typed values survive every backend"""
+    cache = Cache(backend, "labels", List[LabelSchema], ttl=30, stale_ttl=60)
+    assert cache.get("LOGIQPROD") is None
+
+    cache.set("LOGIQPROD", [LABEL], version="v1")
+    entry = cache.get("LOGIQPROD")
+
+    assert entry.value == [LABEL]
+    assert entry.version == "v1"
+    assert entry.is_fresh()
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_clear_is_scoped_to_namespace(backend):
+    """Test clearing one namespace keeps the others"""
+    labels = Cache(backend, "label", LabelSchema, ttl=30, stale_ttl=60)
+    other = Cache(backend, "label_other", LabelSchema, ttl=30, stale_ttl=60)
+    labels.set("bug", LABEL)
+    other.set("bug", LABEL)
+
+    labels.clear()
+
+    assert labels.get("bug") is None
+    assert other.get("bug") is not None
+
+def test_stale_entry_and_revalidation(backend):
+    """Test expired entry stays readable within the stale window"""
+    cache = Cache(backend, "label", LabelSchema, ttl=10, stale_ttl=60)
+    cache.set("bug", LABEL, version="v1")
+
+    with patch("app.core.cache.time.time", return_value=time.time() + 30):
+        entry = cache.get("bug")
+        assert not entry.is_fresh()
+        cache.touch("bug", entry)
+        assert cache.get("bug").is_fresh()
+
+    assert cache.stats()["revalidated"] == 1
+
+def test_memory_lru_eviction():
+    """Test least recently used entry is evicted over max_entries"""
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", b"1", 60)
+    backend.set("b", b"2", 60)
+    backend.get("a")
+    backend.set("c", b"3", 60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.stats()["evictions"] == 1
+
+def test_sqlite_shared_between_instances(tmp_path):
+    """Test second worker sees entries written by the first"""
+    path = str(tmp_path / "cache.sqlite3")
+    first, second = SQLiteBackend(path), SQLiteBackend(path)
+    first.set("jira-sonnet:task:A-1", b"payload", 60)
+    assert second.get("jira-sonnet:task:A-1") == b"payload"
+    first.close()
+    second.close()
+
+def test_backend_failure_is_a_miss():
+    """Test unreachable backend degrades to cache misses"""
+    cache = Cache(RedisBackend("redis://127.0.0.1:1/0"), "label", LabelSchema, ttl=30, stale_ttl=60)
+    cache.set("bug", LABEL)
+    assert cache.get("bug") is None
+    assert cache.stats()["errors"] == 2
+
+def test_unreachable_redis_fails_fast_until_retry():
+    """Test a failed connect is not retried by every call while the server is down"""
+    backend = RedisBackend("redis://127.0.0.1:1/0", retry_interval=60)
+    with patch("app.core.cache.socket.create_connection", side_effect=ConnectionRefusedError) as connect:
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                backend.get("jira-sonnet:label:bug")
+        assert connect.call_count == 1
+
+        with patch("app.core.cache.time.monotonic", return_value=time.monotonic() + 61):
+            with pytest.raises(ConnectionError):
+                backend.get("jira-sonnet:label:bug")
+        assert connect.call_count == 2
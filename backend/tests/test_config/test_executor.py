@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import pytest
+from app.core.executor import UpstreamPool, get_executor_stats, run_blocking, shutdown_executors
+from app.core.config import get_settings
+
+@pytest.fixture(autouse=True)
+def reset_pools():
+    shutdown_executors()
+    yield
+    shutdown_executors()
+
+@pytest.mark.asyncio
+async def test_run_blocking_uses_worker_thread():
+    """Test blocking call runs outside event loop thread"""
+    loop_thread = threading.get_ident()
+    worker_thread = await run_blocking(threading.get_ident)
+    assert worker_thread != loop_thread
+    assert get_executor_stats()["jira"]["completed"] == 1
+
+@pytest.mark.asyncio
+async def test_pool_limit_bounds_concurrency():
+    """Test no more than limit calls run at once and queue depth is tracked"""
+    pool = UpstreamPool("test", max_workers=2)
+    release = threading.Event()
+    running = []
+    peak = []
+
+    def work():
+        running.append(1)
+        peak.append(len(running))
+        release.wait(timeout=5)
+        running.pop()
+
+    calls = [asyncio.ensure_future(pool.run(work)) for _ in range(5)]
+    await asyncio.sleep(0.1)
+    stats = pool.stats()
+    assert stats["active"] == 2
+    assert stats["queued"] == 3
+
+    release.set()
+    await asyncio.gather(*calls)
+    pool.shutdown()
+
+    assert max(peak) <= 2
+    assert pool.stats()["completed"] == 5
+    assert pool.stats()["max_queued"] >= 3
+
+@pytest.mark.asyncio
+async def test_failures_are_counted():
+    """Test exceptions propagate and are counted"""
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await run_blocking(fail, upstream="jira-write")
+    assert get_executor_stats()["jira-write"]["failed"] == 1
+
+def test_upstream_limits_setting(monkeypatch):
+    """Test per-upstream limits are parsed from environment"""
+    monkeypatch.setenv("EXECUTOR_UPSTREAM_LIMITS", "jira=8, jira-write=2")
+    assert get_settings()["executor_upstream_limits"] == {"jira": 8, "jira-write": 2}
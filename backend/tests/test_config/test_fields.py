@@ -0,0 +1,71 @@
+import threading
+from app.core.fields import FieldResolver, get_field_resolver
+from app.schemas.base import jira_fields_for
+from app.schemas.epic import EpicSchema
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "clauseNames": ["summary"]},
+    {"id": "customfield_20001", "name": "Ссылка на эпик", "clauseNames": ["cf[20001]", "Epic Link"]},
+    {"id": "customfield_20002", "name": "Epic Name", "clauseNames": ["cf[20002]"]},
+    {"id": "customfield_20003", "name": "Story Points", "clauseNames": ["cf[20003]"]}
+]
+
+def test_resolves_by_name_and_clause_name(tmp_path):
+    """Test logical fields resolve by display or JQL clause name"""
+    resolver = FieldResolver("https://jira.example.com", str(tmp_path / "fields.json"))
+    resolver.update(FIELDS)
+
+    assert resolver.field_id("epic_link") == "customfield_20001"
+    assert resolver.field_id("epic_name") == "customfield_20002"
+    assert resolver.field_id("story_points") == "customfield_20003"
+    assert resolver.field_id("team") is None
+    assert resolver.jql_ref("epic_link") == "cf[20001]"
+    assert resolver.jql_ref("team") == '"Team"'
+
+def test_disk_cache_is_per_server(tmp_path):
+    """Test resolved ids are restored for the same server only"""
+    path = str(tmp_path / "fields.json")
+    FieldResolver("https://jira.example.com/", path).update(FIELDS)
+
+    same = FieldResolver("https://jira.example.com", path)
+    other = FieldResolver("https://other.example.com", path)
+
+    assert same.load()
+    assert same.field_id("epic_link") == "customfield_20001"
+    assert not other.load()
+    assert other.field_id("epic_link") == "customfield_10601"
+
+def test_concurrent_saves_keep_cache_readable(tmp_path):
+    """Test workers resolving at the same moment never leave a mixed or missing file"""
+    path = str(tmp_path / "fields.json")
+    resolvers = [FieldResolver("https://jira.example.com", path) for _ in range(8)]
+    threads = [threading.Thread(target=resolver.update, args=(FIELDS,)) for resolver in resolvers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    restored = FieldResolver("https://jira.example.com", path)
+    assert restored.load()
+    assert restored.field_id("epic_link") == "customfield_20001"
+    assert [p.name for p in tmp_path.iterdir()] == ["fields.json"]
+
+def test_configured_names_and_ids(tmp_path):
+    """Test JIRA_FIELDS style overrides by name or explicit id"""
+    resolver = FieldResolver(
+        "https://jira.example.com",
+        names={"team": "customfield_30000", "epic_name": "Story Points"}
+    )
+    resolver.update(FIELDS)
+
+    assert resolver.field_id("team") == "customfield_30000"
+    assert resolver.field_id("epic_name") == "customfield_20003"
+
+def test_schema_projection_uses_resolved_ids():
+    """Test epic projection follows the resolved epic name field"""
+    assert "customfield_10604" in jira_fields_for(EpicSchema)
+
+    get_field_resolver().update(FIELDS)
+
+    assert "customfield_20002" in jira_fields_for(EpicSchema)
+    assert "customfield_10604" not in jira_fields_for(EpicSchema)
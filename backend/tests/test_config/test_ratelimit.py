@@ -0,0 +1,103 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from app.core.errors import UpstreamError, UpstreamThrottledError
+from app.core.ratelimit import (
+    AdaptiveRateLimiter,
+    Priority,
+    current_priority,
+    parse_retry_after,
+    request_priority
+)
+
+def test_parse_retry_after():
+    """Test Retry-After given as seconds or HTTP date"""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+def test_burst_then_wait():
+    """Test tokens run out after the burst and wait time follows the rate"""
+    limiter = AdaptiveRateLimiter(rate=10, burst=2)
+    assert limiter._take(Priority.INTERACTIVE) == 0
+    assert limiter._take(Priority.INTERACTIVE) == 0
+    assert limiter._take(Priority.INTERACTIVE) == pytest.approx(0.1, abs=0.01)
+
+def test_lower_priorities_leave_tokens_for_interactive():
+    """Test background work stops while interactive reads still get tokens"""
+    limiter = AdaptiveRateLimiter(rate=1, burst=4)
+    # Background needs 1 + half of the burst left
+    assert limiter._take(Priority.BACKGROUND) == 0
+    assert limiter._take(Priority.BACKGROUND) == 0
+    assert limiter._take(Priority.BACKGROUND) > 0
+    assert limiter._take(Priority.BULK) == 0
+    assert limiter._take(Priority.BULK) > 0
+    assert limiter._take(Priority.INTERACTIVE) == 0
+
+def test_throttled_response_blocks_and_slows_down():
+    """Test 429 halves the rate and blocks everyone for Retry-After"""
+    limiter = AdaptiveRateLimiter(rate=10, burst=10, backoff=0)
+    delay = limiter.observe(429, {"Retry-After": "2"})
+
+    assert delay == 2.0
+    assert limiter.rate == 5
+    assert limiter._take(Priority.INTERACTIVE) == pytest.approx(2.0, abs=0.05)
+    assert limiter.stats()["throttled"] == 1
+
+def test_success_recovers_rate_up_to_announced_ceiling():
+    """Test X-RateLimit fill rate caps the rate and success grows it back"""
+    limiter = AdaptiveRateLimiter(rate=20, burst=40)
+    limiter.observe(200, {
+        "X-RateLimit-FillRate": "10",
+        "X-RateLimit-Interval-Seconds": "1",
+        "X-RateLimit-Limit": "30",
+        "X-RateLimit-Remaining": "5"
+    })
+    assert limiter.ceiling == 10
+    assert limiter.capacity == 30
+    assert limiter.stats()["tokens"] < 6
+
+    limiter.observe(429, {})
+    assert limiter.rate == 5
+    for _ in range(20):
+        limiter.observe(200, {})
+    assert limiter.rate == 10
+
+def test_backoff_is_jittered_without_retry_after():
+    """Test 503 without Retry-After waits a random share of exponential backoff"""
+    limiter = AdaptiveRateLimiter(rate=10, burst=10, backoff=1, max_delay=30)
+    with patch('app.core.ratelimit.random.uniform', side_effect=lambda low, high: high) as uniform:
+        assert limiter.observe(503, {}, attempt=3) == 8
+        uniform.assert_called_once_with(0, 8)
+
+def test_retry_raises_when_exhausted():
+    """Test retries are counted and typed errors raised after the last one"""
+    limiter = AdaptiveRateLimiter(rate=10, burst=10, max_retries=1)
+    limiter.retry(429, 1.0, attempt=0)
+    with pytest.raises(UpstreamThrottledError) as error:
+        limiter.retry(429, 1.0, attempt=1)
+    assert error.value.retry_after == 1.0
+    with pytest.raises(UpstreamError) as error:
+        limiter.retry(503, 1.0, attempt=1)
+    assert error.value.status_code == 503
+    assert limiter.stats()["retries"] == 1
+
+@pytest.mark.asyncio
+async def test_interactive_caller_rejected_on_long_block():
+    """Test interactive reads fail fast instead of waiting out a long Retry-After"""
+    limiter = AdaptiveRateLimiter(rate=10, burst=10, backoff=0, max_delay=5)
+    limiter.observe(429, {"Retry-After": "60"})
+
+    with pytest.raises(UpstreamThrottledError):
+        await limiter.acquire()
+    # Background work keeps waiting instead
+    with request_priority(Priority.BACKGROUND):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(), 0.05)
+
+def test_request_priority_is_scoped():
+    assert current_priority() == Priority.INTERACTIVE
+    with request_priority(Priority.BULK):
+        assert current_priority() == Priority.BULK
+    assert current_priority() == Priority.INTERACTIVE
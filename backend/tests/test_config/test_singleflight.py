@@ -0,0 +1,62 @@
+import asyncio
+import pytest
+from app.core.singleflight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_result():
+    """Test identical in-flight calls run once and all callers get the result"""
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 1, "shared": 4, "in_flight": 0}
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_shared():
+    """Test a finished call is not reused"""
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert await flight.do("key", fetch) == 1
+    assert await flight.do("key", fetch) == 2
+
+@pytest.mark.asyncio
+async def test_exception_reaches_every_waiter():
+    """Test a failed call fails all of its waiters"""
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_call():
+    """Test other waiters still get the result when one gives up"""
+    flight = SingleFlight("test")
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    first = asyncio.ensure_future(flight.do("key", fetch))
+    second = asyncio.ensure_future(flight.do("key", fetch))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "value"
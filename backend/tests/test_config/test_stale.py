@@ -0,0 +1,40 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.core.errors import CircuitOpenError
+from app.core.stale import LastKnownGood, get_last_known_good, track_staleness, with_last_known_good
+
+@pytest.mark.asyncio
+async def test_serves_last_known_good_marked_stale():
+    """Test a failing read returns the last success and flags the response"""
+    await with_last_known_good("key", AsyncMock(return_value="v1"))
+
+    fetch = AsyncMock(side_effect=[CircuitOpenError("down", retry_after=0), "v2"])
+    with track_staleness() as staleness:
+        assert await with_last_known_good("key", fetch) == "v1"
+    assert staleness.stale is True
+
+    # Retried in the background, the fresh value replaces the old one
+    await asyncio.sleep(0.01)
+    assert fetch.await_count == 2
+    assert get_last_known_good().get("key") == "v2"
+    assert get_last_known_good().stats()["served"] == 1
+
+@pytest.mark.asyncio
+async def test_failure_without_known_value_propagates():
+    with pytest.raises(CircuitOpenError):
+        await with_last_known_good("key", AsyncMock(side_effect=CircuitOpenError("down")))
+
+@pytest.mark.asyncio
+async def test_not_found_forgets_value():
+    """Test a confirmed missing resource is not served later as stale"""
+    await with_last_known_good("key", AsyncMock(return_value="v1"))
+    assert await with_last_known_good("key", AsyncMock(return_value=None)) is None
+    assert get_last_known_good().get("key") is None
+
+def test_store_is_bounded_and_ages_out():
+    store = LastKnownGood(max_entries=2, max_age=0)
+    for key in ("a", "b", "c"):
+        store.put(key, key)
+    assert store.stats()["evictions"] == 1
+    assert store.get("c") is None
@@ -0,0 +1,62 @@
+import threading
+import pytest
+from app.core.watch import InotifyWatcher, PollingWatcher, _load_libc, create_watcher
+
+class Changes:
+    def __init__(self):
+        self.paths = set()
+        self.event = threading.Event()
+
+    def __call__(self, path):
+        self.paths.add(path)
+        self.event.set()
+
+def test_polling_reports_changed_added_and_removed_files(tmp_path):
+    (tmp_path / "dor").mkdir()
+    kept = tmp_path / "dor" / "kept.md"
+    edited = tmp_path / "dor" / "edited.md"
+    removed = tmp_path / "dor" / "removed.md"
+    for path in (kept, edited, removed):
+        path.write_text("a")
+    changes = Changes()
+    watcher = PollingWatcher(tmp_path, changes, interval=3600)
+    watcher.start()
+    try:
+        edited.write_text("ab")
+        removed.unlink()
+        added = tmp_path / "dor" / "added.md"
+        added.write_text("a")
+        watcher.poll()
+    finally:
+        watcher.stop()
+
+    assert changes.paths == {edited, removed, added}
+
+@pytest.mark.skipif(_load_libc() is None, reason="inotify is not available")
+def test_inotify_reports_files_and_new_directories(tmp_path):
+    changes = Changes()
+    watcher = InotifyWatcher(tmp_path, changes)
+    watcher.start()
+    try:
+        (tmp_path / "dod").mkdir()
+        assert changes.event.wait(5)
+        changes.event.clear()
+        path = tmp_path / "dod" / "standard.md"
+        path.write_text("a")
+        assert changes.event.wait(5)
+    finally:
+        watcher.stop()
+
+    assert tmp_path / "dod" in changes.paths
+    assert path in changes.paths
+
+def test_create_watcher_falls_back_to_polling(tmp_path, monkeypatch):
+    monkeypatch.setattr('app.core.watch._load_libc', lambda: None)
+    watcher = create_watcher(tmp_path, Changes(), interval=3600)
+    try:
+        assert watcher.name == "poll"
+    finally:
+        watcher.stop()
+
+    assert create_watcher(tmp_path, Changes(), mode="off") is None
+    assert create_watcher(tmp_path / "missing", Changes()) is None
@@ -0,0 +1,98 @@
+import pytest
+from pydantic import ValidationError
+from unittest.mock import AsyncMock, Mock, patch
+from app.core.errors import UpstreamThrottledError
+from app.schemas.link import BulkTaskLinkRequest, LinkType, TaskLink
+from app.services.bulk_links import create_links_bulk
+
+@pytest.fixture
+def existing_links():
+    """T-1 already blocks T-2; T-3 and T-4 have no links, T-404 does not exist"""
+    links = {
+        "T-1": [TaskLink(id="100", type=LinkType.BLOCKS, source="T-1", target="T-2")],
+        "T-2": [TaskLink(id="100", type=LinkType.BLOCKED_BY, source="T-2", target="T-1")],
+        "T-3": [],
+        "T-4": []
+    }
+
+    async def get_links_of(keys):
+        return {key: links.get(key) for key in keys}
+
+    with patch('app.services.bulk_links.get_links_of', AsyncMock(side_effect=get_links_of)) as mock:
+        mock.links = links
+        yield mock
+
+def make_request(source, link_type, target):
+    return BulkTaskLinkRequest(source=source, type=link_type, target=target)
+
+@pytest.mark.asyncio
+async def test_bulk_skips_existing_and_repeated_links(existing_links):
+    """Test known links, from either end, and repeats in the request are not created again"""
+    service = Mock()
+    service.add_task_link.side_effect = ["200"]
+
+    results = await create_links_bulk(service, [
+        make_request("T-2", LinkType.BLOCKED_BY, "T-1"),
+        make_request("T-3", LinkType.RELATES_TO, "T-4"),
+        make_request("T-4", LinkType.RELATES_TO, "T-3"),
+        make_request("T-404", LinkType.BLOCKS, "T-1"),
+        make_request("T-3", LinkType.BLOCKS, "T-3")
+    ])
+
+    assert [(r.index, r.status, r.id) for r in results] == [
+        (0, "exists", "100"),
+        (1, "created", "200"),
+        (2, "exists", "200"),
+        (3, "failed", None),
+        (4, "failed", None)
+    ]
+    assert results[3].error == "Task T-404 not found"
+    service.add_task_link.assert_called_once_with("T-3", LinkType.RELATES_TO, "T-4")
+    existing_links.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_bulk_reads_back_ids_jira_did_not_return(existing_links):
+    service = Mock()
+
+    def add_task_link(source, link_type, target):
+        existing_links.links[source] = [TaskLink(id="300", type=link_type, source=source, target=target)]
+        return None
+
+    service.add_task_link.side_effect = add_task_link
+
+    results = await create_links_bulk(service, [make_request("T-3", LinkType.BLOCKS, "T-4")])
+
+    assert (results[0].status, results[0].id) == ("created", "300")
+    assert [call.args[0] for call in existing_links.await_args_list] == [["T-3"], ["T-3"]]
+
+@pytest.mark.asyncio
+async def test_bulk_reports_failed_links(existing_links):
+    service = Mock()
+    service.add_task_link.side_effect = Exception("Issue link type does not exist")
+
+    results = await create_links_bulk(service, [
+        make_request("T-3", LinkType.DUPLICATES, "T-4"),
+        make_request("T-3", LinkType.DUPLICATES, "T-4"),
+    ], concurrency=1)
+
+    assert [(r.status, r.error) for r in results] == [
+        ("failed", "Issue link type does not exist"),
+        ("failed", "Issue link type does not exist")
+    ]
+
+@pytest.mark.asyncio
+async def test_bulk_reports_throttling_per_item(existing_links):
+    """Test throttling fails only its item, with a retry hint, and keeps created links reported"""
+    service = Mock()
+    service.add_task_link.side_effect = ["200", UpstreamThrottledError("JIRA throttled", retry_after=30)]
+
+    results = await create_links_bulk(service, [
+        make_request("T-3", LinkType.BLOCKS, "T-4"),
+        make_request("T-4", LinkType.BLOCKS, "T-1")
+    ], concurrency=1)
+
+    assert [(r.status, r.id, r.retry_after) for r in results] == [("created", "200", None), ("failed", None, 30)]
+
+def test_bulk_request_rejects_non_keys():
+    with pytest.raises(ValidationError):
+        make_request("T-1) OR project = X OR key in (Y-1", LinkType.BLOCKS, "T-2")
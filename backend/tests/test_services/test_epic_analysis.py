@@ -0,0 +1,97 @@
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from jira import JIRAError
+from jira.client import ResultList
+from app.core.errors import UpstreamError
+from app.services.epic_analysis import analyze_epic, build_analysis
+
+def status(done=False):
+    return SimpleNamespace(statusCategory=SimpleNamespace(key='done' if done else 'indeterminate'))
+
+def blocks(target, done=False):
+    link = SimpleNamespace(type=SimpleNamespace(outward="blocks", inward="is blocked by"))
+    link.outwardIssue = SimpleNamespace(key=target, fields=SimpleNamespace(status=status(done)))
+    return link
+
+def blocked_by(source, done=False):
+    link = SimpleNamespace(type=SimpleNamespace(outward="blocks", inward="is blocked by"))
+    link.inwardIssue = SimpleNamespace(key=source, fields=SimpleNamespace(status=status(done)))
+    return link
+
+def task(key, hours=None, links=(), done=False):
+    timetracking = SimpleNamespace(originalEstimateSeconds=int(hours * 3600)) if hours is not None else None
+    return SimpleNamespace(key=key, fields=SimpleNamespace(
+        issuelinks=list(links), timetracking=timetracking, status=status(done)
+    ))
+
+def test_order_critical_path_and_blockers():
+    """Test topological order, heaviest chain and unresolved blockers"""
+    issues = [
+        task("EPIC-1"),
+        task("T-1", 2, [blocks("T-2"), blocks("T-4")]),
+        task("T-2", 3, [blocked_by("T-1"), blocks("T-3")]),
+        task("T-3", 1, [blocked_by("T-2"), blocked_by("EXT-9")]),
+        task("T-4", 10, [blocked_by("T-1")], done=True),
+        task("T-5", None, [blocks("T-6")]),
+        task("T-6", 1, [blocks("T-5")])
+    ]
+    analysis = build_analysis("EPIC-1", issues)
+
+    assert analysis.tasks == 6
+    assert analysis.links == 5
+    assert analysis.order.index("T-1") < analysis.order.index("T-2") < analysis.order.index("T-3")
+    # Done T-4 adds no remaining work
+    assert analysis.critical_path == ["T-1", "T-2", "T-3"]
+    assert analysis.critical_path_hours == 6
+    assert analysis.cycles == ["T-5", "T-6"]
+    assert {item.key: item.blockers for item in analysis.blocked} == {
+        "T-2": ["T-1"],
+        "T-3": ["EXT-9", "T-2"],
+        "T-5": ["T-6"],
+        "T-6": ["T-5"]
+    }
+    assert analysis.unestimated == ["T-5"]
+
+def test_large_epic_is_analyzed_in_memory_quickly():
+    issues = [task("EPIC-1")] + [
+        task(f"T-{i}", 1, [blocks(f"T-{i + 1}")] if i < 4999 else []) for i in range(5000)
+    ]
+    started = time.perf_counter()
+    analysis = build_analysis("EPIC-1", issues)
+    assert time.perf_counter() - started < 1
+    assert len(analysis.critical_path) == 5000
+
+@pytest.mark.asyncio
+async def test_analyze_epic_reads_one_search_and_caches():
+    issues = [task("EPIC-1"), task("T-1", 1)]
+    with patch('app.services.epic_analysis.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList(issues, 0, 100, 2))
+        first = await analyze_epic("EPIC-1")
+        second = await analyze_epic("EPIC-1")
+
+        assert first.order == ["T-1"]
+        assert second == first
+        mock_client.return_value.search_issues.assert_awaited_once()
+        assert mock_client.return_value.search_issues.call_args.kwargs["fields"] == ['issuelinks', 'timetracking', 'status']
+
+@pytest.mark.asyncio
+async def test_analyze_missing_epic():
+    with patch('app.services.epic_analysis.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList([], 0, 100, 0))
+        assert await analyze_epic("EPIC-404") is None
+
+@pytest.mark.asyncio
+async def test_analyze_epic_rejected_by_jira():
+    """Test the 400 JIRA answers for a missing epic's JQL reads as not found"""
+    with patch('app.services.epic_analysis.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(side_effect=JIRAError(status_code=400))
+        assert await analyze_epic("NOPE-1") is None
+
+@pytest.mark.asyncio
+async def test_analyze_epic_upstream_error_propagates():
+    with patch('app.services.epic_analysis.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(side_effect=UpstreamError("JIRA unavailable"))
+        with pytest.raises(UpstreamError):
+            await analyze_epic("EPIC-2")
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from jira.resources import RemoteLink
+from app.core.errors import UpstreamError
+from app.services.external_links import ExternalLinksService, get_external_links_for
+
+def make_remote_link(index, url):
+    return RemoteLink(None, None, raw={"id": index, "object": {"url": url, "title": f"Link {index}"}})
+
+REMOTE_LINKS = {
+    "T-1": [make_remote_link(1, "https://confluence.example.com/page")],
+    "T-2": [],
+    "T-3": [make_remote_link(3, "https://docs.google.com/doc")]
+}
+
+@pytest.fixture
+def mock_remote_links():
+    in_flight = {"now": 0, "max": 0}
+
+    async def remote_links(key):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        if key not in REMOTE_LINKS:
+            raise ValueError("Issue does not exist")
+        return REMOTE_LINKS[key]
+
+    with patch('app.services.external_links.get_async_jira_client') as mock_client:
+        mock_client.return_value.remote_links = AsyncMock(side_effect=remote_links)
+        mock_client.return_value.remote_links.in_flight = in_flight
+        yield mock_client.return_value.remote_links
+
+@pytest.mark.asyncio
+async def test_links_for_many_tasks(mock_remote_links):
+    """Test links come back per task in request order, unreadable tasks get none"""
+    links = await get_external_links_for(["T-3", "T-1", "T-2", "T-404", "T-1"])
+
+    assert list(links) == ["T-3", "T-1", "T-2", "T-404"]
+    assert [str(link.url) for link in links["T-1"]] == ["https://confluence.example.com/page"]
+    assert links["T-3"][0].source == "T-3"
+    assert links["T-2"] == [] and links["T-404"] == []
+    assert mock_remote_links.await_count == 4
+
+@pytest.mark.asyncio
+async def test_links_concurrency_is_bounded(mock_remote_links, monkeypatch):
+    monkeypatch.setenv("REMOTE_LINKS_CONCURRENCY", "2")
+    await get_external_links_for([f"T-{index}" for index in range(10)])
+
+    assert mock_remote_links.in_flight["max"] == 2
+
+@pytest.mark.asyncio
+async def test_links_are_cached(mock_remote_links):
+    """Test cached tasks are not fetched again"""
+    await get_external_links_for(["T-1", "T-2"])
+    mock_remote_links.reset_mock()
+
+    links = await get_external_links_for(["T-1", "T-2", "T-3"])
+
+    assert len(links["T-1"]) == 1
+    mock_remote_links.assert_awaited_once_with("T-3")
+
+@pytest.mark.asyncio
+async def test_links_upstream_error_propagates(mock_remote_links):
+    mock_remote_links.side_effect = UpstreamError("JIRA is unavailable")
+
+    with pytest.raises(UpstreamError):
+        await get_external_links_for(["T-1"])
+
+def test_service_reads_remote_links_by_key():
+    """Test a single JIRA call per task, without loading the issue first"""
+    with patch('app.services.external_links.get_jira_client') as mock_client:
+        jira = MagicMock()
+        jira.remote_links.return_value = REMOTE_LINKS["T-1"]
+        mock_client.return_value = jira
+
+        links = ExternalLinksService().get_external_links("T-1")
+
+    assert [link.id for link in links] == ["1"]
+    jira.remote_links.assert_called_once_with("T-1")
+    jira.issue.assert_not_called()
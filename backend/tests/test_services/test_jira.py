@@ -1,7 +1,11 @@
+import asyncio
+import time
 from datetime import datetime
 import pytest
-from unittest.mock import Mock, patch
-from app.services.jira import get_task, get_epic
+from unittest.mock import AsyncMock, Mock, patch
+from jira.client import ResultList
+from app.core.errors import UpstreamThrottledError
+from app.services.jira import get_task, get_tasks, get_epic, get_epic_tasks, get_task_cache
 
 @pytest.fixture
 def mock_jira_issue():
@@ -33,24 +37,74 @@ def mock_jira_epic(mock_jira_issue):
 
 @pytest.mark.asyncio
 async def test_get_task(mock_jira_issue):
-    with patch('app.services.jira.get_jira_client') as mock_client:
-        mock_client.return_value.issue.return_value = mock_jira_issue
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.issue = AsyncMock(return_value=mock_jira_issue)
         task = await get_task("TEST-123")
         assert task is not None
         assert task.key == "TEST-123"
         assert task.summary == "Test Issue"
 
+@pytest.mark.asyncio
+async def test_get_task_served_from_cache(mock_jira_issue):
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.issue = AsyncMock(return_value=mock_jira_issue)
+        first = await get_task("TEST-123")
+        second = await get_task("TEST-123")
+        assert second == first
+        mock_client.return_value.issue.assert_awaited_once_with(
+            "TEST-123", fields=['created', 'updated', 'summary', 'description']
+        )
+        assert get_task_cache().stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_get_task_sparse_fields(mock_jira_issue):
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.issue = AsyncMock(return_value=mock_jira_issue)
+        task = await get_task("TEST-123", fields={"key", "summary"})
+        assert task.model_dump(include={"key", "summary"}) == {"key": "TEST-123", "summary": "Test Issue"}
+        mock_client.return_value.issue.assert_awaited_once_with("TEST-123", fields=['summary'])
+        # Частичные задачи не кэшируются
+        assert get_task_cache().stats()["misses"] == 1
+
+@pytest.mark.asyncio
+async def test_get_task_revalidates_by_updated(mock_jira_issue):
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.issue = AsyncMock(return_value=mock_jira_issue)
+        await get_task("TEST-123")
+
+        # Истекший TTL: проверяем только поле updated
+        with patch('app.core.cache.time.time', return_value=time.time() + 600):
+            task = await get_task("TEST-123")
+
+        assert task.key == "TEST-123"
+        mock_client.return_value.issue.assert_awaited_with("TEST-123", fields=['updated'])
+        assert get_task_cache().stats()["revalidated"] == 1
+
+@pytest.mark.asyncio
+async def test_get_task_throttled_is_not_missing():
+    """Test throttling propagates instead of turning into a missing task"""
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.issue = AsyncMock(side_effect=UpstreamThrottledError("throttled"))
+        with pytest.raises(UpstreamThrottledError):
+            await get_task("TEST-123")
+
+def make_child(key):
+    task = Mock(key=key)
+    task.fields.summary = f"Task {key}"
+    task.fields.description = None
+    task.fields.created = datetime.now()
+    task.fields.updated = datetime.now()
+    return task
+
 @pytest.mark.asyncio
 async def test_get_epic(mock_jira_epic):
-    with patch('app.services.jira.get_jira_client') as mock_client:
-        # Настраиваем мок для получения эпика
-        mock_client.return_value.issue.return_value = mock_jira_epic
-        
-        # Настраиваем мок для поиска задач
-        mock_client.return_value.search_issues.return_value = [
-            Mock(key="TEST-124"),
-            Mock(key="TEST-125")
-        ]
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        # Эпик и его задачи приходят одним поиском
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList([
+            mock_jira_epic,
+            make_child("TEST-124"),
+            make_child("TEST-125")
+        ], _maxResults=100))
         
         # Вызываем тестируемую функцию
         epic = await get_epic("TEST-123")
@@ -61,4 +115,77 @@ async def test_get_epic(mock_jira_epic):
         assert epic.name == "Epic Name"  # Проверяем имя эпика из customfield_10604
         assert len(epic.tasks) == 2  # Проверяем количество связанных задач
         assert "TEST-124" in epic.tasks  # Проверяем ключи задач
-        assert "TEST-125" in epic.tasks
\ No newline at end of file
+        assert "TEST-125" in epic.tasks
+
+@pytest.mark.asyncio
+async def test_epic_and_tasks_share_one_search(mock_jira_epic):
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList([
+            mock_jira_epic,
+            make_child("TEST-124")
+        ], _maxResults=100))
+        
+        epic = await get_epic("TEST-123")
+        tasks = await get_epic_tasks("TEST-123")
+        
+        assert epic.tasks == ["TEST-124"]
+        assert [task.key for task in tasks] == ["TEST-124"]
+        mock_client.return_value.search_issues.assert_awaited_once()
+        jql = mock_client.return_value.search_issues.call_args.args[0]
+        assert jql.startswith('key = TEST-123 OR (cf[10601] = TEST-123')
+
+@pytest.mark.asyncio
+async def test_get_epic_not_found():
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList([], _maxResults=100))
+        assert await get_epic("TEST-999") is None
+
+@pytest.mark.asyncio
+async def test_concurrent_get_task_coalesced(mock_jira_issue):
+    """Test simultaneous requests for one task make a single JIRA call"""
+    async def slow_issue(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return mock_jira_issue
+
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.issue = AsyncMock(side_effect=slow_issue)
+        tasks = await asyncio.gather(*(get_task("TEST-123") for _ in range(3)))
+
+        assert all(task.key == "TEST-123" for task in tasks)
+        mock_client.return_value.issue.assert_awaited_once()
+
+def make_issue(key):
+    issue = Mock()
+    issue.key = key
+    issue.fields.summary = f"Summary {key}"
+    issue.fields.description = None
+    issue.fields.created = datetime.now()
+    issue.fields.updated = datetime.now()
+    return issue
+
+@pytest.mark.asyncio
+async def test_get_tasks_chunked_key_search(monkeypatch):
+    """Test batch read splits keys into unvalidated `key in` searches"""
+    monkeypatch.setenv("BATCH_CHUNK_SIZE", "2")
+
+    async def search(jql, maxResults=50, validate_query=True, fields=None):
+        keys = jql[len("key in ("):-1].split(", ")
+        return ResultList([make_issue(key) for key in keys if key != "TEST-404"], 0, maxResults, len(keys))
+
+    with patch('app.services.jira.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(side_effect=search)
+        result = await get_tasks(["TEST-1", "TEST-404", "TEST-3"])
+
+        assert result["TEST-1"].summary == "Summary TEST-1"
+        assert result["TEST-404"] is None
+        assert result["TEST-3"].key == "TEST-3"
+        assert mock_client.return_value.search_issues.await_count == 2
+        assert all(
+            call.kwargs["validate_query"] is False
+            for call in mock_client.return_value.search_issues.await_args_list
+        )
+
+        # Found tasks are cached for the next batch
+        again = await get_tasks(["TEST-1", "TEST-3"])
+        assert again["TEST-1"] == result["TEST-1"]
+        assert mock_client.return_value.search_issues.await_count == 2
@@ -0,0 +1,161 @@
+import io
+import json
+import pytest
+import httpx
+import requests
+from unittest.mock import Mock, patch
+from app.core.breaker import CircuitBreaker
+from app.core.errors import CircuitOpenError, UpstreamError, UpstreamThrottledError
+from app.core.ratelimit import AdaptiveRateLimiter
+from app.services.jira_transport import AsyncJiraClient, RateLimitedAdapter, SyncJiraFallback
+
+ISSUE_JSON = {
+    "id": "10000",
+    "key": "TEST-123",
+    "self": "https://jira.example.com/rest/api/2/issue/10000",
+    "fields": {
+        "summary": "Test Issue",
+        "created": "2024-01-01T10:00:00.000+0300",
+        "updated": "2024-01-02T10:00:00.000+0300"
+    }
+}
+
+def make_client(handler, rate_limiter=None, breaker=None) -> AsyncJiraClient:
+    return AsyncJiraClient(
+        server="https://jira.example.com/",
+        basic_auth=("user", "token"),
+        http2=False,
+        transport=httpx.MockTransport(handler),
+        rate_limiter=rate_limiter,
+        breaker=breaker
+    )
+
+@pytest.mark.asyncio
+async def test_issue_parses_resource():
+    """Test issue JSON is returned as jira Issue resource"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=ISSUE_JSON)
+
+    client = make_client(handler)
+    issue = await client.issue("TEST-123", fields=["summary", "updated"])
+    await client.aclose()
+
+    assert issue.key == "TEST-123"
+    assert issue.fields.summary == "Test Issue"
+    assert requests[0].url.path == "/rest/api/2/issue/TEST-123"
+    assert requests[0].url.params["fields"] == "summary,updated"
+
+@pytest.mark.asyncio
+async def test_search_issues_returns_result_list():
+    """Test search posts JQL and keeps paging metadata"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        assert body["jql"] == "project = TEST"
+        assert body["startAt"] == 50
+        return httpx.Response(200, json={
+            "startAt": 50,
+            "maxResults": 50,
+            "total": 51,
+            "issues": [ISSUE_JSON]
+        })
+
+    client = make_client(handler)
+    result = await client.search_issues("project = TEST", startAt=50)
+    await client.aclose()
+
+    assert [issue.key for issue in result] == ["TEST-123"]
+    assert result.total == 51
+
+@pytest.mark.asyncio
+async def test_issue_not_found_raises():
+    """Test HTTP errors are raised to the service layer"""
+    client = make_client(lambda request: httpx.Response(404, json={"errorMessages": []}))
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.issue("MISSING-1")
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_sync_fallback_delegates():
+    """Test fallback awaits the blocking client"""
+    sync_client = Mock()
+    sync_client.issue.return_value = Mock(key="TEST-123")
+    fallback = SyncJiraFallback(sync_client)
+
+    issue = await fallback.issue("TEST-123", fields=["summary", "updated"])
+
+    assert issue.key == "TEST-123"
+    sync_client.issue.assert_called_once_with("TEST-123", fields="summary,updated")
+
+@pytest.mark.asyncio
+async def test_throttled_request_retried_after_retry_after():
+    """Test 429 is retried once Retry-After has passed"""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json=ISSUE_JSON)
+    ]
+    limiter = AdaptiveRateLimiter(rate=100, burst=10, backoff=0)
+    client = make_client(lambda request: responses.pop(0), rate_limiter=limiter)
+
+    issue = await client.issue("TEST-123")
+    await client.aclose()
+
+    assert issue.key == "TEST-123"
+    assert limiter.stats()["retries"] == 1
+
+@pytest.mark.asyncio
+async def test_throttled_request_raises_after_retries():
+    """Test persistent 429 surfaces as a typed error, not a missing issue"""
+    limiter = AdaptiveRateLimiter(rate=100, burst=10, max_retries=2, backoff=0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    client = make_client(handler, rate_limiter=limiter)
+    with pytest.raises(UpstreamThrottledError):
+        await client.issue("TEST-123")
+    await client.aclose()
+
+    assert len(calls) == 3
+
+def test_sync_adapter_retries_throttled_calls():
+    """Test the sync client's adapter goes through the same limiter"""
+    limiter = AdaptiveRateLimiter(rate=100, burst=10, backoff=0)
+    throttled = requests.Response()
+    throttled.status_code = 429
+    throttled.headers["Retry-After"] = "0"
+    throttled.raw = io.BytesIO(b"")
+    ok = requests.Response()
+    ok.status_code = 200
+
+    with patch('requests.adapters.HTTPAdapter.send', side_effect=[throttled, ok]) as send:
+        response = RateLimitedAdapter(limiter).send(requests.Request('GET', 'https://jira.example.com/').prepare())
+
+    assert response is ok
+    assert send.call_count == 2
+    assert limiter.stats()["throttled"] == 1
+
+@pytest.mark.asyncio
+async def test_server_errors_open_circuit():
+    """Test 5xx surface as UpstreamError and stop further calls once the circuit opens"""
+    breaker = CircuitBreaker("jira", window=2, min_calls=2)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(502)
+
+    client = make_client(handler, breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(UpstreamError):
+            await client.issue("TEST-123")
+    with pytest.raises(CircuitOpenError):
+        await client.issue("TEST-123")
+    await client.aclose()
+
+    assert len(calls) == 2
+    assert breaker.state == CircuitBreaker.OPEN
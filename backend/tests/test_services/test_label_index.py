@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from jira.client import ResultList
+from app.services.label_index import LabelIndex
+
+def make_issue(key, labels, updated="2024-01-02T10:00:00"):
+    issue = Mock()
+    issue.key = key
+    issue.fields.labels = labels
+    issue.fields.created = "2024-01-01T10:00:00"
+    issue.fields.updated = updated
+    return issue
+
+def make_client(*pages):
+    client = Mock()
+    client.search_issues = AsyncMock(side_effect=[
+        ResultList(issues, 0, 50, len(issues)) for issues in pages
+    ])
+    return client
+
+@pytest.mark.asyncio
+async def test_incremental_sync_updates_index(tmp_path):
+    """Test second sync only asks for recently updated issues and applies label changes"""
+    client = make_client(
+        [make_issue("P-1", ["bug"]), make_issue("P-2", ["bug", "ui"])],
+        [make_issue("P-2", ["ui"], updated="2024-01-03T10:00:00")]
+    )
+    index = LabelIndex("P", str(tmp_path / "index.json"))
+
+    await index.sync(client)
+    assert index.get("bug").used_in == ["P-1", "P-2"]
+
+    await index.sync(client)
+    jql = client.search_issues.await_args_list[1].args[0]
+    assert jql.startswith("project = P AND updated >= -")
+    assert index.get("bug").used_in == ["P-1"]
+    assert index.get("ui").updated.day == 3
+
+@pytest.mark.asyncio
+async def test_full_sync_drops_vanished_issues(tmp_path):
+    """Test full rebuild forgets issues no longer returned by JIRA"""
+    client = make_client([make_issue("P-1", ["bug"])], [])
+    index = LabelIndex("P", str(tmp_path / "index.json"))
+
+    await index.sync(client)
+    await index.sync(client, full=True)
+
+    assert index.get("bug") is None
+    assert index.all() == []
+
+@pytest.mark.asyncio
+async def test_snapshot_restores_index(tmp_path):
+    """Test index survives restart through its snapshot"""
+    path = str(tmp_path / "index.json")
+    await LabelIndex("P", path).sync(make_client([make_issue("P-1", ["bug"])]))
+
+    restored = LabelIndex("P", path)
+    restored.load()
+
+    assert restored.last_sync is not None
+    assert restored.get("bug").used_in == ["P-1"]
+    assert LabelIndex("OTHER", path).all() == []
+
+@pytest.mark.asyncio
+async def test_failed_sync_keeps_stale_index(tmp_path, monkeypatch):
+    """Test refresh failure serves the last indexed state"""
+    monkeypatch.setenv("LABEL_INDEX_REFRESH", "0")
+    client = make_client([make_issue("P-1", ["bug"])])
+    index = LabelIndex("P", str(tmp_path / "index.json"))
+    await index.ensure_fresh(client)
+
+    client.search_issues = AsyncMock(side_effect=Exception("JIRA down"))
+    await index.ensure_fresh(client)
+
+    assert index.get("bug").used_in == ["P-1"]
+
+@pytest.mark.asyncio
+async def test_scans_are_ordered_by_key(tmp_path):
+    """Test full and incremental scans page in key order, which updates do not shift"""
+    client = make_client([make_issue("P-1", ["bug"])], [])
+    index = LabelIndex("P", str(tmp_path / "index.json"))
+    await index.sync(client)
+    await index.sync(client)
+
+    assert all(call.args[0].endswith("ORDER BY key ASC") for call in client.search_issues.await_args_list)
+
+@pytest.mark.asyncio
+async def test_rebuild_runs_in_background_while_index_is_served(tmp_path):
+    """Test requests keep reading the built index while a full rebuild scans, and share a first build"""
+    release = asyncio.Event()
+    pages = iter([[make_issue("P-1", ["bug"])], [make_issue("P-1", ["ui"])]])
+
+    async def search(jql, startAt=0, maxResults=50, fields=None):
+        issues = next(pages)
+        if issues[0].fields.labels != ["bug"]:
+            await release.wait()
+        return ResultList(issues, 0, 50, len(issues))
+
+    client = Mock()
+    client.search_issues = AsyncMock(side_effect=search)
+    index = LabelIndex("P", str(tmp_path / "index.json"))
+    await asyncio.gather(index.ensure_fresh(client), index.ensure_fresh(client))
+    assert client.search_issues.await_count == 1
+
+    rebuild = asyncio.ensure_future(index.rebuild(client))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(index.ensure_fresh(client), timeout=1)
+    assert index.get("bug").used_in == ["P-1"]
+
+    release.set()
+    await rebuild
+    assert index.get("ui").used_in == ["P-1"]
@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from jira.client import ResultList
 from app.services.labels import get_label, get_project_labels
 
 @pytest.fixture
@@ -16,9 +17,9 @@ def mock_jira_issue():
 @pytest.mark.asyncio
 async def test_get_label(mock_jira_issue):
     """Test getting single label"""
-    with patch('app.services.labels.get_jira_client') as mock_client:
+    with patch('app.services.labels.get_async_jira_client') as mock_client:
         # Setup mock
-        mock_client.return_value.search_issues.return_value = [mock_jira_issue]
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList([mock_jira_issue], 0, 50, 1))
         
         # Test
         label = await get_label('bug')
@@ -32,8 +33,8 @@ async def test_get_label(mock_jira_issue):
 @pytest.mark.asyncio
 async def test_get_project_labels(mock_jira_issue):
     """Test getting all project labels"""
-    with patch('app.services.labels.get_jira_client') as mock_client:
-        mock_client.return_value.search_issues.return_value = [mock_jira_issue]
+    with patch('app.services.labels.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList([mock_jira_issue], 0, 50, 1))
         
         labels = await get_project_labels()
         
@@ -44,7 +45,20 @@ async def test_get_project_labels(mock_jira_issue):
 @pytest.mark.asyncio
 async def test_get_label_not_found():
     """Test getting non-existent label"""
-    with patch('app.services.labels.get_jira_client') as mock_client:
-        mock_client.return_value.search_issues.return_value = []
+    with patch('app.services.labels.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(return_value=ResultList([], 0, 50, 0))
         label = await get_label('nonexistent')
-        assert label is None
\ No newline at end of file
+        assert label is None
+
+@pytest.mark.asyncio
+async def test_labels_share_one_index_scan(mock_jira_issue):
+    """Test label lookups after the first are answered from the index"""
+    with patch('app.services.labels.get_async_jira_client') as mock_client:
+        search = AsyncMock(return_value=ResultList([mock_jira_issue], 0, 50, 1))
+        mock_client.return_value.search_issues = search
+
+        await get_project_labels()
+        label = await get_label('critical')
+
+        assert label.used_in == ['LOGIQPROD-123']
+        search.assert_awaited_once()
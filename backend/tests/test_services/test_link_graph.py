@@ -0,0 +1,102 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from jira.client import ResultList
+from app.schemas.link import LinkType
+from app.services.link_graph import get_link_graph, get_links_of
+
+# A blocks B, B blocks C, C blocks A (cycle), A relates to D
+GRAPH = {
+    "T-1": [("outward", "blocks", "T-2"), ("inward", "is blocked by", "T-3"), ("outward", "relates to", "T-4")],
+    "T-2": [("inward", "is blocked by", "T-1"), ("outward", "blocks", "T-3")],
+    "T-3": [("inward", "is blocked by", "T-2"), ("outward", "blocks", "T-1")],
+    "T-4": [("inward", "relates to", "T-1")]
+}
+
+def make_issue(key):
+    links = []
+    for index, (direction, name, target) in enumerate(GRAPH[key]):
+        link = SimpleNamespace(id=f"{key}-{index}", type=SimpleNamespace(inward=name, outward=name))
+        setattr(link, f"{direction}Issue", SimpleNamespace(key=target))
+        links.append(link)
+    return SimpleNamespace(key=key, fields=SimpleNamespace(issuelinks=links))
+
+@pytest.fixture
+def mock_search():
+    async def search(jql, maxResults=50, validate_query=True, fields=None):
+        keys = jql[len("key in ("):-1].split(", ")
+        return ResultList([make_issue(key) for key in keys if key in GRAPH], 0, maxResults, len(keys))
+
+    with patch('app.services.link_graph.get_async_jira_client') as mock_client:
+        mock_client.return_value.search_issues = AsyncMock(side_effect=search)
+        yield mock_client.return_value.search_issues
+
+@pytest.mark.asyncio
+async def test_graph_expands_level_by_level(mock_search):
+    """Test one batched search per level, every task expanded once despite the cycle"""
+    graph = await get_link_graph("T-1", depth=3)
+
+    assert [(node.key, node.depth) for node in graph.nodes] == [("T-1", 0), ("T-2", 1), ("T-3", 1), ("T-4", 1)]
+    assert {(edge.source, edge.type, edge.target) for edge in graph.edges} == {
+        ("T-1", LinkType.BLOCKS, "T-2"),
+        ("T-2", LinkType.BLOCKS, "T-3"),
+        ("T-3", LinkType.BLOCKS, "T-1"),
+        ("T-1", LinkType.RELATES_TO, "T-4")
+    }
+    assert [call.args[0] for call in mock_search.await_args_list] == [
+        "key in (T-1)",
+        "key in (T-2, T-3, T-4)"
+    ]
+    assert graph.truncated is False
+
+@pytest.mark.asyncio
+async def test_graph_follows_only_requested_types(mock_search):
+    """Test 'is blocked by' walks to what blocks the task transitively"""
+    graph = await get_link_graph("T-1", depth=2, types={LinkType.BLOCKED_BY})
+
+    assert [node.key for node in graph.nodes] == ["T-1", "T-3", "T-2"]
+    assert {(edge.source, edge.target) for edge in graph.edges} == {("T-3", "T-1"), ("T-2", "T-3")}
+
+@pytest.mark.asyncio
+async def test_graph_uses_links_cache(mock_search):
+    """Test adjacency read once is reused by the next traversal"""
+    await get_link_graph("T-1", depth=1)
+    await get_link_graph("T-1", depth=1)
+    assert mock_search.await_count == 1
+
+@pytest.mark.asyncio
+async def test_graph_truncated_at_node_limit(mock_search):
+    graph = await get_link_graph("T-1", depth=2, max_nodes=2)
+    assert [node.key for node in graph.nodes] == ["T-1", "T-2"]
+    assert graph.truncated is True
+
+@pytest.mark.asyncio
+async def test_graph_of_missing_task(mock_search):
+    assert await get_link_graph("T-404", depth=2) is None
+
+@pytest.mark.asyncio
+async def test_graph_skips_unknown_link_types(mock_search):
+    """Test links of types without a LinkType are left out of the graph"""
+    GRAPH["T-5"] = [("outward", "clones", "T-1"), ("outward", "blocks", "T-2")]
+    try:
+        graph = await get_link_graph("T-5", depth=1)
+    finally:
+        del GRAPH["T-5"]
+    assert [(edge.source, edge.target) for edge in graph.edges] == [("T-5", "T-2")]
+
+@pytest.mark.asyncio
+async def test_graph_keeps_tasks_of_failed_chunks_as_leaves(mock_search):
+    """Test a failing search of one level truncates the graph instead of failing it"""
+    search = mock_search.side_effect
+    mock_search.side_effect = [await search("key in (T-1)"), Exception("HTTP 500")]
+
+    graph = await get_link_graph("T-1", depth=2)
+    assert [node.key for node in graph.nodes] == ["T-1", "T-2", "T-3", "T-4"]
+    assert graph.truncated is True
+
+@pytest.mark.asyncio
+async def test_links_of_rejects_non_keys(mock_search):
+    """Test values that are not issue keys never reach JQL"""
+    links = await get_links_of(["T-1) OR project = X OR key in (Y-1"])
+    assert links == {"T-1) OR project = X OR key in (Y-1": None}
+    mock_search.assert_not_awaited()
@@ -54,7 +54,7 @@ def test_get_task_links(mock_jira, mock_issue):
     assert link.type == "blocks"
     assert link.source == "PROJ-123"
     assert link.target == "PROJ-456"
-    mock_jira.issue.assert_called_once_with("PROJ-123")
+    mock_jira.issue.assert_called_once_with("PROJ-123", fields="issuelinks")
 
 def test_create_task_link(mock_jira):
     """Test creating task link"""
@@ -88,7 +88,7 @@ def test_get_task_links_error(mock_jira):
     
     # Verify
     assert links == []
-    mock_jira.issue.assert_called_once_with("PROJ-123")
+    mock_jira.issue.assert_called_once_with("PROJ-123", fields="issuelinks")
 
 def test_create_task_link_error(mock_jira):
     """Test error handling when creating link"""
@@ -105,4 +105,14 @@ def test_create_task_link_error(mock_jira):
     
     # Verify
     assert link is None
-    mock_jira.create_issue_link.assert_called_once()
\ No newline at end of file
+    mock_jira.create_issue_link.assert_called_once()
+
+def test_create_task_link_returns_jira_id(mock_jira):
+    """Test id from JIRA's Location header; passive types are created as their active inverse"""
+    mock_jira.create_issue_link.return_value = Mock(headers={"Location": "https://jira/rest/api/2/issueLink/10500"})
+    service = LinksService()
+
+    link = service.create_task_link(source="PROJ-123", link_type=LinkType.BLOCKED_BY, target="PROJ-456")
+
+    assert link.id == "10500"
+    mock_jira.create_issue_link.assert_called_once_with(type="Blocks", inwardIssue="PROJ-123", outwardIssue="PROJ-456")
@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import Mock
+from app.services.metadata import MetadataRegistry
+
+def named(name, **attrs):
+    """Mock with a `name` attribute (Mock(name=...) names the mock itself)"""
+    mock = Mock(**attrs)
+    mock.name = name
+    return mock
+
+@pytest.fixture
+def jira():
+    client = Mock()
+    client.fields.return_value = [
+        {"id": "customfield_10601", "name": "Epic Link", "custom": True},
+        {"id": "summary", "name": "Summary", "custom": False}
+    ]
+    client.priorities.return_value = [named("Medium", id="3")]
+    client.issue_link_types.return_value = [named("Blocks", id="1", inward="is blocked by", outward="blocks")]
+    client.project.return_value = Mock(issueTypes=[named("Engineer", id="10000")])
+    return client
+
+def test_metadata_loaded_once(jira):
+    """Test repeated lookups reuse the loaded snapshot"""
+    registry = MetadataRegistry()
+
+    assert registry.field_ids(jira)["Epic Link"] == "customfield_10601"
+    assert registry.field_ids(jira)["Summary"] == "summary"
+    assert registry.issue_types("PROJ", jira) == [{"id": "10000", "name": "Engineer"}]
+    assert registry.issue_types("PROJ", jira) == [{"id": "10000", "name": "Engineer"}]
+
+    jira.fields.assert_called_once()
+    jira.project.assert_called_once_with("PROJ")
+    assert registry.get(jira).link_types[0]["outward"] == "blocks"
+
+def test_refresh_reloads_known_projects(jira):
+    """Test refresh replaces the snapshot including cached project issue types"""
+    registry = MetadataRegistry()
+    registry.issue_types("PROJ", jira)
+    jira.project.return_value = Mock(issueTypes=[named("Bug", id="10001")])
+
+    registry.refresh(jira)
+
+    assert registry.issue_types("PROJ", jira)[0]["name"] == "Bug"
+    assert registry.stats()["refreshes"] == 1
+
+def test_failed_refresh_keeps_snapshot(jira):
+    """Test JIRA errors during refresh leave previous metadata in place"""
+    registry = MetadataRegistry()
+    registry.refresh(jira)
+    jira.fields.side_effect = Exception("JIRA down")
+
+    with pytest.raises(Exception):
+        registry.refresh(jira)
+
+    assert "Epic Link" in registry.field_ids(jira)
+    assert registry.stats()["failures"] == 1
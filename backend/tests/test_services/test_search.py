@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+from jira.client import ResultList
+from app.services.search import iter_search, iter_search_pages
+from app.services.jira import get_epic_tasks, get_epic_tasks_page
+
+class PagedClient:
+    """Fake client serving `total` issues in pages, tracking concurrency"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+
+    async def search_issues(self, jql, startAt=0, maxResults=50, fields=None):
+        self.calls.append(startAt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        issues = []
+        for index in range(startAt, min(startAt + maxResults, self.total)):
+            issue = Mock(key=f"TEST-{index}")
+            issue.fields.summary = f"Task {index}"
+            issue.fields.description = None
+            issue.fields.customfield_10604 = "Epic name"
+            issue.fields.created = "2024-01-01T10:00:00+03:00"
+            issue.fields.updated = "2024-01-01T10:00:00+03:00"
+            issues.append(issue)
+        return ResultList(issues, startAt, maxResults, self.total)
+
+@pytest.mark.asyncio
+async def test_iter_search_walks_all_pages():
+    """Test every page is fetched with bounded concurrency"""
+    client = PagedClient(total=250)
+    keys = [issue.key async for issue in iter_search(client, "jql", page_size=20, concurrency=3)]
+
+    assert sorted(keys) == sorted(f"TEST-{i}" for i in range(250))
+    assert sorted(client.calls) == list(range(0, 250, 20))
+    assert client.peak <= 3
+
+@pytest.mark.asyncio
+async def test_iter_search_single_page():
+    """Test small result needs a single request"""
+    client = PagedClient(total=5)
+    pages = [page async for page in iter_search_pages(client, "jql", page_size=20)]
+    assert len(pages) == 1
+    assert client.calls == [0]
+
+@pytest.mark.asyncio
+async def test_get_epic_tasks_not_truncated():
+    """Test epic tasks beyond the first 50 are returned"""
+    client = PagedClient(total=121)  # TEST-0 is the epic itself
+    with patch('app.services.jira.get_async_jira_client', return_value=client):
+        tasks = await get_epic_tasks("TEST-0")
+    assert len(tasks) == 120
+    # Issue number order, as JIRA's ORDER BY key pages it
+    assert [task.key for task in tasks[:11]] == [f"TEST-{i}" for i in range(1, 12)]
+
+@pytest.mark.asyncio
+async def test_get_epic_tasks_page_offsets():
+    """Test page returns next offset until the last page"""
+    client = PagedClient(total=120)
+    with patch('app.services.jira.get_async_jira_client', return_value=client):
+        tasks, next_start = await get_epic_tasks_page("TEST-1", 0, 50)
+        assert len(tasks) == 50
+        assert next_start == 50
+
+        tasks, next_start = await get_epic_tasks_page("TEST-1", 100, 50)
+        assert len(tasks) == 20
+        assert next_start is None
@@ -0,0 +1,192 @@
+import pytest
+from jira import JIRA
+from jira.client import ResultList
+from jira.resources import Issue, RemoteLink
+from app.services.jira import get_epic, get_task
+from app.services.links import LinksService
+from app.services.mirror_store import MirrorStore, get_mirror_store, get_read_mirror
+from app.services.sync import SyncWorker
+
+OPTIONS = {**JIRA.DEFAULT_OPTIONS, 'server': 'https://jira.example.com'}
+
+def raw_issue(key, updated="2024-01-02T10:00:00+03:00", **fields):
+    return {
+        'key': key,
+        'fields': {
+            'summary': f"Summary {key}",
+            'description': None,
+            'created': "2024-01-01T10:00:00+03:00",
+            'updated': updated,
+            'issuetype': {'name': fields.pop('issuetype', 'Engineer')},
+            'labels': fields.pop('labels', []),
+            'issuelinks': fields.pop('issuelinks', []),
+            **fields
+        }
+    }
+
+class ProjectClient:
+    """Fake client returning the whole project for every search"""
+
+    def __init__(self, *issues):
+        self.issues = list(issues)
+        self.jql = []
+        self.remote_calls = []
+
+    async def search_issues(self, jql, startAt=0, maxResults=50, fields=None, validate_query=True):
+        self.jql.append(jql)
+        issues = self.issues
+        if jql.startswith("key in ("):
+            keys = jql[len("key in ("):-1].split(", ")
+            issues = [raw for raw in issues if raw['key'] in keys]
+        page = issues[startAt:startAt + maxResults]
+        return ResultList([Issue(OPTIONS, None, raw=raw) for raw in page], startAt, maxResults, len(issues))
+
+    async def remote_links(self, key):
+        self.remote_calls.append(key)
+        raw = {'id': 7, 'object': {'url': 'https://wiki.confluence.example.com/page', 'title': 'Spec'}}
+        return [RemoteLink(OPTIONS, None, raw=raw)]
+
+@pytest.fixture
+def store(tmp_path):
+    store = MirrorStore(str(tmp_path / "mirror.sqlite3"))
+    yield store
+    store.close()
+
+def make_worker(store, client):
+    return SyncWorker(store, project="PROJ", interval=30, full_interval=86400, client=client)
+
+@pytest.mark.asyncio
+async def test_sync_mirrors_project(store):
+    """Test full sync stores issues, epic links, labels, issue links and remote links"""
+    link = {'id': '10', 'type': {'outward': 'blocks', 'inward': 'is blocked by'}, 'outwardIssue': {'key': 'PROJ-3'}}
+    client = ProjectClient(
+        raw_issue("PROJ-1", issuetype="Epic", customfield_10604="Epic name"),
+        raw_issue("PROJ-2", labels=["bug"], issuelinks=[link], customfield_10601="PROJ-1"),
+        raw_issue("PROJ-3", labels=["bug"])
+    )
+    assert await make_worker(store, client).sync_once() == 3
+
+    aggregate = store.get_epic_aggregate("PROJ-1")
+    assert aggregate.epic.name == "Epic name"
+    assert aggregate.epic.tasks == ["PROJ-2"]
+    assert store.get_task_links("PROJ-2")[0].target == "PROJ-3"
+    assert store.get_external_links("PROJ-2")[0].title == "Spec"
+    assert store.get_labels("PROJ", label="bug")[0].used_in == ["PROJ-2", "PROJ-3"]
+    assert store.get_state("PROJ").last_full_sync is not None
+
+@pytest.mark.asyncio
+async def test_incremental_sync_refetches_only_changed(store):
+    """Test later passes use an updated window and skip unchanged issues"""
+    client = ProjectClient(raw_issue("PROJ-1"), raw_issue("PROJ-2"))
+    worker = make_worker(store, client)
+    await worker.sync_once()
+
+    client.issues[1] = raw_issue("PROJ-2", updated="2024-01-03T10:00:00+03:00", labels=["ui"])
+    client.remote_calls.clear()
+    await worker.sync_once()
+
+    assert "updated >= -" in client.jql[-1]
+    assert client.remote_calls == ["PROJ-2"]
+    assert store.get_labels("PROJ")[0].used_in == ["PROJ-2"]
+
+@pytest.mark.asyncio
+async def test_full_sync_drops_deleted_issues(store):
+    """Test issues missing from a full pass are removed from the mirror"""
+    client = ProjectClient(raw_issue("PROJ-1"), raw_issue("PROJ-2"))
+    worker = make_worker(store, client)
+    await worker.sync_once()
+
+    client.issues.pop()
+    await worker.sync_once(full=True)
+
+    assert store.get_task("PROJ-1") is not None
+    assert store.get_task("PROJ-2") is None
+
+@pytest.mark.asyncio
+async def test_sync_skips_unknown_link_types(store):
+    """Test links of types without a LinkType are skipped, not failing the pass"""
+    clones = {'id': '11', 'type': {'outward': 'clones', 'inward': 'is cloned by'}, 'outwardIssue': {'key': 'PROJ-2'}}
+    blocks = {'id': '12', 'type': {'outward': 'blocks', 'inward': 'is blocked by'}, 'outwardIssue': {'key': 'PROJ-2'}}
+    client = ProjectClient(raw_issue("PROJ-1", issuelinks=[clones, blocks]), raw_issue("PROJ-2"))
+    assert await make_worker(store, client).sync_once() == 2
+
+    assert [link.id for link in store.get_task_links("PROJ-1")] == ["12"]
+
+@pytest.mark.asyncio
+async def test_epic_aggregate_tasks_in_issue_number_order(store):
+    """Test mirrored epic tasks follow JIRA's key order, PROJ-9 before PROJ-10"""
+    client = ProjectClient(
+        raw_issue("PROJ-1", issuetype="Epic", customfield_10604="Epic"),
+        raw_issue("PROJ-10", customfield_10601="PROJ-1"),
+        raw_issue("PROJ-9", customfield_10601="PROJ-1")
+    )
+    await make_worker(store, client).sync_once()
+
+    assert store.get_epic_aggregate("PROJ-1").epic.tasks == ["PROJ-9", "PROJ-10"]
+
+@pytest.mark.asyncio
+async def test_epic_aggregate_only_for_named_epics(store):
+    """Test mirrored tasks and unnamed epics are not returned as epics"""
+    client = ProjectClient(raw_issue("PROJ-1", issuetype="Epic"), raw_issue("PROJ-2"))
+    await make_worker(store, client).sync_once()
+
+    assert store.get_epic_aggregate("PROJ-1") is None
+    assert store.get_epic_aggregate("PROJ-2") is None
+
+@pytest.mark.asyncio
+async def test_full_sync_keeps_issues_it_missed(store):
+    """Test an issue skipped by the scan is confirmed with a key search, not forgotten"""
+    client = ProjectClient(raw_issue("PROJ-1"), raw_issue("PROJ-2"))
+    worker = make_worker(store, client)
+    await worker.sync_once()
+
+    # PROJ-2 shifted out of the scanned pages but still exists in JIRA
+    scanned = client.issues[:1]
+    original = client.search_issues
+
+    async def search_issues(jql, startAt=0, maxResults=50, fields=None, validate_query=True):
+        if jql.startswith("project = "):
+            client.jql.append(jql)
+            return ResultList([Issue(OPTIONS, None, raw=raw) for raw in scanned], startAt, maxResults, 1)
+        return await original(jql, startAt, maxResults, fields, validate_query)
+
+    client.search_issues = search_issues
+    await worker.sync_once(full=True)
+
+    assert client.jql[-2] == "project = PROJ ORDER BY key ASC"
+    assert client.jql[-1] == "key in (PROJ-2)"
+    assert store.get_task("PROJ-2") is not None
+
+@pytest.mark.asyncio
+async def test_sync_renews_lease_per_page(store, monkeypatch):
+    """Test a pass keeps extending its lease and stops once another worker holds it"""
+    monkeypatch.setenv("SEARCH_PAGE_SIZE", "1")
+    client = ProjectClient(raw_issue("PROJ-1"), raw_issue("PROJ-2"))
+    worker = make_worker(store, client)
+    await worker.sync_once()
+    assert store.acquire_lease("PROJ", worker.owner, ttl=0)
+    assert store.acquire_lease("PROJ", "other", ttl=60)
+
+    with pytest.raises(RuntimeError):
+        await worker.sync_once()
+
+def test_lease_allows_single_syncer(store):
+    """Test only one worker process holds the sync lease"""
+    assert store.acquire_lease("PROJ", "a", ttl=60)
+    assert store.acquire_lease("PROJ", "a", ttl=60)
+    assert not store.acquire_lease("PROJ", "b", ttl=60)
+
+@pytest.mark.asyncio
+async def test_mirror_read_mode(monkeypatch):
+    """Test services read from a fresh mirror and fall back when it is stale"""
+    monkeypatch.setenv("READ_MODE", "mirror")
+    monkeypatch.setenv("JIRA_PROJECT", "PROJ")
+    client = ProjectClient(raw_issue("PROJ-1", issuetype="Epic", customfield_10604="Epic"), raw_issue("PROJ-2"))
+    await make_worker(get_mirror_store(), client).sync_once()
+
+    assert (await get_task("PROJ-2")).summary == "Summary PROJ-2"
+    assert (await get_epic("PROJ-1")).name == "Epic"
+    assert LinksService().get_task_links("PROJ-2") == []
+
+    monkeypatch.setenv("MIRROR_MAX_STALENESS", "-1")
+    assert get_read_mirror() is None
@@ -2,8 +2,11 @@ import pytest
 from datetime import datetime
 from unittest.mock import Mock, ANY
 
-from app.services.tasks import TasksService
-from app.schemas.create_task import CreateTaskRequest, TaskPriority
+from app.core.errors import UpstreamThrottledError
+from app.services.tasks import TasksService, create_tasks_bulk
+from app.schemas.create_task import CreateTaskRequest, TaskPriority, TaskReturn
+from app.services.jira import get_task_cache
+from app.core.fields import get_field_resolver
 
 @pytest.fixture
 def mock_jira(mocker):
@@ -80,4 +83,133 @@ def test_create_task_full(mock_jira):
 
     assert result is not None
     assert result["key"] == "PROJ-123"
-    mock_jira.create_issue.assert_called_once()
\ No newline at end of file
+    mock_jira.create_issue.assert_called_once()
+
+def fake_bulk_create(field_list, prefetch=True):
+    """Bulk create result where summaries starting with "bad" fail"""
+    results = []
+    for fields in field_list:
+        if fields['summary'].startswith('bad'):
+            results.append({"status": "Error", "issue": None, "error": {"summary": "invalid"}, "input_fields": fields})
+        else:
+            number = fields['summary'].split()[-1]
+            results.append({"status": "Success", "issue": Mock(key=f"PROJ-{number}", id=number), "error": None, "input_fields": fields})
+    return results
+
+def test_create_tasks_chunk(mock_jira):
+    """Test one bulk request creates the chunk and reports per-item errors"""
+    mock_jira.create_issues.side_effect = fake_bulk_create
+    requests = [
+        CreateTaskRequest(project_key="PROJ", summary="Task 1", epic_link="PROJ-100"),
+        CreateTaskRequest(project_key="PROJ", summary="bad task")
+    ]
+
+    results = TasksService().create_tasks_chunk(requests, offset=10)
+
+    assert [(r.index, r.status, r.key) for r in results] == [(10, "created", "PROJ-1"), (11, "failed", None)]
+    assert results[1].error == {"summary": "invalid"}
+    field_list = mock_jira.create_issues.call_args.kwargs["field_list"]
+    assert field_list[0]["customfield_10601"] == "PROJ-100"
+    assert mock_jira.create_issues.call_args.kwargs["prefetch"] is False
+    mock_jira.issue.assert_not_called()
+
+def test_create_tasks_chunk_request_error(mock_jira):
+    """Test a failed bulk request marks every item of the chunk failed"""
+    mock_jira.create_issues.side_effect = Exception("JIRA down")
+    requests = [CreateTaskRequest(project_key="PROJ", summary=f"Task {i}") for i in range(3)]
+
+    results = TasksService().create_tasks_chunk(requests)
+
+    assert [r.status for r in results] == ["failed"] * 3
+    assert results[0].error == "JIRA down"
+
+def test_create_tasks_chunk_throttled_carries_retry_after(mock_jira):
+    """Test a throttled chunk tells each item when to retry"""
+    mock_jira.create_issues.side_effect = UpstreamThrottledError("JIRA throttled", retry_after=30)
+    requests = [CreateTaskRequest(project_key="PROJ", summary=f"Task {i}") for i in range(2)]
+
+    results = TasksService().create_tasks_chunk(requests)
+
+    assert [(r.status, r.retry_after) for r in results] == [("failed", 30), ("failed", 30)]
+
+def test_create_tasks_chunk_skips_items_without_fields(mock_jira, mocker):
+    """Test an item whose fields cannot be built fails alone, the rest keep their indexes"""
+    def render(request):
+        if request.dor_template == "missing":
+            raise ValueError("DOR template 'missing' not found")
+        return request.description
+
+    mocker.patch('app.services.tasks.render_task_description', side_effect=render)
+    mock_jira.create_issues.side_effect = fake_bulk_create
+    requests = [
+        CreateTaskRequest(project_key="PROJ", summary="Task 1"),
+        CreateTaskRequest(project_key="PROJ", summary="Task 2", dor_template="missing"),
+        CreateTaskRequest(project_key="PROJ", summary="Task 3")
+    ]
+
+    results = TasksService().create_tasks_chunk(requests, offset=5)
+
+    assert [(r.index, r.status, r.key) for r in results] == [
+        (5, "created", "PROJ-1"), (6, "failed", None), (7, "created", "PROJ-3")
+    ]
+    assert results[1].error == "DOR template 'missing' not found"
+    assert len(mock_jira.create_issues.call_args.kwargs["field_list"]) == 2
+
+@pytest.mark.asyncio
+async def test_create_tasks_bulk_chunks(mock_jira):
+    """Test requests are split into chunks and every item gets a result"""
+    mock_jira.create_issues.side_effect = fake_bulk_create
+    requests = [CreateTaskRequest(project_key="PROJ", summary=f"Task {i}") for i in range(25)]
+
+    results = []
+    async for chunk in create_tasks_bulk(TasksService(), requests, chunk_size=10, concurrency=2):
+        results.extend(chunk)
+
+    assert mock_jira.create_issues.call_count == 3
+    assert sorted(r.index for r in results) == list(range(25))
+    assert all(r.status == "created" for r in results)
+
+def test_create_task_minimal_return(mock_jira):
+    """Test minimal mode skips reading the issue back"""
+    result = TasksService().create_task(
+        CreateTaskRequest(project_key="PROJ", summary="Test task"),
+        TaskReturn.MINIMAL
+    )
+
+    assert result == {"id": "10000", "key": "PROJ-123"}
+    assert mock_jira.create_issue.call_args.kwargs["prefetch"] is False
+    mock_jira.issue.assert_not_called()
+
+def test_hydrate_task_fills_cache(mock_jira):
+    """Test background hydration caches the created task"""
+    issue = Mock(key="PROJ-123")
+    issue.fields.summary = "Test task"
+    issue.fields.description = None
+    issue.fields.created = "2024-01-01T10:00:00+03:00"
+    issue.fields.updated = "2024-01-01T10:00:00+03:00"
+    mock_jira.issue.return_value = issue
+
+    TasksService().hydrate_task("PROJ-123")
+
+    assert get_task_cache().get("PROJ-123").value.summary == "Test task"
+
+def test_create_task_uses_resolved_epic_link(mock_jira):
+    """Test Epic Link is written to the field resolved for the instance"""
+    get_field_resolver().update([{"id": "customfield_20001", "name": "Epic Link"}])
+
+    TasksService().create_task(
+        CreateTaskRequest(project_key="PROJ", summary="Test task", epic_link="PROJ-100"),
+        TaskReturn.MINIMAL
+    )
+
+    assert mock_jira.create_issue.call_args.kwargs["fields"]["customfield_20001"] == "PROJ-100"
+
+def test_build_fields_appends_checklists(mock_jira, mocker):
+    """Test DoR/DoD checklists are rendered into the description"""
+    render = mocker.patch('app.services.tasks.render_task_description', return_value="Details\n\n* Ready")
+    request = CreateTaskRequest(project_key="PROJ", summary="Test task", description="Details", dor_template="standard")
+
+    fields = TasksService()._build_fields(request)
+
+    assert fields['description'] == "Details\n\n* Ready"
+    render.assert_called_once_with(request)
@@ -0,0 +1,189 @@
+import os
+import threading
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from app.schemas.checklist import ChecklistType
+from app.schemas.create_task import CreateTaskRequest
+from app.services.templates import CompiledTemplate, TemplateService, TemplateStore, render_task_description
+
+def write_template(path, name, content="* Item"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nname: {name}\ndescription: Test\nversion: '1.0'\n---\n{content}", encoding='utf-8')
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    write_template(tmp_path / "dor" / "standard.md", "Standard")
+    write_template(tmp_path / "dor" / "feature.md", "Feature")
+    write_template(tmp_path / "dod" / "standard.md", "Done")
+    return tmp_path
+
+@pytest.fixture
+def store(templates_dir):
+    store = TemplateStore(templates_dir, watch_mode="off")
+    yield store
+    store.close()
+
+def test_templates_are_parsed_on_first_access(store):
+    """Test nothing is read up front and a single get parses a single file"""
+    assert store.stats()["parsed"] == 0
+
+    assert store.get(ChecklistType.DOR, "feature").name == "Feature"
+    assert store.stats()["parsed"] == 1
+    assert store.get(ChecklistType.DOR, "missing") is None
+
+    assert {t.key for t in store.list(ChecklistType.DOR)} == {"standard", "feature"}
+    assert store.stats()["parsed"] == 2
+
+def test_only_changed_files_are_parsed_again(store, templates_dir):
+    store.list(ChecklistType.DOR)
+    path = templates_dir / "dor" / "feature.md"
+    write_template(path, "Feature v2", content="* Item\n* More")
+    write_template(templates_dir / "dor" / "new.md", "New")
+    store.invalidate(path)
+    store.invalidate(templates_dir / "dor" / "new.md")
+    # Marked, but unchanged on disk
+    store.invalidate(templates_dir / "dor" / "standard.md")
+
+    assert store.get(ChecklistType.DOR, "feature").name == "Feature v2"
+    assert {t.key for t in store.list(ChecklistType.DOR)} == {"standard", "feature", "new"}
+    assert store.stats()["parsed"] == 4
+
+def test_removed_files_drop_out(store, templates_dir):
+    store.list(ChecklistType.DOR)
+    os.remove(templates_dir / "dor" / "feature.md")
+    store.invalidate(templates_dir / "dor")
+
+    assert [t.key for t in store.list(ChecklistType.DOR)] == ["standard"]
+    assert store.get(ChecklistType.DOR, "feature") is None
+
+def test_watcher_picks_up_external_edits(templates_dir):
+    store = TemplateStore(templates_dir, watch_mode="poll", poll_interval=3600)
+    try:
+        assert store.get(ChecklistType.DOD, "standard").name == "Done"
+        write_template(templates_dir / "dod" / "standard.md", "Done, edited")
+        store._watcher.poll()
+
+        assert store.get(ChecklistType.DOD, "standard").name == "Done, edited"
+        assert store.stats()["watcher"] == "poll"
+    finally:
+        store.close()
+
+def test_compiled_template_fills_placeholders():
+    compiled = CompiledTemplate("* Epic: {{epic}}\n* Owner: {{ assignee }} ({{labels}}), due {{due_date}}\n* {{unknown}} {json}")
+
+    assert compiled.slots == ("epic", "assignee", "labels", "due_date")
+    assert compiled.render({"epic": "PROJ-1", "assignee": "jdoe", "labels": "a, b", "due_date": "2024-12-31"}) == (
+        "* Epic: PROJ-1\n* Owner: jdoe (a, b), due 2024-12-31\n* {{unknown}} {json}"
+    )
+    assert compiled.render({}) == "* Epic: \n* Owner:  (), due \n* {{unknown}} {json}"
+
+def test_compiled_form_is_reused_until_the_file_changes(store, templates_dir):
+    first = store.compiled(ChecklistType.DOR, "feature")
+    assert store.compiled(ChecklistType.DOR, "feature") is first
+
+    path = templates_dir / "dor" / "feature.md"
+    write_template(path, "Feature", content="* Epic {{epic}}")
+    store.reload(ChecklistType.DOR, "feature")
+
+    second = store.compiled(ChecklistType.DOR, "feature")
+    assert second is not first
+    assert second.render({"epic": "PROJ-1"}) == "* Epic PROJ-1"
+    assert store.stats()["compiled"] == 2
+    assert store.compiled(ChecklistType.DOR, "missing") is None
+
+def test_task_description_with_checklists(store, templates_dir, monkeypatch):
+    write_template(templates_dir / "dod" / "release.md", "Release", content="* Released by {{assignee}} before {{due_date}}")
+    monkeypatch.setattr('app.services.templates.get_template_service', lambda: Mock(store=store))
+    request = CreateTaskRequest(
+        project_key="PROJ", summary="Task", description="Details", assignee="jdoe",
+        due_date=datetime(2024, 12, 31), dor_template="standard", dod_template="release"
+    )
+
+    assert render_task_description(request) == "Details\n\n* Item\n\n* Released by jdoe before 2024-12-31"
+
+    with pytest.raises(ValueError, match="DOR template 'missing' not found"):
+        render_task_description(request.model_copy(update={"dor_template": "missing"}))
+
+@pytest.fixture
+def service_factory(templates_dir, tmp_path_factory, monkeypatch):
+    """Services sharing template and history directories, like app workers"""
+    monkeypatch.setenv("TEMPLATE_WATCH", "off")
+    history_dir = tmp_path_factory.mktemp("history")
+    services = []
+
+    def create():
+        services.append(TemplateService(str(templates_dir), str(history_dir)))
+        return services[-1]
+
+    yield create
+    for service in services:
+        service.store.close()
+
+def test_writes_are_recorded_with_diffs(service_factory, templates_dir):
+    service = service_factory()
+    service.create_template(ChecklistType.DOD, "release", "Release", "Test", "* Tagged")
+    service.update_template(ChecklistType.DOD, "release", "Release", "Test", "* Tagged\n* Deployed", "1.1")
+    service.delete_template(ChecklistType.DOD, "release")
+
+    revisions = service.get_history(ChecklistType.DOD, "release")
+    assert [(r.revision, r.action, r.version) for r in revisions] == [(1, "create", "1.0"), (2, "update", "1.1"), (3, "delete", None)]
+    assert "+* Deployed" in revisions[1].diff and "+version: '1.1'" in revisions[1].diff
+    assert "-* Deployed" in revisions[2].diff
+    assert not list(templates_dir.glob("dod/.*"))
+
+def test_concurrent_updates_do_not_interleave(service_factory, templates_dir):
+    services = [service_factory(), service_factory()]
+    threads = [
+        threading.Thread(target=services[index % 2].update_template, args=(
+            ChecklistType.DOR, "standard", f"Writer {index}", "Test", f"* Item {index}"
+        ))
+        for index in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    revisions = services[0].get_history(ChecklistType.DOR, "standard")
+    assert [r.revision for r in revisions] == list(range(1, 11))
+    # Every diff starts from the file the previous write left
+    for previous, current in zip(revisions, revisions[1:]):
+        assert f"-name: {previous.name}" in current.diff
+    assert services[1].get_template(ChecklistType.DOR, "standard").name == revisions[-1].name
+
+def test_writes_reach_other_workers(service_factory):
+    """Test a write through one worker invalidates what another worker parsed, without a watcher"""
+    writer, reader = service_factory(), service_factory()
+    assert reader.get_template(ChecklistType.DOR, "feature").name == "Feature"
+    assert len(reader.get_templates(ChecklistType.DOR)) == 2
+
+    writer.update_template(ChecklistType.DOR, "feature", "Feature v2", "Test", "* Item")
+    writer.create_template(ChecklistType.DOR, "spike", "Spike", "Test", "* Timebox")
+
+    assert reader.get_template(ChecklistType.DOR, "feature").name == "Feature v2"
+    assert {t.key for t in reader.get_templates(ChecklistType.DOR)} == {"standard", "feature", "spike"}
+
+def test_search_matches_word_prefixes_in_metadata_and_content(store, templates_dir):
+    write_template(templates_dir / "dor" / "backend.md", "Backend API", content="* Contract reviewed")
+    path = templates_dir / "dor" / "mobile.md"
+    path.write_text("---\nname: Mobile\ndescription: App release\nversion: '2.0'\ntags: [ios, android]\n---\n* Store review", encoding='utf-8')
+
+    assert [t.key for t in store.search(ChecklistType.DOR)] == ["backend", "feature", "mobile", "standard"]
+    assert [t.key for t in store.search(ChecklistType.DOR, "andr")] == ["mobile"]
+    assert [t.key for t in store.search(ChecklistType.DOR, "REVIEW")] == ["backend", "mobile"]
+    assert [t.key for t in store.search(ChecklistType.DOR, "review contract")] == ["backend"]
+    assert store.search(ChecklistType.DOR, "release contract") == []
+    assert store.get(ChecklistType.DOR, "mobile").tags == ["ios", "android"]
+
+def test_search_pages_and_follows_changes(store, templates_dir):
+    assert [t.key for t in store.search(ChecklistType.DOR, start=1, limit=1)] == ["standard"]
+
+    write_template(templates_dir / "dor" / "feature.md", "Feature", content="* Flag added")
+    store.invalidate(templates_dir / "dor" / "feature.md")
+    (templates_dir / "dor" / "standard.md").unlink()
+    store.invalidate(templates_dir / "dor" / "standard.md")
+
+    assert [t.key for t in store.search(ChecklistType.DOR, "flag")] == ["feature"]
+    assert [t.key for t in store.search(ChecklistType.DOR, "item")] == []
+    assert [t.key for t in store.search(ChecklistType.DOR)] == ["feature"]